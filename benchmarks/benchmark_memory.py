@@ -0,0 +1,79 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares the memory used by default and compact naming objects
+Requires Python 3 (tracemalloc)
+
+Usage: python benchmarks/benchmark_memory.py [num_tokens] [num_values]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import tracemalloc
+
+from tpDcc.libs.nameit.core import namelib, compact
+
+
+def create_naming_data(num_tokens, num_values):
+    """
+    Returns serialized tokens, rules and templates
+    :param num_tokens: int
+    :param num_values: int
+    :return: tuple(list(dict), list(dict), list(dict))
+    """
+
+    tokens = list()
+    for i in range(num_tokens):
+        token = namelib.Token('token{}'.format(i))
+        token.values = {
+            'key': ['key{}_{}'.format(i, j) for j in range(num_values)],
+            'value': ['value{}_{}'.format(i, j) for j in range(num_values)]}
+        tokens.append(token.data())
+    rules = list()
+    for i in range(num_tokens):
+        rule = namelib.Rule('rule{}'.format(i))
+        rule.expression = '{{token{}}}_{{token{}}}'.format(i, i + 1)
+        rules.append(rule.data())
+    templates = [namelib.Template('template{}'.format(i), '/{{root}}/{}/{{name}}'.format(i)).data()
+                 for i in range(num_tokens)]
+
+    return tokens, rules, templates
+
+
+def measure(classes, naming_data):
+    """
+    Returns the memory allocated to create objects of the given classes from the given data
+    :param classes: tuple(type, type, type)
+    :param naming_data: tuple(list(dict), list(dict), list(dict))
+    :return: int, allocated bytes
+    """
+
+    tracemalloc.start()
+    try:
+        objects = list()
+        for cls, items_data in zip(classes, naming_data):
+            objects.extend(cls.from_data(dict(item_data), skip_check=True) for item_data in items_data)
+        for obj in objects:
+            if isinstance(obj, namelib.BaseToken):
+                # Tokens cache their items the first time they are used
+                obj.solve(None)
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return allocated
+
+
+def run(num_tokens=10000, num_values=10):
+    naming_data = create_naming_data(num_tokens, num_values)
+    print('Naming data: {0} tokens with {1} values, {0} rules and {0} templates'.format(num_tokens, num_values))
+    default_size = measure((namelib.Token, namelib.Rule, namelib.Template), naming_data)
+    compact_size = measure((compact.CompactToken, compact.CompactRule, compact.CompactTemplate), naming_data)
+    for name, size in (('default', default_size), ('compact', compact_size)):
+        print('{:<8} {:.2f} MB'.format(name, size / (1024.0 * 1024.0)))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:3]])
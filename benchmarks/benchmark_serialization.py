@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares naming data serialization using copy.deepcopy with the fields based serialization
+
+Usage: python benchmarks/benchmark_serialization.py [num_tokens] [num_values] [repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import copy
+import shutil
+import timeit
+import tempfile
+
+from tpDcc.libs.nameit.core import namelib, serialization
+
+
+def deepcopy_data(item):
+    """
+    Returns the serialized data of the given item copying its attributes with copy.deepcopy
+    :param item: namelib.Serializable
+    :return: dict
+    """
+
+    ret_val = dict((k, v) for k, v in item.__dict__.items() if k not in item.SKIP_ATTRIBUTES)
+    ret_val = copy.deepcopy(ret_val)
+    ret_val['_Serializable_classname'] = type(item).__name__
+    ret_val['_Serializable_version'] = '1.0'
+
+    return ret_val
+
+
+def create_tokens(num_tokens, num_values):
+    """
+    Returns the given number of tokens with the given number of values each
+    :param num_tokens: int
+    :param num_values: int
+    :return: list(namelib.Token)
+    """
+
+    tokens = list()
+    for i in range(num_tokens):
+        token = namelib.Token('token{}'.format(i))
+        token.description = 'Token {}'.format(i)
+        token.values = {
+            'key': ['key{}_{}'.format(i, j) for j in range(num_values)],
+            'value': ['value{}_{}'.format(i, j) for j in range(num_values)]}
+        tokens.append(token)
+
+    return tokens
+
+
+def run(num_tokens=10000, num_values=10, repeat=3):
+    tokens = create_tokens(num_tokens, num_values)
+    print('Naming data: {} tokens, {} values per token'.format(num_tokens, num_values))
+    assert [deepcopy_data(token) for token in tokens] == [token.data() for token in tokens]
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(temp_dir, 'naming.json')
+        serializer = serialization.get_serializer('json')
+        for name, data_fn in (('deepcopy', deepcopy_data), ('fields', lambda token: token.data())):
+            data_time = min(timeit.repeat(lambda: [data_fn(token) for token in tokens], number=1, repeat=repeat))
+            save_time = min(timeit.repeat(
+                lambda: serializer.write_file({'tokens': [data_fn(token) for token in tokens]}, file_path),
+                number=1, repeat=repeat))
+            print('{:<8} data: {:.3f}s  save ({}): {:.3f}s'.format(name, data_time, serializer.backend, save_time))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares the peak memory used when loading a large naming file with and without streaming
+Requires Python 3 (tracemalloc)
+
+Usage: python benchmarks/benchmark_stream_load.py [num_tokens] [num_values] [format]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import shutil
+import logging
+import tempfile
+import tracemalloc
+
+from tpDcc.libs.nameit.core import namelib, serialization
+
+from benchmark_yaml_backends import create_naming_data
+
+
+def measure(naming_file, parser_format, stream_load):
+    """
+    Returns the peak memory allocated while loading the given naming file
+    :param naming_file: str
+    :param parser_format: str
+    :param stream_load: bool
+    :return: int, allocated bytes
+    """
+
+    namelib.NameLib._rules[:] = list()
+    namelib.NameLib._tokens[:] = list()
+    tracemalloc.start()
+    try:
+        namelib.NameLib(
+            parser_format=parser_format, naming_file=naming_file, snapshot_cache=False, stream_load=stream_load)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def run(num_tokens=5000, num_values=20, parser_format='json'):
+    logging.getLogger('tpDcc-libs-nameit').setLevel(logging.WARNING)
+    temp_dir = tempfile.mkdtemp()
+    try:
+        naming_file = os.path.join(temp_dir, 'naming.{}'.format(parser_format))
+        serialization.get_serializer(parser_format).write_file(
+            create_naming_data(num_tokens, num_values), naming_file)
+        print('Naming file: {} tokens, {} values per token, {:.2f} MB ({})'.format(
+            num_tokens, num_values, os.path.getsize(naming_file) / (1024.0 * 1024.0), parser_format))
+        for name, stream_load in (('full', False), ('stream', True)):
+            peak = measure(naming_file, parser_format, stream_load)
+            print('{:<8} peak: {:.2f} MB'.format(name, peak / (1024.0 * 1024.0)))
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:4]
+    run(*[int(arg) for arg in args[:2]] + args[2:])
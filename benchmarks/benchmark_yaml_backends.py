@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark that compares pure Python and LibYAML backends when loading and dumping a large naming file
+
+Usage: python benchmarks/benchmark_yaml_backends.py [num_tokens] [num_values] [repeat]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import timeit
+
+import yaml
+
+from tpDcc.libs.nameit.core import serialization
+
+
+def create_naming_data(num_tokens, num_values):
+    """
+    Returns naming data with the given number of tokens and values per token
+    :param num_tokens: int
+    :param num_values: int
+    :return: dict
+    """
+
+    tokens = list()
+    for i in range(num_tokens):
+        keys = ['key{}_{}'.format(i, j) for j in range(num_values)]
+        values = ['value{}_{}'.format(i, j) for j in range(num_values)]
+        tokens.append({
+            '_Serializable_classname': 'Token', '_Serializable_version': '1.0', 'name': 'token{}'.format(i),
+            'default': 1, 'description': 'Token {}'.format(i), 'override_value': '',
+            'values': {'key': keys, 'value': values}})
+    rules = list()
+    for i in range(num_tokens // 10):
+        rules.append({
+            '_Serializable_classname': 'Rule', '_Serializable_version': '1.0', 'name': 'rule{}'.format(i),
+            'expression': '{{token{}}}_{{token{}}}'.format(i, i + 1), 'description': '', 'iterator_format': '@',
+            'auto_fix': False})
+
+    return {'rules': rules, 'tokens': tokens, 'templates': list(), 'template_tokens': list()}
+
+
+def run(num_tokens=2000, num_values=20, repeat=3):
+    data = create_naming_data(num_tokens, num_values)
+    text = yaml.dump(data, Dumper=yaml.SafeDumper)
+    print('Naming data: {} tokens, {} values per token, {:.2f} MB'.format(
+        num_tokens, num_values, len(text) / (1024.0 * 1024.0)))
+    print('Active backend: {}'.format(serialization.get_yaml_backend()))
+
+    backends = [('python', yaml.SafeLoader, yaml.SafeDumper)]
+    if hasattr(yaml, 'CSafeLoader'):
+        backends.append(('libyaml', yaml.CSafeLoader, yaml.CSafeDumper))
+    else:
+        print('LibYAML is not available, only pure Python backend is measured')
+
+    for name, loader, dumper in backends:
+        load_time = min(timeit.repeat(lambda: yaml.load(text, Loader=loader), number=1, repeat=repeat))
+        dump_time = min(timeit.repeat(lambda: yaml.dump(data, Dumper=dumper), number=1, repeat=repeat))
+        print('{:<8} load: {:.3f}s  dump: {:.3f}s'.format(name, load_time, dump_time))
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:4]])
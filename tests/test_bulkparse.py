@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests to parse lots of paths with tpDcc-libs-nameit templates using multiple processes
+Expected values are the ones returned by parsing paths in current process
+"""
+
+import os
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.core import namelib
+
+PATHS = [
+    '/projects/p1/shots/sh010/anim',
+    '/projects/p1',
+    '/other/path',
+    '/projects/p2/shots/sh020/light/file.ma',
+    '',
+    '/projects/p3/assets',
+    '/projects'
+]
+
+
+class ParsePathsTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._lib = namelib.NameLib(naming_file=os.path.join(self._temp_dir, 'naming.yaml'))
+        self._lib.load_session()
+        # Template references cannot be resolved, so the template cannot be indexed
+        self._lib.add_template('broken', '/projects/{@missing}')
+        self._lib.add_template('shot', '/projects/{project}/shots/{shot}/{task}')
+        self._lib.add_template('project', '/projects/{project}')
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_parse_paths(self):
+        # Worker processes replace templates that cannot be indexed with an always failing template
+        assert self._lib.get_template_index().snapshot()[0][:2] == ('broken', None)
+        paths = PATHS * 5
+        expected = list(self._lib.parse_paths(paths, processes=1))
+        assert expected[:4] == [
+            ('shot', {'project': 'p1', 'shot': 'sh010', 'task': 'anim'}), ('project', {'project': 'p1'}), None,
+            ('shot', {'project': 'p2', 'shot': 'sh020', 'task': 'light'})]
+
+        for chunk_size in (1, 3, 100):
+            results = list(self._lib.parse_paths(iter(paths), processes=2, chunk_size=chunk_size))
+            assert results == expected, chunk_size
+
+    def test_stop_early(self):
+        results = self._lib.parse_paths(PATHS * 5, processes=2, chunk_size=2)
+        assert next(results) == ('shot', {'project': 'p1', 'shot': 'sh010', 'task': 'anim'})
+        results.close()
+        assert list(self._lib.parse_paths(PATHS, processes=2, chunk_size=2))[1] == ('project', {'project': 'p1'})
@@ -0,0 +1,178 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-libs-nameit memory compact naming classes
+"""
+
+import os
+import shutil
+import logging
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.core import namelib, compact, serialization
+
+
+class RecordsHandler(logging.Handler):
+    """
+    Logging handler that stores the messages of the records it handles
+    """
+
+    def __init__(self):
+        super(RecordsHandler, self).__init__()
+        self.messages = list()
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def create_naming_lib(lib_class, temp_dir):
+    """
+    Returns a naming library of the given class with a rule and some tokens
+    :param lib_class: type
+    :param temp_dir: str, directory where the naming file is stored
+    :return: NameLib
+    """
+
+    lib = lib_class(naming_file=os.path.join(temp_dir, 'naming.yaml'))
+    lib.load_session()
+    lib.add_rule('default').expression = '{description}_{side}_{type}'
+    lib.add_token('description')
+    side = lib.add_token('side', default=2)
+    side.values = {'key': ['left', 'right'], 'value': ['l', 'r']}
+    token_type = lib.add_token('type', default=2)
+    token_type.values = {'key': ['joint', 'control'], 'value': ['jnt', 'ctrl']}
+    lib.add_template('project', '/projects/{project}')
+    lib.add_template_token('project', 'Project name')
+
+    return lib
+
+
+class CompactObjectsTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_round_trip(self):
+        token = compact.CompactToken('side')
+        token.values = {'key': ['left', 'right'], 'value': ['l', 'r']}
+        token.description = u'Side é'
+        rule = compact.CompactRule('default')
+        rule.expression = '{side}'
+        template = compact.CompactTemplate('project', '/projects/{project}')
+        template_token = compact.CompactTemplateToken('project', 'Project name')
+        file_path = os.path.join(self._temp_dir, 'item')
+        for item, default_class in (
+                (token, namelib.Token), (rule, namelib.Rule), (template, namelib.Template),
+                (template_token, namelib.TemplateToken)):
+            assert not hasattr(item, '__dict__')
+            data = item.data()
+            assert data == default_class.from_data(item.data()).data()
+            for format_name in ('yaml', 'json'):
+                serializer = serialization.get_serializer(format_name)
+                serializer.write_file(data, file_path)
+                loaded = type(item).from_data(serializer.read_file(file_path))
+                assert loaded.data() == data, format_name
+                assert loaded.version == 0
+
+        assert token._keys == ('left', 'right') and token._values == ('l', 'r')
+        assert token._values_view is None
+
+    def test_dropped_fields(self):
+        data = namelib.Token('side').data()
+        data['extra'] = 'value'
+        handler = RecordsHandler()
+        logger = logging.getLogger('tpDcc-libs-nameit')
+        logger.addHandler(handler)
+        try:
+            token = compact.CompactToken.from_data(data)
+        finally:
+            logger.removeHandler(handler)
+        assert handler.messages == ['Field "extra" is not supported by CompactToken and will be ignored']
+        assert 'extra' not in token.data()
+        assert token.name == 'side'
+
+    def test_setattr(self):
+        token = compact.CompactToken('side')
+        version = token.version
+        token.default = 1
+        assert token.version > version
+
+        # Private attributes are runtime caches, not data changes
+        version = token.version
+        token._items = None
+        assert token.version == version
+
+        renames = namelib.NameIndex._renames
+        token.name = 'side'
+        assert namelib.NameIndex._renames == renames
+        token.name = 'position'
+        assert namelib.NameIndex._renames > renames
+
+        try:
+            token.extra = 'value'
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError('Compact token stored an undeclared attribute')
+
+    def test_values_in_place(self):
+        token = compact.CompactToken('side')
+        token.values = {'key': ['left', 'right'], 'value': ['l', 'r']}
+        rule = compact.CompactRule('default')
+        assert token.solve(rule, 'right') == 'r'
+        version = token.version
+        token.values['value'][1] = 'R'
+        assert token.version > version
+        assert token.solve(rule, 'right') == 'R'
+        assert token._values == ('l', 'R')
+
+        token.add_token_value()
+        token.set_token_key(2, 'center')
+        token.set_token_value(2, 'c')
+        assert token.solve(rule, 'center') == 'c'
+        assert token.data()['values'] == {'key': ['left', 'right', 'center'], 'value': ['l', 'R', 'c']}
+
+
+class CompactNameLibTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dirs = [tempfile.mkdtemp() for _ in range(2)]
+
+    def tearDown(self):
+        for temp_dir in self._temp_dirs:
+            shutil.rmtree(temp_dir)
+
+    def test_instances_do_not_share_objects(self):
+        lib_a = create_naming_lib(compact.CompactNameLib, self._temp_dirs[0])
+        lib_b = compact.CompactNameLib(naming_file=os.path.join(self._temp_dirs[1], 'naming.yaml'))
+        lib_b.load_session()
+        lib_b.add_token('other')
+        assert [token.name for token in lib_a.tokens] == ['description', 'side', 'type']
+        assert [token.name for token in lib_b.tokens] == ['other']
+        assert lib_b.get_token('side') is None
+        assert not lib_b.rules
+
+    def test_naming_file(self):
+        lib = create_naming_lib(compact.CompactNameLib, self._temp_dirs[0])
+        lib.set_active_rule('default')
+        assert lib.solve('arm') == 'arm_r_ctrl'
+        lib.save_session()
+
+        # Default and compact naming libraries read the same naming files
+        default_lib = namelib.NameLib(naming_file=lib.naming_file)
+        default_lib.set_active_rule('default')
+        assert default_lib.solve('arm', side='left') == 'arm_l_ctrl'
+        assert [token.data() for token in default_lib.tokens] == [token.data() for token in lib.tokens]
+
+        lib.load_session()
+        assert not lib.is_dirty()
+        assert all(isinstance(token, compact.CompactToken) for token in lib.tokens)
+        lib.set_active_rule('default')
+        assert dict(lib.parse('arm_l_jnt')) == {'description': 'arm', 'side': 'l', 'type': 'jnt'}
+        assert lib.get_template('project').parse('/projects/p1') == {'project': 'p1'}
@@ -0,0 +1,129 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests to classify the files of directory trees with tpDcc-libs-nameit templates
+Expected values are the ones returned by walking the tree sequentially and parsing each path with lucidity
+"""
+
+import os
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.externals import lucidity
+from tpDcc.libs.nameit.core import namelib, crawler
+
+FILES = [
+    'projects/p1/shots/sh010/anim/main.ma',
+    'projects/p1/shots/sh010/anim/notes.txt',
+    'projects/p1/assets/char/hero/model.ma',
+    'projects/p2/shots/sh020/light/light.ma',
+    'other/deep/tree/scene.ma',
+    'readme.txt'
+]
+
+
+class CrawlTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._root = os.path.join(os.path.realpath(self._temp_dir), 'root')
+        for file_path in FILES:
+            file_path = os.path.join(self._root, *file_path.split('/'))
+            if not os.path.isdir(os.path.dirname(file_path)):
+                os.makedirs(os.path.dirname(file_path))
+            open(file_path, 'w').close()
+        os.makedirs(os.path.join(self._root, 'projects', 'p2', 'assets'))
+
+        root = self._root.replace('\\', '/')
+        self._lib = namelib.NameLib(naming_file=os.path.join(self._temp_dir, 'naming.yaml'))
+        self._lib.load_session()
+        self._lib.add_template('shot_file', root + '/projects/{project}/shots/{shot}/{task}/{file}.ma')
+        self._lib.add_template('asset', root + '/projects/{project}/assets/{asset_type}/{asset}')
+        self._lib.add_template('project', root + '/projects/{project}')
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def _walk(self, include_directories=True):
+        """
+        Returns the results of classifying all the paths of the tree one by one
+        """
+
+        templates = self._lib.get_template_index().templates
+        results = list()
+        for directory, directory_names, file_names in os.walk(self._root):
+            names = (directory_names + file_names) if include_directories else file_names
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    data, template = lucidity.parse(path.replace('\\', '/'), templates)
+                except lucidity.ParseError:
+                    continue
+                results.append((path, template.name, data))
+
+        return sorted(results)
+
+    def test_crawl(self):
+        for include_directories in (True, False):
+            expected = self._walk(include_directories=include_directories)
+            assert expected
+            for max_workers in (1, 4):
+                results = self._lib.crawl(
+                    self._root, max_workers=max_workers, include_directories=include_directories)
+                assert sorted(results) == expected, (include_directories, max_workers)
+
+        assert (os.path.join(self._root, 'projects', 'p1', 'shots', 'sh010', 'anim', 'main.ma'), 'shot_file', {
+            'project': 'p1', 'shot': 'sh010', 'task': 'anim', 'file': 'main'}) in expected
+
+    def test_prune(self):
+        scan_directory = crawler._scan_directory
+        scanned = list()
+
+        def _scan_directory(directory, follow_symlinks=False):
+            scanned.append(directory)
+            return scan_directory(directory, follow_symlinks=follow_symlinks)
+
+        crawler._scan_directory = _scan_directory
+        try:
+            assert sorted(self._lib.crawl(self._root, prune=False)) == self._walk()
+            assert os.path.join(self._root, 'other', 'deep') in scanned
+            del scanned[:]
+            assert sorted(self._lib.crawl(self._root)) == self._walk()
+        finally:
+            crawler._scan_directory = scan_directory
+
+        # Directories that no template can match are not walked
+        assert os.path.join(self._root, 'projects') in scanned
+        assert os.path.join(self._root, 'other') not in scanned
+
+    def test_stop_early(self):
+        results = self._lib.crawl([self._root], max_workers=2)
+        path, template_name, data = next(results)
+        assert template_name in ('shot_file', 'asset', 'project')
+        results.close()
+        try:
+            next(results)
+        except StopIteration:
+            pass
+        else:
+            raise AssertionError('Closed crawl generator returned more results')
+
+        assert sorted(self._lib.crawl([self._root], max_workers=2)) == self._walk()
+
+    def test_symlink_loop(self):
+        if not hasattr(os, 'symlink'):
+            return
+        link_path = os.path.join(self._root, 'projects', 'p1', 'shots', 'sh010', 'anim', 'loop')
+        try:
+            os.symlink(os.path.join(self._root, 'projects'), link_path)
+        except (OSError, NotImplementedError):
+            return
+
+        expected = sorted(self._lib.crawl(self._root))
+        assert link_path in [path for path, _, _ in expected]
+        results = sorted(self._lib.crawl(self._root, follow_symlinks=True))
+        assert results == expected
+        assert len(set(path for path, _, _ in results)) == len(results)
@@ -0,0 +1,88 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-libs-nameit directory repository writer
+"""
+
+import os
+import sys
+import stat
+import time
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.core import serialization, repowriter
+
+
+class RepoWriterTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._repo = tempfile.mkdtemp()
+        self._serializer = serialization.get_serializer('json')
+        self._files = {
+            os.path.join(self._repo, 'a.token'): {'name': 'a', 'default': 1},
+            os.path.join(self._repo, 'b.token'): {'name': 'b', 'default': 2}
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self._repo)
+
+    def test_write_only_changed_files(self):
+        for max_workers in (None, 1):
+            writer = repowriter.RepoWriter(max_workers=max_workers)
+            written_files = writer.write(self._files, self._serializer)
+            if max_workers is None:
+                assert sorted(written_files) == sorted(self._files)
+            assert writer.write(self._files, self._serializer) == list()
+
+        file_path = os.path.join(self._repo, 'b.token')
+        assert self._serializer.read_file(file_path) == {'name': 'b', 'default': 2}
+
+        self._files[file_path] = {'name': 'b', 'default': 3}
+        assert writer.write(self._files, self._serializer) == [file_path]
+        assert self._serializer.read_file(file_path) == {'name': 'b', 'default': 3}
+
+    def test_write_modified_files(self):
+        writer = repowriter.RepoWriter()
+        writer.write(self._files, self._serializer)
+
+        # Files changed by other processes are written again
+        file_path = os.path.join(self._repo, 'a.token')
+        with open(file_path, 'w') as fh:
+            fh.write('{}')
+        file_time = time.time() + 5
+        os.utime(file_path, (file_time, file_time))
+        assert writer.write(self._files, self._serializer) == [file_path]
+
+        os.remove(file_path)
+        assert writer.write(self._files, self._serializer) == [file_path]
+        assert not [file_name for file_name in os.listdir(self._repo) if file_name.endswith('.tmp')]
+
+    def test_remove(self):
+        writer = repowriter.RepoWriter()
+        writer.write(self._files, self._serializer)
+        file_path = os.path.join(self._repo, 'a.token')
+
+        assert writer.remove([file_path, os.path.join(self._repo, 'missing.token')]) == [file_path]
+        assert os.listdir(self._repo) == ['b.token']
+        assert writer.write(self._files, self._serializer) == [file_path]
+
+    def test_file_mode(self):
+        if sys.platform.startswith('win'):
+            return
+        writer = repowriter.RepoWriter()
+        writer.write(self._files, self._serializer)
+        umask = os.umask(0)
+        os.umask(umask)
+        for file_path in self._files:
+            assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o666 & ~umask
+
+        # Permissions of existing files are kept
+        file_path = os.path.join(self._repo, 'a.token')
+        os.chmod(file_path, 0o640)
+        self._files[file_path] = {'name': 'a', 'default': 3}
+        assert writer.write(self._files, self._serializer) == [file_path]
+        assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
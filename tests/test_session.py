@@ -0,0 +1,364 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests to load, reload and save tpDcc-libs-nameit sessions
+"""
+
+import os
+import time
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.core import namelib, serialization
+
+
+def add_token(naming_lib, name, keys, values, default=1):
+    """
+    Adds a token with the given keys and values to the given naming library
+    :param naming_lib: NameLib
+    :param name: str
+    :param keys: list(str)
+    :param values: list(str)
+    :param default: int
+    :return: Token
+    """
+
+    token = naming_lib.add_token(name, default=default)
+    token.values = {'key': list(keys), 'value': list(values)}
+
+    return token
+
+
+def touch_file(file_path, offset):
+    """
+    Changes the modification time of the given file, so it is detected as changed even if its size is the same
+    :param file_path: str
+    :param offset: float, seconds added to current time
+    """
+
+    file_time = time.time() + offset
+    os.utime(file_path, (file_time, file_time))
+
+
+class ReloadSessionFileTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._naming_file = os.path.join(self._temp_dir, 'naming.yaml')
+        self._lib = namelib.NameLib(naming_file=self._naming_file)
+        self._lib.load_session()
+        add_token(self._lib, 'side', ['left', 'right'], ['L', 'R'])
+        add_token(self._lib, 'type', ['geo', 'jnt', 'ctrl'], ['geo', 'jnt', 'ctrl'], default=3)
+        self._lib.add_rule('default').expression = '{side}_{type}'
+        self._lib.save_session()
+        self._lib.load_session()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def _edit_naming_file(self, old, new, offset):
+        with open(self._naming_file, 'r') as fh:
+            content = fh.read()
+        with open(self._naming_file, 'w') as fh:
+            fh.write(content.replace(old, new))
+        touch_file(self._naming_file, offset)
+
+    def test_init_reads_once(self):
+        serializer = serialization.get_serializer('yaml')
+        reads = list()
+
+        def _read_file(file_path):
+            reads.append(file_path)
+            return serialization.Serializer.read_file(serializer, file_path)
+
+        serializer.read_file = _read_file
+        try:
+            lib = namelib.NameLib(naming_file=self._naming_file)
+        finally:
+            del serializer.read_file
+        assert reads == [self._naming_file]
+        assert [token.name for token in lib.tokens] == ['side', 'type']
+        assert not lib.is_dirty()
+
+    def test_reload_unchanged(self):
+        side = self._lib.get_token('side')
+        assert not self._lib.reload_session()
+        touch_file(self._naming_file, 5)
+        assert not self._lib.reload_session()
+        assert self._lib.get_token('side') is side
+
+    def test_reload_changed_entries(self):
+        side = self._lib.get_token('side')
+        token_type = self._lib.get_token('type')
+        rule = self._lib.get_rule('default')
+        self._edit_naming_file('default: 3', 'default: 2', 5)
+
+        assert self._lib.reload_session()
+        assert self._lib.get_token('side') is side
+        assert self._lib.get_rule('default') is rule
+        assert self._lib.get_token('type') is not token_type
+        assert self._lib.get_token('type').default == 2
+        assert not self._lib.is_dirty()
+
+    def test_reload_discards_changes(self):
+        side = self._lib.get_token('side')
+        token_type = self._lib.get_token('type')
+        side.default = 2
+        self._lib.add_token('extra')
+        self._lib.remove_rule('default')
+        assert self._lib.is_dirty()
+
+        # Changes are discarded even if the naming file did not change
+        assert self._lib.reload_session()
+        assert self._lib.get_token('side') is not side
+        assert self._lib.get_token('side').default == 1
+        assert self._lib.get_token('type') is token_type
+        assert [token.name for token in self._lib.tokens] == ['side', 'type']
+        assert [rule.name for rule in self._lib.rules] == ['default']
+        assert not self._lib.is_dirty()
+
+        # Changes are discarded when the entry changed in the naming file too
+        token_type.default = 1
+        self._lib.get_token('type').default = 1
+        self._edit_naming_file('default: 3', 'default: 2', 5)
+        assert self._lib.reload_session()
+        assert self._lib.get_token('type').default == 2
+
+    def test_reload_after_save(self):
+        side = self._lib.get_token('side')
+        side.default = 2
+        self._lib.save_session()
+
+        self._edit_naming_file('default: 3', 'default: 2', 5)
+        assert self._lib.reload_session()
+        assert self._lib.get_token('side') is side
+        assert self._lib.get_token('side').default == 2
+        assert self._lib.get_token('type').default == 2
+
+
+class ReloadSessionDirectoryTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._repo = tempfile.mkdtemp()
+        self._lib = namelib.NameLib(parser_format='json')
+        self._lib.load_session(repo=self._repo)
+        add_token(self._lib, 'side', ['left', 'right'], ['L', 'R'])
+        add_token(self._lib, 'type', ['geo', 'jnt', 'ctrl'], ['geo', 'jnt', 'ctrl'], default=3)
+        self._lib.add_rule('default').expression = '{side}_{type}'
+        self._lib.save_session(repo=self._repo)
+        self._lib.load_session(repo=self._repo)
+
+    def tearDown(self):
+        shutil.rmtree(self._repo)
+
+    def test_reload_removed_file(self):
+        side = self._lib.get_token('side')
+        assert not self._lib.reload_session(repo=self._repo)
+        os.remove(os.path.join(self._repo, 'type.token'))
+
+        assert self._lib.reload_session(repo=self._repo)
+        assert [token.name for token in self._lib.tokens] == ['side']
+        assert self._lib.get_token('side') is side
+
+    def test_reload_discards_changes(self):
+        side = self._lib.get_token('side')
+        token_type = self._lib.get_token('type')
+        side.default = 2
+
+        assert self._lib.reload_session(repo=self._repo)
+        assert self._lib.get_token('side') is not side
+        assert self._lib.get_token('side').default == 1
+        assert self._lib.get_token('type') is token_type
+        assert not self._lib.is_dirty()
+
+
+class SaveSessionDirectoryTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._repo = tempfile.mkdtemp()
+        self._lib = namelib.NameLib(parser_format='json')
+        self._lib.load_session(repo=self._repo)
+        add_token(self._lib, 'side', ['left', 'right'], ['L', 'R'])
+        add_token(self._lib, 'type', ['geo', 'jnt', 'ctrl'], ['geo', 'jnt', 'ctrl'], default=3)
+        self._lib.add_rule('default').expression = '{side}_{type}'
+        self._lib.add_template('project', '/projects/{project}')
+        self._lib.add_template_token('project', 'Project name')
+        self._lib.save_session(repo=self._repo)
+
+    def tearDown(self):
+        shutil.rmtree(self._repo)
+
+    def test_load_all_objects(self):
+        assert sorted(os.listdir(self._repo)) == [
+            'default.rule', 'naming.conf', 'project.template', 'project.template_token', 'side.token', 'type.token']
+
+        self._lib.load_session(repo=self._repo)
+        assert sorted(token.name for token in self._lib.tokens) == ['side', 'type']
+        assert [rule.name for rule in self._lib.rules] == ['default']
+        assert [template_token.name for template_token in self._lib.template_tokens] == ['project']
+        assert self._lib.get_template('project').parse('/projects/p1') == {'project': 'p1'}
+
+    def test_remove_files(self):
+        self._lib.load_session(repo=self._repo)
+        other_file = os.path.join(self._repo, 'other.txt')
+        open(other_file, 'w').close()
+
+        self._lib.get_token('side').name = 'position'
+        self._lib.remove_template('project')
+        self._lib.save_session(repo=self._repo)
+        assert sorted(os.listdir(self._repo)) == [
+            'default.rule', 'naming.conf', 'other.txt', 'position.token', 'project.template_token', 'type.token']
+
+        self._lib.load_session(repo=self._repo)
+        assert sorted(token.name for token in self._lib.tokens) == ['position', 'type']
+        assert not self._lib.templates
+
+    def test_reload_templates(self):
+        self._lib.load_session(repo=self._repo)
+        template = self._lib.get_template('project')
+        template.pattern = '/shows/{project}'
+        self._lib.save_session(repo=self._repo)
+
+        assert not self._lib.reload_session(repo=self._repo)
+        os.remove(os.path.join(self._repo, 'project.template_token'))
+        assert self._lib.reload_session(repo=self._repo)
+        assert self._lib.get_template('project') is template
+        assert self._lib.get_template('project').parse('/shows/p1') == {'project': 'p1'}
+        assert not self._lib.template_tokens
+
+
+class LazySessionTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._naming_file = os.path.join(self._temp_dir, 'naming.yaml')
+        self._lib = namelib.NameLib(naming_file=self._naming_file)
+        self._lib.load_session()
+        add_token(self._lib, 'side', ['left', 'right'], ['l', 'r'])
+        add_token(self._lib, 'type', ['geo', 'jnt', 'ctrl'], ['geo', 'jnt', 'ctrl'], default=3)
+        self._lib.add_token('unused')
+        self._lib.add_rule('default').expression = '{side}_{type}'
+        self._lib.save_session()
+        self._lib.lazy_load = True
+        self._lib.load_session()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_parse_loads_rule_tokens(self):
+        self._lib.set_active_rule('default')
+        assert dict(self._lib.parse('r_jnt')) == {'side': 'r', 'type': 'jnt'}
+        assert self._lib.solve() == 'l_ctrl'
+        assert sorted(token.name for token in namelib.NameLib._tokens) == ['side', 'type']
+
+    def test_reload_after_access(self):
+        side = self._lib.get_token('side')
+        token_type = self._lib.get_token('type')
+        with open(self._naming_file, 'r') as fh:
+            content = fh.read()
+        with open(self._naming_file, 'w') as fh:
+            fh.write(content.replace('default: 3', 'default: 2'))
+        touch_file(self._naming_file, 5)
+
+        assert self._lib.reload_session()
+        assert self._lib.get_token('side') is side
+        assert self._lib.get_token('type') is not token_type
+        assert [token.name for token in self._lib.tokens] == ['side', 'type', 'unused']
+
+
+class DirtyStateTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._naming_file = os.path.join(self._temp_dir, 'naming.yaml')
+        self._lib = namelib.NameLib(naming_file=self._naming_file)
+        self._lib.load_session()
+        add_token(self._lib, 'side', ['left', 'right'], ['L', 'R'])
+        add_token(self._lib, 'type', ['geo', 'jnt', 'ctrl'], ['geo', 'jnt', 'ctrl'], default=3)
+        self._lib.add_rule('default').expression = '{side}_{type}'
+        self._saves = list()
+
+    def tearDown(self):
+        self._lib.flush_save()
+        shutil.rmtree(self._temp_dir)
+
+    def _track_saves(self):
+        save_session = self._lib._save_session
+
+        def _save_session(repo=None):
+            self._saves.append(repo)
+            return save_session(repo=repo)
+
+        self._lib._save_session = _save_session
+
+    def test_dirty(self):
+        assert self._lib.is_dirty()
+        assert self._lib.save_session()
+        assert not self._lib.is_dirty()
+        assert not self._lib.save_session()
+
+        side = self._lib.get_token('side')
+        token_type = self._lib.get_token('type')
+        side.default = 2
+        assert self._lib.is_dirty()
+        assert self._lib.save_session()
+
+        # Versions are never repeated, so changing other objects is always detected
+        token_type.description = 'Type'
+        assert token_type.version > side.version
+        assert self._lib.is_dirty()
+        self._lib.save_session()
+
+        self._lib.get_template_index()
+        self._lib.solve('arm')
+        assert not self._lib.is_dirty()
+
+        self._lib.remove_token('type')
+        assert self._lib.is_dirty()
+        self._lib.save_session()
+        self._lib.load_session()
+        assert not self._lib.is_dirty()
+
+    def test_dirty_after_in_place_edits(self):
+        side = self._lib.get_token('side')
+        assert self._lib.save_session()
+        assert not self._lib.save_session()
+
+        side.values['key'].append('center')
+        side.values['value'].append('C')
+        assert self._lib.is_dirty()
+        assert self._lib.save_session()
+        assert not self._lib.is_dirty()
+        with open(self._naming_file, 'r') as fh:
+            assert 'center' in fh.read()
+
+        self._lib.load_session()
+        assert self._lib.get_token('side').values == {'key': ['left', 'right', 'center'], 'value': ['L', 'R', 'C']}
+        assert not self._lib.is_dirty()
+
+    def test_schedule_save(self):
+        self._track_saves()
+        self._lib.save_delay = 0.05
+        for i in range(10):
+            self._lib.add_token('token{}'.format(i))
+            self._lib.schedule_save()
+        time.sleep(0.5)
+        assert len(self._saves) == 1
+        assert not self._lib.is_dirty()
+
+        self._lib.add_token('other')
+        self._lib.schedule_save(delay=60)
+        assert self._lib.flush_save()
+        assert len(self._saves) == 2
+        assert not self._lib.flush_save()
+
+    def test_pending_saves_on_exit(self):
+        self._track_saves()
+        self._lib.schedule_save(delay=60)
+        namelib._flush_pending_saves()
+        assert len(self._saves) == 1
+        assert not self._lib.is_dirty()
+        assert not self._lib.flush_save()
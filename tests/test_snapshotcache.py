@@ -0,0 +1,129 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpDcc-libs-nameit naming file snapshots
+"""
+
+import os
+import sys
+import stat
+import time
+import pickle
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.core import namelib, snapshotcache
+
+LOADED_GLOBALS = list()
+
+
+def load_global():
+    LOADED_GLOBALS.append(True)
+    return 'loaded'
+
+
+class PickledGlobal(object):
+
+    def __reduce__(self):
+        return load_global, ()
+
+
+class SnapshotCacheTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._file_path = os.path.join(self._temp_dir, 'naming.txt')
+        self._write_file('a')
+        self._reads = list()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def _write_file(self, content):
+        with open(self._file_path, 'w') as fh:
+            fh.write(content)
+
+    def _reader(self, file_path):
+        self._reads.append(file_path)
+        with open(file_path, 'r') as fh:
+            return {'content': fh.read(), 'items': [1, 2.5, None, True]}
+
+    def test_read_file(self):
+        data = snapshotcache.read_file(self._file_path, self._reader, key='txt')
+        assert data == {'content': 'a', 'items': [1, 2.5, None, True]}
+        assert os.path.isfile(snapshotcache.get_snapshot_path(self._file_path))
+        assert snapshotcache.read_file(self._file_path, self._reader, key='txt') == data
+        assert len(self._reads) == 1
+
+    def test_invalidation(self):
+        snapshotcache.read_file(self._file_path, self._reader, key='txt')
+
+        # Snapshots are validated with the file contents, not with its modification time
+        file_time = time.time() + 5
+        os.utime(self._file_path, (file_time, file_time))
+        snapshotcache.read_file(self._file_path, self._reader, key='txt')
+        assert len(self._reads) == 1
+
+        self._write_file('b')
+        assert snapshotcache.read_file(self._file_path, self._reader, key='txt')['content'] == 'b'
+        assert len(self._reads) == 2
+
+        snapshotcache.read_file(self._file_path, self._reader, key='other')
+        assert len(self._reads) == 3
+
+        assert snapshotcache.remove_snapshot(self._file_path)
+        snapshotcache.read_file(self._file_path, self._reader, key='other')
+        assert len(self._reads) == 4
+
+    def test_file_mode(self):
+        if sys.platform.startswith('win'):
+            return
+        umask = os.umask(0)
+        os.umask(umask)
+        snapshotcache.read_file(self._file_path, self._reader, key='txt')
+        snapshot_path = snapshotcache.get_snapshot_path(self._file_path)
+        assert stat.S_IMODE(os.stat(snapshot_path).st_mode) == 0o666 & ~umask
+
+    def test_globals_are_rejected(self):
+        snapshot = {
+            'version': snapshotcache.SNAPSHOT_VERSION,
+            'key': 'txt',
+            'hash': snapshotcache.get_file_hash(self._file_path),
+            'data': PickledGlobal()
+        }
+        with open(snapshotcache.get_snapshot_path(self._file_path), 'wb') as fh:
+            pickle.dump(snapshot, fh, snapshotcache.PICKLE_PROTOCOL)
+
+        assert snapshotcache.read_snapshot(self._file_path, key='txt') is None
+        assert snapshotcache.read_file(self._file_path, self._reader, key='txt')['content'] == 'a'
+        assert not LOADED_GLOBALS
+        assert len(self._reads) == 1
+
+
+class NameLibSnapshotTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._naming_file = os.path.join(self._temp_dir, 'naming.yaml')
+        self._lib = namelib.NameLib(naming_file=self._naming_file)
+        self._lib.load_session()
+        side = self._lib.add_token('side', default=1)
+        side.values = {'key': ['left', 'right'], 'value': ['L', 'R']}
+        self._lib.save_session()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_snapshot_cache(self):
+        snapshot_path = snapshotcache.get_snapshot_path(self._naming_file)
+        self._lib.load_session()
+        assert not os.path.exists(snapshot_path)
+
+        self._lib.snapshot_cache = True
+        self._lib.load_session()
+        assert os.path.isfile(snapshot_path)
+        self._lib.load_session()
+        assert [token.name for token in self._lib.tokens] == ['side']
@@ -0,0 +1,243 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests to solve and parse names with tpDcc-libs-nameit rules
+Expected values are the ones returned by the original per call implementation of NameLib.solve and Rule.parse
+"""
+
+import os
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.core import namelib
+
+
+def create_naming_lib(auto_fix=False):
+    """
+    Returns a naming library with a rule that uses required, optional, iterator and rule name tokens
+    :param auto_fix: bool
+    :return: tuple(NameLib, str), naming library and temporary directory where its naming file is stored
+    """
+
+    temp_dir = tempfile.mkdtemp()
+    lib = namelib.NameLib(naming_file=os.path.join(temp_dir, 'naming.yaml'))
+    lib.load_session()
+
+    rule = lib.add_rule('default')
+    rule.expression = '{description}_{side}_{index}_{type}_{rule_name}'
+    rule.auto_fix = auto_fix
+    lib.add_token('description')
+    side = lib.add_token('side', default=1)
+    side.values = {'key': ['left', 'right', 'center'], 'value': ['l', 'r', 'c']}
+    index = lib.add_token('index', default=1)
+    index.values = {'key': ['iterator'], 'value': ['#']}
+    token_type = lib.add_token('type', default=2)
+    token_type.values = {'key': ['joint', 'control'], 'value': ['jnt', 'ctrl']}
+    rule_name = lib.add_token('rule_name', default=1)
+    rule_name.values = {'key': ['a'], 'value': ['b']}
+
+    return lib, temp_dir
+
+
+SOLVE_CASES = [
+    ((), {}),
+    (('arm',), {}),
+    (('arm',), {'side': 'left', 'type': 'joint'}),
+    ((), {'description': 'leg', 'index': 3}),
+    (('x', 'y'), {'side': 'bogus'}),
+    ((), {'index': 'iterator', 'type': 'control', 'rule_name': 'zz'}),
+    (('spine',), {'index': 12, 'side': 'center'})
+]
+
+PARSE_NAMES = [
+    'arm_l_2_ctrl_default', 'arm_x_7_jnt', 'leg', 'a_7_1_ctrl_b_c', 'a_#_#_ctrl_default', 'a_1_x_ctrl_default']
+
+
+class SolvePlanTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._lib, self._temp_dir = create_naming_lib()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_solve(self):
+        expected = [
+            'None_l_a_ctrl_default', 'arm_l_a_ctrl_default', 'arm_l_a_jnt_default', 'leg_l_d_ctrl_default',
+            'x_None_a_ctrl_default', 'None_l_iterator_ctrl_default', 'spine_c_m_ctrl_default']
+        assert [self._lib.solve(*args, **kwargs) for args, kwargs in SOLVE_CASES] == expected
+        # Second call uses the cached plan
+        assert [self._lib.solve(*args, **kwargs) for args, kwargs in SOLVE_CASES] == expected
+
+    def test_solve_auto_fix(self):
+        self._lib.get_rule('default').auto_fix = True
+        expected = [
+            'l_a_ctrl_default', 'arm_l_a_ctrl_default', 'arm_l_a_jnt_default', 'leg_l_d_ctrl_default',
+            'x_a_ctrl_default', 'l_iterator_ctrl_default', 'spine_c_m_ctrl_default']
+        assert [self._lib.solve(*args, **kwargs) for args, kwargs in SOLVE_CASES] == expected
+
+    def test_solve_iterator_format(self):
+        rule = self._lib.get_rule('default')
+        rule.iterator_format = '#'
+        assert [self._lib.solve('arm', index=i) for i in (0, 3, 12)] == [
+            'arm_l_0_ctrl_default', 'arm_l_3_ctrl_default', 'arm_l_12_ctrl_default']
+        rule.iterator_format = '^@'
+        assert [self._lib.solve('arm', index=i) for i in (0, 3)] == ['arm_l_A_ctrl_default', 'arm_l_D_ctrl_default']
+
+    def test_solve_after_edits(self):
+        assert self._lib.solve('arm') == 'arm_l_a_ctrl_default'
+        self._lib.get_token('side').set_token_value(0, 'L')
+        assert self._lib.solve('arm') == 'arm_L_a_ctrl_default'
+        self._lib.get_token('type').default = 1
+        assert self._lib.solve('arm') == 'arm_L_a_jnt_default'
+        self._lib.get_rule('default').expression = '{side}_{description}'
+        assert self._lib.solve('arm') == 'L_arm'
+        self._lib.remove_token('side')
+        assert self._lib.solve('arm') is None
+
+    def test_solve_after_in_place_edits(self):
+        side = self._lib.get_token('side')
+        rule = self._lib.get_rule('default')
+        assert self._lib.solve('arm', side='right') == 'arm_r_a_ctrl_default'
+        assert side.solve(rule, 'right') == 'r'
+        side.values['value'][1] = 'R'
+        assert side.solve(rule, 'right') == 'R'
+        assert self._lib.solve('arm', side='right') == 'arm_R_a_ctrl_default'
+        side.values['key'].append('middle')
+        side.values['value'].append('m')
+        assert self._lib.solve('arm', side='middle') == 'arm_m_a_ctrl_default'
+
+    def test_solve_many(self):
+        assert self._lib.solve_many([{'description': 'a'}, ('b',), (('c',), {'side': 'right'})]) == [
+            'a_l_a_ctrl_default', 'b_l_a_ctrl_default', 'c_r_a_ctrl_default']
+        assert self._lib.solve_many({'description': ['a', 'b'], 'side': ['left', 'right']}) == [
+            'a_l_a_ctrl_default', 'b_r_a_ctrl_default']
+
+    def test_solve_many_strings(self):
+        names = ['arm', 'leg', u'spine']
+        assert self._lib.solve_many(names) == [self._lib.solve(name) for name in names]
+        assert list(self._lib.solve_many(iter(names), stream=True)) == [
+            'arm_l_a_ctrl_default', 'leg_l_a_ctrl_default', 'spine_l_a_ctrl_default']
+
+
+class ParsePlanTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._lib, self._temp_dir = create_naming_lib()
+        self._lib.get_token('side').values = {
+            'key': ['left', 'right', 'num', 'iterator'], 'value': ['l', 'r', '7', '#']}
+        self._lib.get_token('index').values = {'key': ['one', 'iterator', 'seven'], 'value': ['1', '#', '7']}
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_parse_values(self):
+        expected = [
+            {'description': 'arm', 'side': 'l', 'index': '2', 'type': 'ctrl', 'rule_name': None},
+            {'description': 'arm', 'side': None, 'index': '7', 'type': 'jnt', 'rule_name': None},
+            {'description': 'leg', 'side': None, 'index': None, 'type': None, 'rule_name': None},
+            {'description': 'a', 'side': '7', 'index': '1', 'type': 'ctrl', 'rule_name': 'b'},
+            {'description': 'a', 'side': '#', 'index': '#', 'type': 'ctrl', 'rule_name': None},
+            {'description': 'a', 'side': '1', 'index': None, 'type': 'ctrl', 'rule_name': None}
+        ]
+        assert [dict(self._lib.parse(name)) for name in PARSE_NAMES] == expected
+        assert [dict(parsed) for parsed in self._lib.parse_many(PARSE_NAMES)] == expected
+
+    def test_parse_keys(self):
+        expected = [
+            {'description': 'arm', 'side': 'left', 'index': '#', 'type': 'control', 'rule_name': None},
+            {'description': 'arm', 'side': None, 'index': '#', 'type': 'joint', 'rule_name': None},
+            {'description': 'leg', 'side': None, 'index': None, 'type': None, 'rule_name': None},
+            {'description': 'a', 'side': 'num', 'index': 'one', 'type': 'control', 'rule_name': 'a'},
+            {'description': 'a', 'side': 'iterator', 'index': 'iterator', 'type': 'control', 'rule_name': None},
+            {'description': 'a', 'side': '#', 'index': None, 'type': 'control', 'rule_name': None}
+        ]
+        assert [dict(parsed) for parsed in self._lib.parse_many(PARSE_NAMES, get_keys=True)] == expected
+        columns = self._lib.parse_many(PARSE_NAMES, get_keys=True, columnar=True)
+        assert list(columns.keys()) == ['description', 'side', 'index', 'type', 'rule_name']
+        assert columns['side'] == [parsed['side'] for parsed in expected]
+
+    def test_parse_plan_is_cached(self):
+        rule = self._lib.get_rule('default')
+        plan = self._lib.get_parse_plan(rule)
+        assert self._lib.get_parse_plan(rule) is plan
+        self._lib.get_token('side').set_token_value(0, 'L')
+        assert self._lib.get_parse_plan(rule) is not plan
+
+    def test_parse_after_in_place_edits(self):
+        assert dict(self._lib.parse('arm_r_2_ctrl_default'))['side'] == 'r'
+        self._lib.get_token('side').values['value'][1] = 'R'
+        assert dict(self._lib.parse('arm_R_2_ctrl_default'))['side'] == 'R'
+        assert dict(self._lib.parse_many(['arm_R_2_ctrl_default'], get_keys=True)[0])['side'] == 'right'
+        assert dict(self._lib.parse('arm_r_2_ctrl_default'))['side'] is None
+
+
+class RuleMatcherTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._lib, self._temp_dir = create_naming_lib()
+        self._lib.get_token('type').values = {
+            'key': ['joint', 'control', 'ik_control'], 'value': ['jnt', 'ctrl', 'ik_ctrl']}
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_match(self):
+        assert self._lib.match('arm_l_a_ctrl_default') == {
+            'description': 'arm', 'side': 'l', 'index': 'a', 'type': 'ctrl', 'rule_name': 'default'}
+        assert list(self._lib.match('arm_l_a_ctrl_default').keys()) == [
+            'description', 'side', 'index', 'type', 'rule_name']
+
+    def test_match_underscores(self):
+        assert self._lib.match('left_upper_arm_r_b_ik_ctrl_default') == {
+            'description': 'left_upper_arm', 'side': 'r', 'index': 'b', 'type': 'ik_ctrl', 'rule_name': 'default'}
+        name = self._lib.solve('big_arm', side='right', type='ik_control')
+        assert name == 'big_arm_r_a_ik_ctrl_default'
+        assert self._lib.match(name, get_keys=True) == {
+            'description': 'big_arm', 'side': 'right', 'index': '#', 'type': 'ik_control',
+            'rule_name': 'default'}
+
+    def test_match_iterator_format(self):
+        rule = self._lib.get_rule('default')
+        for iterator_format, expected in (('@', 'm'), ('#', '12'), ('###', '012')):
+            rule.iterator_format = iterator_format
+            name = self._lib.solve('arm', index=12)
+            assert name == 'arm_l_{}_ctrl_default'.format(expected)
+            assert self._lib.match(name)['index'] == expected, iterator_format
+            assert self._lib.match(name, get_keys=True)['index'] == '#', iterator_format
+
+        # Iterator values that do not use the iterator format of the rule are not matched
+        assert self._lib.match('arm_l_m_ctrl_default') is None
+        rule.iterator_format = '@'
+        assert self._lib.match('arm_l_12_ctrl_default') is None
+
+    def test_match_keys(self):
+        assert self._lib.match('arm_c_a_jnt_default', get_keys=True) == {
+            'description': 'arm', 'side': 'center', 'index': '#', 'type': 'joint', 'rule_name': 'default'}
+
+    def test_match_rule_name(self):
+        # Rule name token is always matched with the name of the rule, not with its values
+        assert self._lib.match('arm_l_a_ctrl_b') is None
+        self._lib.get_rule('default').name = 'other'
+        self._lib.set_active_rule('other')
+        assert self._lib.match('arm_l_a_ctrl_other')['rule_name'] == 'other'
+        assert self._lib.match('arm_l_a_ctrl_default') is None
+
+    def test_no_match(self):
+        for name in ('arm', 'arm_x_a_ctrl_default', 'arm_l_a_ctrl', 'arm_l_a_ctrl_default_extra', ''):
+            assert self._lib.match(name) is None, name
+
+    def test_matcher_is_cached(self):
+        rule = self._lib.get_rule('default')
+        matcher = self._lib.get_rule_matcher(rule)
+        assert self._lib.get_rule_matcher(rule) is matcher
+        assert matcher.fields == ['description', 'side', 'index', 'type', 'rule_name']
+        assert matcher.match('arm_l_a_ctrl_default', get_keys=True)['side'] == 'left'
+
+        self._lib.get_token('side').values['value'][0] = 'L'
+        assert self._lib.get_rule_matcher(rule) is not matcher
+        assert self._lib.match('arm_L_a_ctrl_default', get_keys=True)['side'] == 'left'
+        assert self._lib.match('arm_l_a_ctrl_default') is None
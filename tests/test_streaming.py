@@ -0,0 +1,179 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests to load tpDcc-libs-nameit naming files incrementally
+"""
+
+import os
+import time
+import shutil
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.core import namelib, serialization, streaming
+
+SECTIONS = ['rules', 'tokens', 'templates', 'template_tokens']
+
+
+def create_naming_data(num_tokens=20):
+    """
+    Returns naming data with the given number of tokens
+    :param num_tokens: int
+    :return: dict
+    """
+
+    return {
+        'active_rule': 'default',
+        'rules': [{
+            '_Serializable_classname': 'Rule', '_Serializable_version': '1.0', 'name': 'default',
+            'expression': '{token0}_{token1}', 'description': '', 'iterator_format': '@', 'auto_fix': True}],
+        'tokens': [{
+            '_Serializable_classname': 'Token', '_Serializable_version': '1.0', 'name': 'token{}'.format(i),
+            'description': u'Token {} é'.format(i), 'default': 1,
+            'values': {'key': ['a', 'b', 'iterator'], 'value': ['x{}'.format(i), 12345678, '#']}}
+            for i in range(num_tokens)],
+        'templates': [{
+            '_Serializable_classname': 'Template', '_Serializable_version': '1.0', 'name': 'project',
+            'pattern': '/projects/{project}'}],
+        'template_tokens': []
+    }
+
+
+def touch_file(file_path, offset):
+    file_time = time.time() + offset
+    os.utime(file_path, (file_time, file_time))
+
+
+class IterNamingDataTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._data = create_naming_data()
+        self._chunk_size = streaming.CHUNK_SIZE
+
+    def tearDown(self):
+        streaming.CHUNK_SIZE = self._chunk_size
+        shutil.rmtree(self._temp_dir)
+
+    def _write(self, format_name, content=None):
+        file_path = os.path.join(self._temp_dir, 'naming.{}'.format(format_name))
+        if content is None:
+            serialization.get_serializer(format_name).write_file(self._data, file_path)
+        else:
+            with open(file_path, 'w') as fh:
+                fh.write(content)
+        return file_path
+
+    def _read(self, file_path, format_name):
+        data = dict()
+        for key, value in streaming.iter_naming_data(file_path, format_name, SECTIONS):
+            if key in SECTIONS:
+                data.setdefault(key, list()).append(value)
+            else:
+                data[key] = value
+        return data
+
+    def test_read(self):
+        for format_name in ('yaml', 'json'):
+            data = self._read(self._write(format_name), format_name)
+            data.setdefault('template_tokens', list())
+            assert data == self._data, format_name
+
+    def test_read_json_chunks(self):
+        file_path = self._write('json')
+        for chunk_size in (1, 3, 7):
+            streaming.CHUNK_SIZE = chunk_size
+            data = self._read(file_path, 'json')
+            data.setdefault('template_tokens', list())
+            assert data == self._data, chunk_size
+
+    def test_read_yaml_aliases(self):
+        file_path = self._write('yaml', 'tokens:\n- &token {name: a, values: [1, 2.5, true, null]}\n- *token\n')
+        assert list(streaming.iter_naming_data(file_path, 'yaml', SECTIONS)) == [
+            ('tokens', {'name': 'a', 'values': [1, 2.5, True, None]}),
+            ('tokens', {'name': 'a', 'values': [1, 2.5, True, None]})]
+
+    def test_read_invalid(self):
+        for format_name, content in (
+                ('json', '{"tokens": [{"name": "a"}, {"name": '), ('json', '["tokens"]'),
+                ('yaml', 'tokens:\n- {name: a}\n- {name: [b\n')):
+            file_path = self._write(format_name, content)
+            try:
+                list(streaming.iter_naming_data(file_path, format_name, SECTIONS))
+            except Exception:
+                continue
+            raise AssertionError('Invalid {} naming file was read: {}'.format(format_name, content))
+
+
+class StreamLoadTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def _create_lib(self, format_name):
+        naming_file = os.path.join(self._temp_dir, 'naming.{}'.format(format_name))
+        serialization.get_serializer(format_name).write_file(create_naming_data(), naming_file)
+        lib = namelib.NameLib(parser_format=format_name, naming_file=naming_file, stream_load=True)
+        return lib, naming_file
+
+    def _write(self, naming_file, content):
+        with open(naming_file, 'w') as fh:
+            fh.write(content)
+        touch_file(naming_file, 5)
+
+    def test_load(self):
+        for format_name in ('yaml', 'json'):
+            lib, naming_file = self._create_lib(format_name)
+            lib.stream_load = False
+            lib.load_session()
+            expected = [[item.data() for item in items] for items in (lib.rules, lib.tokens, lib.templates)]
+
+            lib.stream_load = True
+            assert lib.load_session()
+            assert [[item.data() for item in items] for items in (lib.rules, lib.tokens, lib.templates)] == expected
+            assert lib.get_template('project').parse('/projects/p1') == {'project': 'p1'}
+            assert not lib.is_dirty()
+
+    def test_reload(self):
+        for format_name in ('yaml', 'json'):
+            lib, naming_file = self._create_lib(format_name)
+            lib.load_session()
+            tokens = list(lib.tokens)
+            with open(naming_file, 'r') as fh:
+                content = fh.read()
+
+            self._write(naming_file, content + '\n')
+            assert not lib.reload_session()
+            assert all(token is previous_token for token, previous_token in zip(lib.tokens, tokens))
+
+            self._write(naming_file, content.replace('Token 3 ', 'Changed token '))
+            assert lib.reload_session()
+            assert [token is previous_token for token, previous_token in zip(lib.tokens, tokens)].count(False) == 1
+            assert lib.get_token('token3').description.startswith('Changed token')
+            assert not lib.is_dirty()
+
+    def test_invalid_file_keeps_session(self):
+        for format_name, suffix in (('json', ''), ('yaml', '\n  broken: [value')):
+            lib, naming_file = self._create_lib(format_name)
+            lib.load_session()
+            tokens = list(lib.tokens)
+            with open(naming_file, 'r') as fh:
+                content = fh.read()
+
+            # Truncated file
+            self._write(naming_file, content[:len(content) // 2] + suffix)
+            assert not lib.reload_session()
+            assert lib.tokens == tokens and len(lib.rules) == 1 and len(lib.templates) == 1
+            assert not lib.load_session()
+            assert lib.tokens == tokens
+
+            # File state is not stored, so the file is read again once it is fixed
+            self._write(naming_file, content.replace('Token 3 ', 'Changed token '))
+            assert lib.reload_session()
+            assert lib.get_token('token3').description.startswith('Changed token')
+            assert lib.get_token('token0') is tokens[0]
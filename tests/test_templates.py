@@ -0,0 +1,188 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests to classify paths with tpDcc-libs-nameit templates
+Expected values are the ones returned by parsing paths sequentially with each lucidity template
+"""
+
+import os
+import shutil
+import logging
+import tempfile
+
+from tpDcc.libs.unittests.core import unittestcase
+
+from tpDcc.libs.nameit.externals import lucidity
+from tpDcc.libs.nameit.core import namelib, templateindex
+
+
+class DictResolver(lucidity.Resolver):
+
+    def __init__(self, templates):
+        self._templates = dict((template.name, template) for template in templates)
+
+    def get(self, template_name, default=None):
+        return self._templates.get(template_name, default)
+
+
+class TemplateIndexTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        specs = [
+            ('shot', '/projects/{project}/shots/{shot}/{task}/{file}.ma', lucidity.Template.ANCHOR_BOTH),
+            ('asset_file', '/projects/{project}/assets/{asset_type}/{asset}/{file}.{ext}',
+             lucidity.Template.ANCHOR_BOTH),
+            ('asset', '/projects/{project}/assets/{asset_type}/{asset}', lucidity.Template.ANCHOR_BOTH),
+            ('version', '/projects/{project}/{@version}', lucidity.Template.ANCHOR_START),
+            ('any_ma', '{name}.ma', lucidity.Template.ANCHOR_END),
+            ('numbered', '/renders/{shot}/{frame:\\d+}.exr', lucidity.Template.ANCHOR_BOTH)
+        ]
+        self._templates = [lucidity.Template(name, pattern, anchor=anchor) for name, pattern, anchor in specs]
+        resolver = DictResolver([lucidity.Template('version', 'v{version:\\d+}')])
+        for template in self._templates:
+            template.template_resolver = resolver
+
+    def test_classify(self):
+        expected = [
+            ('/projects/p1/shots/sh010/anim/main.ma',
+             ('shot', {'file': 'main', 'project': 'p1', 'shot': 'sh010', 'task': 'anim'})),
+            ('/projects/p1/assets/char/hero/model.ma',
+             ('asset_file', {'asset': 'hero', 'asset_type': 'char', 'ext': 'ma', 'file': 'model', 'project': 'p1'})),
+            ('/projects/p1/assets/char/hero', ('asset', {'asset': 'hero', 'asset_type': 'char', 'project': 'p1'})),
+            ('/projects/p1/v003', ('version', {'project': 'p1', 'version': '003'})),
+            ('/projects/p1/v003/extra', ('version', {'project': 'p1', 'version': '003'})),
+            ('/other/scene.ma', ('any_ma', {'name': 'scene'})),
+            ('/renders/sh010/0101.exr', ('numbered', {'frame': '0101', 'shot': 'sh010'})),
+            ('/renders/sh010/x.exr', None),
+            ('/projects/p1/assets/char', None),
+            ('scene.mb', None),
+            ('/projects/p1/shots/sh010/anim/main.mb', None)
+        ]
+
+        index = templateindex.TemplateIndex(self._templates)
+        for path, result in expected:
+            classified = index.classify(path)
+            assert (classified[0].name, classified[1]) == result if result else classified is None, path
+
+    def test_snapshot(self):
+        index = templateindex.TemplateIndex.from_snapshot(templateindex.TemplateIndex(self._templates).snapshot())
+        classified = index.classify('/projects/p1/v003')
+        assert (classified[0].name, classified[1]) == ('version', {'project': 'p1', 'version': '003'})
+
+    def test_could_match(self):
+        index = templateindex.TemplateIndex(self._templates[:3] + self._templates[5:])
+        assert index.could_match('/projects/p1/assets')
+        assert index.could_match('/renders/sh010')
+        assert not index.could_match('/other')
+
+
+class RecordsHandler(logging.Handler):
+
+    def __init__(self):
+        super(RecordsHandler, self).__init__()
+        self.messages = list()
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TemplateMatchTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def test_duplicate_placeholders(self):
+        strict = lucidity.Template('strict', '/{a}/{b}/{a}', duplicate_placeholder_mode=lucidity.Template.STRICT)
+        assert strict.try_parse('/x/y/x') == {'a': 'x', 'b': 'y'}
+        assert strict.match('/x/y/x')
+        assert strict.try_parse('/x/y/z') is None
+        assert not strict.match('/x/y/z')
+        try:
+            strict.parse('/x/y/z')
+        except lucidity.ParseError:
+            pass
+        else:
+            raise AssertionError('Duplicate placeholders with different values were parsed in STRICT mode')
+
+        # Relaxed templates keep the value of the last placeholder
+        relaxed = lucidity.Template('relaxed', '/{a}/{b}/{a}')
+        assert relaxed.match('/x/y/z')
+        assert relaxed.try_parse('/x/y/z') == strict.parse('/z/y/z')
+
+    def test_no_match(self):
+        template = lucidity.Template('shot', '/projects/{project}/shots/{shot}', anchor=lucidity.Template.ANCHOR_BOTH)
+        assert template.try_parse('/projects/p1/shots/sh010') == {'project': 'p1', 'shot': 'sh010'}
+        assert template.try_parse('/projects/p1/assets/hero') is None
+        assert not template.match('/projects/p1/shots/sh010/extra')
+
+
+class NameLibTemplatesTests(unittestcase.UnitTestCase(as_class=True), object):
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        self._lib = namelib.NameLib(naming_file=os.path.join(self._temp_dir, 'naming.yaml'))
+        self._lib.load_session()
+        self._lib.add_template('version', 'v{version:\\d+}')
+        self._lib.add_template('shot', '/projects/{project}/shots/{shot}/{task}')
+        self._lib.add_template('shot_version', '/projects/{project}/shots/{shot}/{@version}')
+        self._lib.add_template('project', '/projects/{project}')
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def _classify(self, path):
+        result = self._lib.classify_path(path)
+        return (result[0].name, result[1]) if result else None
+
+    def test_classify_path(self):
+        assert self._classify('/projects/p1/shots/sh010/v002/file.ma') == (
+            'shot', {'project': 'p1', 'shot': 'sh010', 'task': 'v002'})
+        assert self._classify('/projects/p1/shots/sh010') == ('project', {'project': 'p1'})
+        assert self._classify('/projects/p1/x') == ('project', {'project': 'p1'})
+        assert self._classify('v12') == ('version', {'version': '12'})
+        assert self._classify('v12/a') == ('version', {'version': '12'})
+        assert self._classify('/nope') is None
+
+    def test_index_is_cached(self):
+        index = self._lib.get_template_index()
+        assert self._lib.get_template_index() is index
+
+        self._lib.get_template('shot').pattern = '/projects/{project}/shots/{shot}/{@version}'
+        assert self._lib.get_template_index() is not index
+        assert self._classify('/projects/p1/shots/sh010/v002/file.ma') == (
+            'shot', {'project': 'p1', 'shot': 'sh010', 'version': '002'})
+
+        index = self._lib.get_template_index()
+        self._lib.remove_template('shot')
+        assert self._lib.get_template_index() is not index
+        assert self._classify('/projects/p1/shots/sh010/v002/file.ma') == (
+            'shot_version', {'project': 'p1', 'shot': 'sh010', 'version': '002'})
+
+    def test_try_parse(self):
+        template = self._lib.get_template('shot')
+        assert template.try_parse('/projects/p1/shots/sh010/anim') == {
+            'project': 'p1', 'shot': 'sh010', 'task': 'anim'}
+        assert template.match('/projects/p1/shots/sh010/anim')
+        assert template.try_parse('/other') is None
+        assert not template.match('/other')
+
+        # References that cannot be resolved do not raise
+        broken = self._lib.add_template('broken', '/projects/{@missing}')
+        # Templates get the resolver of the naming library when the index is built
+        self._lib.get_template_index()
+        assert broken.try_parse('/projects/p1') is None
+        assert not broken.match('/projects/p1')
+
+    def test_check_template_validity(self):
+        self._lib.add_template('broken', '/projects/{@missing}')
+        handler = RecordsHandler()
+        logger = logging.getLogger('tpDcc-libs-nameit')
+        logger.addHandler(handler)
+        try:
+            assert self._lib.check_template_validity('shot', '/projects/p1/shots/sh010/anim')
+            assert not self._lib.check_template_validity('shot', '/other')
+            assert not self._lib.check_template_validity('broken', '/projects/p1')
+            assert not self._lib.check_template_validity('missing', '/projects/p1')
+            assert not handler.messages
+            assert self._lib.parse_template('shot', '/other') is None
+            assert handler.messages
+        finally:
+            logger.removeHandler(handler)
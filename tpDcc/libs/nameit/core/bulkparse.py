@@ -0,0 +1,115 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to parse lots of paths against templates using multiple processes
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import itertools
+import multiprocessing
+
+from tpDcc.libs.nameit.core import templateindex
+
+# Index used by worker processes, created only once per process by the pool initializer
+_WORKER_INDEX = None
+
+
+def parse_paths(template_index, paths, processes=None, chunk_size=1000):
+    """
+    Classifies given paths against the templates of the given index
+    If more than one process is used, a snapshot of the index is sent only once to each worker process and paths are
+    sent in chunks. Results are returned in the same order as the given paths
+    :param template_index: TemplateIndex
+    :param paths: iterable(str)
+    :param processes: int or None, number of worker processes. If None, the number of CPUs is used. If 1 or 0, paths
+        are parsed in current process
+    :param chunk_size: int, number of paths sent to a worker process at once
+    :return: generator(tuple(str, dict) or None), template name and parsed data of each path or None if a path does
+        not match any template
+    """
+
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+
+    if processes <= 1:
+        return _parse_chunk_with_index(template_index, paths)
+
+    return _parse_paths_in_pool(template_index, paths, processes, chunk_size)
+
+
+def _parse_paths_in_pool(template_index, paths, processes, chunk_size):
+    """
+    Internal generator that parses given paths using a pool of processes
+    :param template_index: TemplateIndex
+    :param paths: iterable(str)
+    :param processes: int
+    :param chunk_size: int
+    :return: generator
+    """
+
+    pool = multiprocessing.Pool(
+        processes, initializer=_init_worker, initargs=(template_index.snapshot(),))
+    completed = False
+    try:
+        for results in pool.imap(_parse_chunk, _chunks(paths, chunk_size)):
+            for result in results:
+                yield result
+        completed = True
+    finally:
+        # If results were not consumed completely, pending chunks are discarded
+        if completed:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
+
+
+def _chunks(paths, chunk_size):
+    """
+    Internal generator that splits given paths in lists of the given size
+    :param paths: iterable(str)
+    :param chunk_size: int
+    :return: generator(list(str))
+    """
+
+    paths = iter(paths)
+    while True:
+        chunk = list(itertools.islice(paths, max(1, chunk_size)))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_worker(snapshot):
+    """
+    Internal function that creates the template index of a worker process
+    :param snapshot: list(tuple), snapshot created with TemplateIndex.snapshot
+    """
+
+    global _WORKER_INDEX
+    _WORKER_INDEX = templateindex.TemplateIndex.from_snapshot(snapshot)
+
+
+def _parse_chunk(paths):
+    """
+    Internal function that parses a chunk of paths in a worker process
+    :param paths: list(str)
+    :return: list(tuple(str, dict) or None)
+    """
+
+    return list(_parse_chunk_with_index(_WORKER_INDEX, paths))
+
+
+def _parse_chunk_with_index(template_index, paths):
+    """
+    Internal generator that parses given paths with the given index
+    :param template_index: TemplateIndex
+    :param paths: iterable(str)
+    :return: generator(tuple(str, dict) or None)
+    """
+
+    for path in paths:
+        result = template_index.classify(path)
+        yield (result[0].name, result[1]) if result else None
@@ -0,0 +1,120 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains memory compact variants of naming classes
+Compact classes store their attributes in slots instead of a per instance dictionary and tokens store their keys
+and values in tuples. They are serialized exactly as the default classes, so both can read and write the same naming
+files. Contrary to default classes, compact classes only store the fields declared by their class, so other fields
+found in naming data are ignored when loading it
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from tpDcc.libs.nameit.core import namelib
+
+
+class CompactToken(namelib.BaseToken):
+    """
+    Token that stores its attributes in slots and its keys and values in tuples
+    Supported fields: name, default, values, override_value and description
+    """
+
+    __slots__ = (
+        '_version', '_items', '_items_version', '_reverse_items', '_reverse_items_version', '_keys', '_values',
+        '_values_view', 'name', 'default', 'override_value', 'description')
+
+    @property
+    def values(self):
+        """
+        Returns a dictionary with the keys and values of the token
+        The dictionary is only created when requested and it is kept, so it can be modified in place as the values
+        of default tokens. Its changes are stored in the token tuples the next time the token version is read
+        :return: dict(str, list)
+        """
+
+        if self._values_view is None:
+            self._values_view = {'key': list(self._keys), 'value': list(self._values)}
+
+        return self._values_view
+
+    @values.setter
+    def values(self, values):
+        self._keys = tuple(values.get('key', list()))
+        self._values = tuple(values.get('value', list()))
+        self._values_view = None
+
+    def _get_field_value(self, name):
+        if name == 'values':
+            # Values dictionary is not created to serialize the token
+            self._check_values()
+            return {'key': list(self._keys), 'value': list(self._values)}
+
+        return super(CompactToken, self)._get_field_value(name)
+
+    def _get_values_items(self):
+        return self._keys, self._values
+
+    def _store_values_state(self):
+        # Token tuples already store the state of the values
+        pass
+
+    def _check_values(self):
+        values_view = self._values_view
+        if values_view is None:
+            return
+
+        keys = tuple(values_view['key'])
+        values = tuple(values_view['value'])
+        if keys != self._keys or values != self._values:
+            self._keys = keys
+            self._values = values
+            self._update_version()
+
+
+class CompactRule(namelib.BaseRule):
+    """
+    Rule that stores its attributes in slots
+    Supported fields: name, expression, description, auto_fix and iterator_format
+    """
+
+    __slots__ = ('_version', 'name', 'expression', 'description', 'auto_fix', 'iterator_format')
+
+
+class CompactTemplate(namelib.BaseTemplate):
+    """
+    Template that stores its attributes in slots
+    Supported fields: name and pattern
+    """
+
+    __slots__ = ('_version', 'name', 'pattern', 'resolver', '_template', '_template_key')
+
+
+class CompactTemplateToken(namelib.BaseTemplateToken):
+    """
+    Template token that stores its attributes in slots
+    Supported fields: name and description
+    """
+
+    __slots__ = ('_version', 'name', 'description')
+
+
+class CompactNameLib(namelib.NameLib):
+    """
+    Naming library that uses memory compact naming classes
+    Useful when lots of naming libraries are kept alive at the same time (for example, one per project in a long
+    running pipeline service)
+    """
+
+    RULE_CLASS = CompactRule
+    TOKEN_CLASS = CompactToken
+    TEMPLATE_CLASS = CompactTemplate
+    TEMPLATE_TOKEN_CLASS = CompactTemplateToken
+
+    def __init__(self, *args, **kwargs):
+        # Each compact naming library stores its own objects. Lists must exist before the indexes are created
+        self._templates = list()
+        self._templates_tokens = list()
+        self._tokens = list()
+        self._rules = list()
+        super(CompactNameLib, self).__init__(*args, **kwargs)
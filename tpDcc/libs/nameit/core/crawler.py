@@ -0,0 +1,136 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to classify the files of directory trees against templates
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import logging
+import multiprocessing
+from concurrent import futures
+
+try:
+    from os import scandir
+except ImportError:
+    from scandir import scandir
+
+LOGGER = logging.getLogger('tpDcc-libs-nameit')
+
+
+def crawl(roots, template_index, max_workers=None, include_directories=True, prune=True, follow_symlinks=False):
+    """
+    Walks given roots and yields the paths that match any of the templates of the given index
+    Directories are scanned in parallel by a thread pool while paths are classified as soon as their directory is
+    scanned, so results are not returned in any specific order
+    :param roots: str or list(str), root directories to walk
+    :param template_index: TemplateIndex, index used to classify paths
+    :param max_workers: int or None, number of threads used to scan directories
+    :param include_directories: bool, whether directories should be classified or only files
+    :param prune: bool, whether to skip directories whose paths cannot be matched by any template
+    :param follow_symlinks: bool, whether symbolic links to directories should be walked
+    :return: generator(tuple(str, str, dict)), path, template name and parsed data of each matched path
+    """
+
+    if not isinstance(roots, (list, tuple, set)):
+        roots = [roots]
+
+    # When following symbolic links, walked directories are stored by their device and inode, so links pointing to a
+    # parent directory are not walked forever
+    visited = set()
+
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers or min(32, multiprocessing.cpu_count() * 4))
+    pending = set()
+    try:
+        for root in roots:
+            if follow_symlinks:
+                directory_id = _get_directory_id(root)
+                if directory_id is not None:
+                    if directory_id in visited:
+                        continue
+                    visited.add(directory_id)
+            pending.add(executor.submit(_scan_directory, root, follow_symlinks))
+
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                file_paths, directories = future.result()
+                for directory_path, directory_id in directories:
+                    path = _normalize_path(directory_path)
+                    walk = not prune or template_index.could_match(path)
+                    if walk and directory_id is not None:
+                        walk = directory_id not in visited
+                        visited.add(directory_id)
+                    if walk:
+                        pending.add(executor.submit(_scan_directory, directory_path, follow_symlinks))
+                    # Directories are classified even if their contents are skipped, because templates anchored at
+                    # the end can match a directory while no path inside it can be matched
+                    if include_directories:
+                        result = template_index.classify(path)
+                        if result:
+                            yield directory_path, result[0].name, result[1]
+
+                for file_path in file_paths:
+                    result = template_index.classify(_normalize_path(file_path))
+                    if result:
+                        yield file_path, result[0].name, result[1]
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _scan_directory(directory, follow_symlinks=False):
+    """
+    Internal function that returns the files and directories contained in the given directory
+    :param directory: str
+    :param follow_symlinks: bool
+    :return: tuple(list(str), list(tuple(str, tuple or None))), file paths and directory paths with their ids. Ids
+        are only returned when following symbolic links
+    """
+
+    file_paths = list()
+    directories = list()
+    try:
+        for entry in scandir(directory):
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    directories.append((entry.path, _get_directory_id(entry.path) if follow_symlinks else None))
+                else:
+                    file_paths.append(entry.path)
+            except OSError:
+                continue
+    except OSError as exc:
+        LOGGER.debug('Impossible to scan directory "{}": {}'.format(directory, exc))
+
+    return file_paths, directories
+
+
+def _get_directory_id(directory):
+    """
+    Internal function that returns a value that identifies given directory, even if it is reached through different
+    symbolic links
+    :param directory: str
+    :return: tuple(int, int) or None, device and inode of the directory or None if they are not available
+    """
+
+    try:
+        directory_stat = os.stat(directory)
+    except OSError:
+        return None
+    if not directory_stat.st_ino:
+        return None
+
+    return directory_stat.st_dev, directory_stat.st_ino
+
+
+def _normalize_path(path):
+    """
+    Internal function that returns given path with forward slashes, as used by templates
+    :param path: str
+    :return: str
+    """
+
+    return path.replace('\\', '/') if os.sep == '\\' else path
@@ -10,32 +10,128 @@ from __future__ import print_function, division, absolute_import
 import os
 import re
 import copy
-import json
-import yaml
+import atexit
 import logging
+import weakref
+import itertools
+import threading
 import traceback
 from collections import OrderedDict
 
+import six
+
 from tpDcc.libs.nameit.externals import lucidity
-from tpDcc.libs.python import jsonio, yamlio, python, strings as string_utils, name as name_utils
+from tpDcc.libs.nameit.core import templateindex, snapshotcache, serialization, streaming
+from tpDcc.libs.python import python, strings as string_utils, name as name_utils
 
 LOGGER = logging.getLogger('tpDcc-libs-nameit')
 
+# Types that do not need to be copied when serializing data
+_IMMUTABLE_TYPES = frozenset([type(None), bool, int, float, str, type(u''), type(b'')])
+
+# Versions of serializable objects are taken from a global counter, so a changed object always gets a version greater
+# than the version of any other object
+_VERSION_COUNTER = itertools.count(1)
+
+# Naming libraries with a scheduled save pending. They are saved when the interpreter exits, because scheduled saves
+# run in daemon threads that are not waited for
+_PENDING_SAVES = weakref.WeakSet()
+
+
+def copy_value(value):
+    """
+    Returns a copy of the given serializable value
+    Faster than copy.deepcopy for the plain data types used by naming data (scalars, lists and dicts), other types are
+    deep copied
+    :param value: object
+    :return: object
+    """
+
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    elif value_type is list:
+        if all(type(item) in _IMMUTABLE_TYPES for item in value):
+            return list(value)
+        return [copy_value(item) for item in value]
+    elif value_type is dict:
+        return dict((k, copy_value(v)) for k, v in value.items())
+
+    return copy.deepcopy(value)
+
+
+def _flush_pending_saves():
+    """
+    Internal function that saves all the naming libraries with a scheduled save pending
+    Registered to be called when the interpreter exits
+    """
+
+    for naming_lib in list(_PENDING_SAVES):
+        try:
+            naming_lib.flush_save()
+        except Exception as exc:
+            LOGGER.error('Impossible to save naming session: {} | {}'.format(exc, traceback.format_exc()))
+
+
+atexit.register(_flush_pending_saves)
+
 
 class Serializable(object):
 
-    SKIP_ATTRIBUTES = list()
+    # Empty slots allow subclasses to define slots and store their attributes without a __dict__
+    __slots__ = ()
+
+    SKIP_ATTRIBUTES = ['_version']
+
+    # Class name stored in serialized data. If None, the name of the class is used
+    SERIALIZED_NAME = None
+
+    # Serialized attributes. Other instance attributes that are not skipped (for example, attributes of data loaded
+    # from a newer file version) are serialized too
+    FIELDS = tuple()
+
+    def __setattr__(self, name, value):
+        renamed = name == 'name' and getattr(self, 'name', value) != value
+        super(Serializable, self).__setattr__(name, value)
+
+        # Any change in public data invalidates the data cached from this object
+        if not name.startswith('_'):
+            self._update_version()
+        if renamed:
+            NameIndex.notify_rename()
+
+    @property
+    def version(self):
+        """
+        Returns a counter that changes every time object data changes
+        :return: int
+        """
+
+        return getattr(self, '_version', 0)
 
     def data(self):
-        # We use copy.deepcopy because a dictionary in Python is a mutable type and we do not want
-        # to change the dictionary outside this class
-        ret_val = copy.deepcopy(self.__dict__)
-        for attr in self.SKIP_ATTRIBUTES:
-            if attr in ret_val:
-                ret_val.pop(attr)
+        # Values are copied because a dictionary in Python is a mutable type and we do not want to change the
+        # dictionary outside this class. We skip attributes before copying, so runtime caches (compiled templates,
+        # resolvers, ...) are never copied
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict is None:
+            # Objects with slots only store declared attributes
+            ret_val = dict()
+            for k in self.FIELDS:
+                try:
+                    ret_val[k] = copy_value(self._get_field_value(k))
+                except AttributeError:
+                    # Field was never set
+                    continue
+        else:
+            ret_val = dict((k, copy_value(instance_dict[k])) for k in self.FIELDS if k in instance_dict)
+            if len(ret_val) != len(instance_dict):
+                for k, v in instance_dict.items():
+                    if k not in ret_val and k not in self.SKIP_ATTRIBUTES:
+                        ret_val[k] = copy_value(v)
 
         # We create some internal properties to validate the new instance
-        ret_val['_Serializable_classname'] = type(self).__name__
+        ret_val['_Serializable_classname'] = self.SERIALIZED_NAME or type(self).__name__
         ret_val['_Serializable_version'] = '1.0'
 
         return ret_val
@@ -45,7 +141,7 @@ class Serializable(object):
 
         if not skip_check:
             # First of all, we have to validate the data
-            if data.get('_Serializable_classname') != cls.__name__:
+            if data.get('_Serializable_classname') != (cls.SERIALIZED_NAME or cls.__name__):
                 return None
 
             # After the validation we delete validation property
@@ -54,19 +150,177 @@ class Serializable(object):
                 del data['_Serializable_version']
 
         this = cls()
-        this.__dict__.update(data)
+        if hasattr(this, '__dict__'):
+            this.__dict__.update(data)
+        else:
+            # Objects with slots can only store the fields declared by their class. Loaded data is not a change, so
+            # it is set without updating the version
+            for k, v in data.items():
+                if k in cls.FIELDS:
+                    object.__setattr__(this, k, v)
+                elif not k.startswith('_Serializable_'):
+                    LOGGER.warning('Field "{}" is not supported by {} and will be ignored'.format(k, cls.__name__))
+
+        # Versions count changes since objects were loaded
+        object.__setattr__(this, '_version', 0)
+
         return this
 
+    def _get_field_value(self, name):
+        """
+        Internal function that returns the value of the given field that is serialized by objects with slots
+        :param name: str
+        :return: object
+        """
+
+        return getattr(self, name)
+
+    def _update_version(self):
+        object.__setattr__(self, '_version', next(_VERSION_COUNTER))
+
+
+class NameIndex(object):
+    """
+    Class that keeps a name -> item index of a list of named items
+    The list keeps the ordering of the items, the index only speeds up lookups by name. If items are appended or
+    removed without notifying the index, or if any item is renamed, the index is rebuilt lazily
+    """
+
+    # Counter shared by all indexes that changes every time a serializable object is renamed
+    _renames = 0
+
+    def __init__(self, items, loader=None):
+        """
+        :param items: list, list of named items to index
+        :param loader: callable or None, function called with a name when no item with that name is found. It can
+            create the item (appending it to the list) and return it
+        """
+
+        self._items = items
+        self._loader = loader
+        self._index = dict()
+        self._size = -1
+        self._renames_version = -1
+        self._version = 0
+
+    @classmethod
+    def notify_rename(cls):
+        """
+        Notifies all indexes that an item was renamed, so they are rebuilt the next time they are accessed
+        """
+
+        NameIndex._renames += 1
+
+    @property
+    def version(self):
+        """
+        Returns a counter that changes every time the indexed items change
+        :return: int
+        """
+
+        if self._size != len(self._items) or self._renames_version != NameIndex._renames:
+            self.rebuild()
+
+        return self._version
+
+    def add(self, item):
+        """
+        Registers an item that was appended to the list
+        :param item: object
+        """
+
+        if self._size == len(self._items) - 1:
+            self._index.setdefault(item.name, item)
+            self._size += 1
+            self._version += 1
+
+    def invalidate(self):
+        """
+        Forces the index to be rebuilt the next time it is accessed
+        """
+
+        self._size = -1
+        self._version += 1
+
+    def rebuild(self):
+        """
+        Rebuilds the index from the items list
+        If there are items with duplicated names, first one is indexed
+        """
+
+        renames_version = NameIndex._renames
+        index = dict()
+        for item in self._items:
+            index.setdefault(item.name, item)
+        self._index = index
+        self._size = len(self._items)
+        self._renames_version = renames_version
+        self._version += 1
+
+    def get(self, name):
+        """
+        Returns item with given name
+        :param name: str
+        :return: object or None
+        """
+
+        if self._size != len(self._items) or self._renames_version != NameIndex._renames:
+            self.rebuild()
+
+        item = self._index.get(name)
+        if item is None and self._loader is not None:
+            return self._loader(name)
+
+        return item
+
+
+class BaseToken(Serializable, object):
+    """
+    Base class for tokens. It does not define how token attributes are stored
+    """
 
-class Token(Serializable, object):
+    __slots__ = ()
+
+    SKIP_ATTRIBUTES = [
+        '_version', '_items', '_items_version', '_reverse_items', '_reverse_items_version', '_values_state']
+    FIELDS = ('name', 'default', 'values', 'override_value', 'description')
+    SERIALIZED_NAME = 'Token'
 
     def __init__(self, name='New_Token'):
-        super(Token, self).__init__()
+        super(BaseToken, self).__init__()
+        self._version = 0
+        self._items = None
+        self._items_version = -1
+        self._reverse_items = None
+        self._reverse_items_version = -1
         self.name = name
         self.default = 0
         self.values = {'key': [], 'value': []}
         self.override_value = ""
         self.description = None
+        self._store_values_state()
+
+    @classmethod
+    def from_data(cls, data, skip_check=False):
+        this = super(BaseToken, cls).from_data(data, skip_check=skip_check)
+        if this is not None:
+            # Loaded values are not a change
+            this._store_values_state()
+
+        return this
+
+    @property
+    def version(self):
+        """
+        Returns a counter that changes every time token data changes
+        Token values can be modified in place, so they are compared with the values stored the last time the version
+        was requested
+        :return: int
+        """
+
+        self._check_values()
+
+        return super(BaseToken, self).version
 
     @staticmethod
     def is_iterator(name):
@@ -76,7 +330,7 @@ class Token(Serializable, object):
         :return: bool
         """
 
-        if not isinstance(name, (str, unicode)):
+        if not isinstance(name, six.string_types):
             return False
 
         if '#' in name or '@' in name:
@@ -84,13 +338,12 @@ class Token(Serializable, object):
         return False
 
     def get_items(self):
-        keys = self.values['key']
-        values = self.values['value']
-        items_dict = OrderedDict()
-        for i, key in enumerate(keys):
-            items_dict[key] = values[i]
+        """
+        Returns a new dictionary with the items (key -> value) of the token
+        :return: OrderedDict
+        """
 
-        return items_dict
+        return OrderedDict(self._get_cached_items()[0])
 
     def add_token_value(self):
         """
@@ -100,6 +353,7 @@ class Token(Serializable, object):
 
         self.values['key'].append('New_Tag')
         self.values['value'].append('New_Value')
+        self._update_version()
 
         return self.values
 
@@ -111,6 +365,7 @@ class Token(Serializable, object):
 
         self.values['key'].pop(value_index)
         self.values['value'].pop(value_index)
+        self._update_version()
 
         return self.values
 
@@ -124,6 +379,7 @@ class Token(Serializable, object):
 
         if item_row > -1:
             self.values['key'][item_row] = token_key
+            self._update_version()
 
     def set_token_value(self, item_row, token_value):
         """
@@ -135,6 +391,7 @@ class Token(Serializable, object):
 
         if item_row > -1:
             self.values['value'][item_row] = token_value
+            self._update_version()
 
     def is_required(self):
         """
@@ -164,13 +421,14 @@ class Token(Serializable, object):
             else:
                 return self._get_default()
 
-        if 'iterator' in self.get_items():
-            if name not in self.get_items():
+        items = self._get_cached_items()[0]
+        if 'iterator' in items:
+            if name not in items:
                 return self._get_default_iterator_value(name, rule=rule)
             else:
                 return name
         else:
-            return self.get_items().get(name)
+            return items.get(name)
 
     def _get_default_iterator_value(self, name, rule):
         iterator_format = rule.iterator_format
@@ -186,12 +444,17 @@ class Token(Serializable, object):
         Parse a value taking in account the items of the token | Solved Name - Fields
         """
 
-        for k, v in self.get_items().items():
-            if k == 'iterator':
-                if v == '#' and str(value).isdigit():
-                    return v if get_keys else value
-            if v == value:
-                return k if get_keys else v
+        reverse_items, iterator_index = self._get_reverse_items()
+        item = reverse_items.get(value)
+
+        # Digits are parsed by the iterator unless a previous item already matches the value
+        if iterator_index is not None and str(value).isdigit() and (item is None or iterator_index < item[0]):
+            return '#' if get_keys else value
+
+        if item is None:
+            return None
+
+        return item[1] if get_keys else value
 
     def save(self, file_path, parser_format='yaml'):
         """
@@ -199,31 +462,113 @@ class Token(Serializable, object):
         """
 
         file_path = os.path.join(file_path, self.name + '.token')
-        if self.data():
-            with open(file_path, 'w') as fp:
-                if parser_format == 'yaml':
-                    yaml.dump(self.data(), fp)
-                else:
-                    json.dump(self.data(), fp)
+        data = self.data()
+        if data:
+            serialization.get_serializer(parser_format).write_file(data, file_path)
             return True
         return False
 
+    def _get_reverse_items(self):
+        """
+        Internal function that returns the reverse lookup table of the token items
+        Table maps each item value with the index and key of the first item with that value. Table is cached and
+        only built again when token data changes
+        :return: tuple(dict(str, tuple(int, str)), int or None), reverse table and index of the '#' iterator item
+        """
+
+        version = self.version
+        if self._reverse_items is None or self._reverse_items_version != version:
+            reverse_items = dict()
+            iterator_index = None
+            for i, (k, v) in enumerate(self._get_cached_items()[0].items()):
+                if k == 'iterator' and v == '#' and iterator_index is None:
+                    iterator_index = i
+                reverse_items.setdefault(v, (i, k))
+            self._reverse_items = (reverse_items, iterator_index)
+            self._reverse_items_version = version
+
+        return self._reverse_items
+
+    def _get_cached_items(self):
+        """
+        Internal function that returns the cached items of the token
+        Items are only built again when token data changes. Returned data must not be modified
+        :return: tuple(OrderedDict, tuple), items dictionary (key -> value) and items values
+        """
+
+        version = self.version
+        if self._items is None or self._items_version != version:
+            keys, values = self._get_values_items()
+            items_dict = OrderedDict()
+            for i, key in enumerate(keys):
+                items_dict[key] = values[i]
+            self._items = (items_dict, tuple(items_dict.values()))
+            self._items_version = version
+
+        return self._items
+
+    def _get_values_items(self):
+        """
+        Internal function that returns the keys and values of the token
+        :return: tuple(list, list)
+        """
+
+        return self.values['key'], self.values['value']
+
+    def _store_values_state(self):
+        """
+        Internal function that stores a copy of current token keys and values, to detect changes done in place
+        """
+
+        keys, values = self._get_values_items()
+        self._values_state = (keys[:], values[:])
+
+    def _check_values(self):
+        """
+        Internal function that updates the version of the token if its keys or values were modified in place
+        """
+
+        values_state = getattr(self, '_values_state', None)
+        keys, values = self._get_values_items()
+        if values_state is not None and values_state[0] == keys and values_state[1] == values:
+            return
+
+        self._store_values_state()
+        if values_state is not None:
+            self._update_version()
+
     def _get_default(self):
-        items = self.get_items()
+        items, item_values = self._get_cached_items()
         if not items:
             return None
 
-        if items and python.is_number(self.default) and self.default >= 0:
-            default_value = self.get_items().values()[self.default - 1]
+        if python.is_number(self.default) and self.default >= 0:
+            default_value = item_values[self.default - 1]
             return default_value
 
         return self.default
 
 
-class Rule(Serializable, object):
+class Token(BaseToken):
+    """
+    Class that defines a token in the naming manager
+    """
+
+    pass
+
+
+class BaseRule(Serializable, object):
+    """
+    Base class for rules. It does not define how rule attributes are stored
+    """
+
+    __slots__ = ()
+
+    FIELDS = ('name', 'expression', 'description', 'auto_fix', 'iterator_format')
+    SERIALIZED_NAME = 'Rule'
 
     def __init__(self, name='New Rule', iterator_format='@', auto_fix=False):
-        super(Rule, self).__init__()
+        super(BaseRule, self).__init__()
         self.name = name
         self.expression = None
         self.description = None
@@ -333,12 +678,9 @@ class Rule(Serializable, object):
         """
 
         file_path = os.path.join(file_path, self.name + '.rule')
-        if self.data():
-            with open(file_path, 'w') as fp:
-                if parser_format == 'yaml':
-                    yaml.dump(self.data(), fp)
-                else:
-                    json.dump(self.data(), fp)
+        data = self.data()
+        if data:
+            serialization.get_serializer(parser_format).write_file(data, file_path)
             return True
         return False
 
@@ -353,22 +695,347 @@ class Rule(Serializable, object):
         return "{{{}}}".format("}_{".join(fields))
 
 
-class Template(Serializable, object):
+class Rule(BaseRule):
     """
-    Class that defines a template in the naming manager
-    Is stores naming patterns for files
+    Class that defines a rule in the naming manager
+    """
+
+    pass
+
+
+class RulePlan(object):
+    """
+    Base class for data precomputed from a rule and its tokens
+    Plans store the versions of the data they were computed from, so they can be cached and reused until the rule
+    or any of its tokens change
+    """
+
+    def __init__(self, rule, tokens, tokens_version=0):
+        """
+        :param rule: Rule
+        :param tokens: list(Token), tokens of the rule fields, in the same order as rule fields
+        :param tokens_version: int, version of the tokens collection the tokens were taken from
+        """
+
+        super(RulePlan, self).__init__()
+
+        self._rule = rule
+        self._rule_key = self.get_rule_key(rule)
+        self._tokens_version = tokens_version
+        self._token_versions = tuple((token, token.version) for token in set(tokens))
+
+    @staticmethod
+    def get_rule_key(rule):
+        """
+        Returns a tuple with the rule data a plan depends on
+        :param rule: Rule
+        :return: tuple
+        """
+
+        return rule.name, rule.expression, rule.auto_fix, rule.iterator_format
+
+    def is_valid(self, rule, tokens_version):
+        """
+        Returns whether this plan can still be used with the given rule
+        :param rule: Rule
+        :param tokens_version: int, current version of the tokens collection
+        :return: bool
+        """
+
+        if rule is not self._rule or tokens_version != self._tokens_version:
+            return False
+        if self._rule_key != self.get_rule_key(rule):
+            return False
+        for token, version in self._token_versions:
+            if token.version != version:
+                return False
+
+        return True
+
+
+class SolvePlan(RulePlan):
+    """
+    Class that stores the data needed to solve names with a rule and its tokens
+    Fields, required/optional positions and default values are computed once, so solving a name does not need to
+    parse the rule expression or evaluate the tokens again
+    """
+
+    def __init__(self, rule, tokens, tokens_version=0):
+        super(SolvePlan, self).__init__(rule, tokens, tokens_version=tokens_version)
+
+        self._auto_fix = rule.auto_fix
+
+        self._fields = list()
+        self._unique_fields = list()
+        self._defaults = dict()
+        for token in tokens:
+            field = token.name
+            items = token._get_cached_items()[0]
+            self._fields.append((field, token, token.is_required(), items, 'iterator' in items))
+            if field not in self._unique_fields:
+                self._unique_fields.append(field)
+        self._pattern = '_'.join(['{}'] * len(self._unique_fields))
+
+    def solve(self, args, kwargs):
+        """
+        Solves a name with the given positional and keyword values
+        Follows the same logic as NameLib.solve:
+            - Required tokens take their value from keywords or, if not given, from the next positional argument
+            - Optional tokens solve the keyword value or use its default value
+        :param args: tuple
+        :param kwargs: dict
+        :return: str
+        """
+
+        if not self._unique_fields:
+            return None
+
+        i = 0
+        values = dict()
+        for field, token, required, items, has_iterator in self._fields:
+            value = kwargs.get(field)
+            if required:
+                if value is None:
+                    value = args[i] if i < len(args) else None
+                    i += 1
+            elif value is None:
+                value = self._get_default(token)
+            elif token.name == 'rule_name':
+                value = self._rule.name
+            elif has_iterator:
+                if value not in items:
+                    value = token._get_default_iterator_value(value, rule=self._rule)
+            else:
+                value = items.get(value)
+            values[field] = value
+
+        ordered_values = [values[field] for field in self._unique_fields]
+        if None not in ordered_values:
+            return self._pattern.format(*ordered_values)
+
+        valid_values = list()
+        for field, value in zip(self._unique_fields, ordered_values):
+            if value is None:
+                if self._auto_fix:
+                    continue
+                LOGGER.warning(
+                    'Missing field: "{}" when generating new name (None will be used instead)!'.format(field))
+            valid_values.append(value)
+
+        return '_'.join(['{}'] * len(valid_values)).format(*valid_values)
+
+    def _get_default(self, token):
+        """
+        Internal function that returns the default solved value of the given optional token
+        Default values are solved the first time they are needed, so tokens whose values are always given are never
+        solved
+        :param token: Token
+        :return: str or None
+        """
+
+        if token.name not in self._defaults:
+            self._defaults[token.name] = token.solve(self._rule)
+
+        return self._defaults[token.name]
+
+
+class ParsePlan(RulePlan):
+    """
+    Class that stores the data needed to parse names with a rule and its tokens
+    Each optional token is converted into a reverse table (value -> key), so parsing a name does not need to loop
+    over token items
+    """
+
+    def __init__(self, rule, tokens, tokens_version=0):
+        super(ParsePlan, self).__init__(rule, tokens, tokens_version=tokens_version)
+
+        self._fields = list()
+        self._unique_fields = list()
+        for token in tokens:
+            field = token.name
+            if field not in self._unique_fields:
+                self._unique_fields.append(field)
+            column = self._unique_fields.index(field)
+            if token.is_required():
+                self._fields.append((column, True, None, None))
+                continue
+            reverse_items, iterator_index = token._get_reverse_items()
+            self._fields.append((column, False, reverse_items, iterator_index))
+
+    @property
+    def fields(self):
+        """
+        Returns unique fields of the plan, in rule order
+        :return: list(str)
+        """
+
+        return self._unique_fields
+
+    def parse_values(self, name, get_keys=False):
+        """
+        Parses given name and returns the parsed value of each unique field
+        Follows the same logic as Rule.parse
+        :param name: str
+        :param get_keys: bool, whether to return token keys instead of token values
+        :return: list
+        """
+
+        values = [None] * len(self._unique_fields)
+        split_name = name.split('_')
+        for value, (column, required, reverse_items, iterator_index) in zip(split_name, self._fields):
+            if required:
+                values[column] = value
+                continue
+            item = reverse_items.get(value)
+            if iterator_index is not None and value.isdigit() and (item is None or iterator_index < item[0]):
+                values[column] = '#' if get_keys else value
+            elif item is None:
+                values[column] = None
+            else:
+                values[column] = item[1] if get_keys else value
+
+        # Fields without a matching name part are not parsed
+        for column, _, _, _ in self._fields[len(split_name):]:
+            values[column] = None
+
+        return values
+
+    def parse(self, name, get_keys=False):
+        """
+        Parses given name
+        :param name: str
+        :param get_keys: bool, whether to return token keys instead of token values
+        :return: OrderedDict
+        """
+
+        return OrderedDict(zip(self._unique_fields, self.parse_values(name, get_keys=get_keys)))
+
+
+class RuleMatcher(RulePlan):
+    """
+    Class that parses names with a single regular expression built from a rule and its tokens
+    Optional tokens only match their item values (or iterator values) and required tokens match any text, so token
+    values can contain underscores
+    """
+
+    def __init__(self, rule, tokens, tokens_version=0):
+        super(RuleMatcher, self).__init__(rule, tokens, tokens_version=tokens_version)
+
+        self._unique_fields = list()
+        self._groups = list()
+        expressions = list()
+        for token in tokens:
+            field = token.name
+            if field not in self._unique_fields:
+                self._unique_fields.append(field)
+            column = self._unique_fields.index(field)
+            if token.is_required():
+                self._groups.append((column, None, None))
+                expressions.append('(.+?)')
+                continue
+
+            items = token._get_cached_items()[0]
+            if field == 'rule_name':
+                # Rule name token is always solved with the name of the rule
+                lookup = {rule.name: rule.name}
+            else:
+                lookup = dict()
+                for k, v in items.items():
+                    lookup.setdefault(str(v), k)
+            alternatives = [re.escape(v) for v in sorted(lookup, key=len, reverse=True)]
+
+            # Iterator values are solved taking into account the iterator format of the rule
+            iterator_key = None
+            if field != 'rule_name' and 'iterator' in items:
+                iterator_key = items['iterator']
+                if '@' in rule.iterator_format:
+                    alternatives.append('[a-zA-Z]+')
+                elif '#' in rule.iterator_format:
+                    alternatives.append(r'\d+')
+                else:
+                    alternatives.append('.+?')
+            self._groups.append((column, lookup, iterator_key))
+            expressions.append('({})'.format('|'.join(alternatives)))
+
+        self._regex = re.compile('^{}$'.format('_'.join(expressions)))
+
+    @property
+    def fields(self):
+        """
+        Returns unique fields of the matcher, in rule order
+        :return: list(str)
+        """
+
+        return self._unique_fields
+
+    @property
+    def regex(self):
+        """
+        Returns compiled regular expression used to match names
+        :return: re.Pattern
+        """
+
+        return self._regex
+
+    def match(self, name, get_keys=False):
+        """
+        Parses given name
+        :param name: str
+        :param get_keys: bool, whether to return token keys instead of token values
+        :return: OrderedDict or None, parsed fields or None if the name does not match the rule
+        """
+
+        match = self._regex.match(name)
+        if not match:
+            return None
+
+        values = [None] * len(self._unique_fields)
+        for value, (column, lookup, iterator_key) in zip(match.groups(), self._groups):
+            if get_keys and lookup is not None:
+                value = lookup.get(value, iterator_key)
+            values[column] = value
+
+        return OrderedDict(zip(self._unique_fields, values))
+
+
+class BaseTemplate(Serializable, object):
+    """
+    Base class for templates. It does not define how template attributes are stored
     """
 
-    SKIP_ATTRIBUTES = ['resolver']
+    __slots__ = ()
+
+    SKIP_ATTRIBUTES = ['_version', 'resolver', '_template', '_template_key']
+    FIELDS = ('name', 'pattern')
+    SERIALIZED_NAME = 'Template'
+
+    # Counter shared by all templates that changes every time the data of any template changes
+    _templates_version = 0
 
     def __init__(self, name='New_Template', pattern=''):
         self.name = name
         self.pattern = pattern
         self.resolver = None
+        self._template = None
+        self._template_key = None
 
     @property
     def template(self):
-        return self._create_template()
+        """
+        Returns lucidity template wrapped by this template
+        The lucidity template is only created again if name or pattern changed since last access
+        :return: lucidity.Template
+        """
+
+        template_key = (self.name, self.pattern)
+        if self._template is None or self._template_key != template_key:
+            self._template = self._create_template()
+            self._template_key = template_key
+        else:
+            # Lucidity template clears its own caches when the resolver changes
+            self._template.template_resolver = self.resolver or None
+
+        return self._template
 
     def keys(self):
         """
@@ -380,10 +1047,11 @@ class Template(Serializable, object):
         return template.keys() if template else list()
 
     def set_resolver(self, resolver):
-        if not resolver:
+        if not resolver or resolver is self.resolver:
             return
 
-        self.resolver = resolver
+        # Resolver is not template data, so it does not change template version
+        object.__setattr__(self, 'resolver', resolver)
 
     def references(self):
         """
@@ -402,16 +1070,37 @@ class Template(Serializable, object):
         """
 
         try:
-            template = self.template
-            if self.resolver:
-                template.template_resolver = self.resolver
-            return template.parse(path_to_parse)
+            return self.template.parse(path_to_parse)
         except Exception:
             LOGGER.warning(
                 'Given Path: {} does not match template pattern: {} | {}!'.format(
                     path_to_parse, self.name, self.pattern))
             return None
 
+    def try_parse(self, path_to_parse):
+        """
+        Parses given path without logging or raising if the path does not match the template
+        :param path_to_parse: str
+        :return: dict or None
+        """
+
+        try:
+            return self.template.try_parse(path_to_parse)
+        except Exception:
+            return None
+
+    def match(self, path_to_match):
+        """
+        Returns whether given path matches the template or not, without logging or raising
+        :param path_to_match: str
+        :return: bool
+        """
+
+        try:
+            return self.template.match(path_to_match)
+        except Exception:
+            return False
+
     def format(self, template_data):
         """
         Returns proper path with the given dict data
@@ -419,10 +1108,16 @@ class Template(Serializable, object):
         :return: str
         """
 
-        template = self.template
-        if self.resolver:
-            template.template_resolver = self.resolver
-        return template.format(template_data)
+        return self.template.format(template_data)
+
+    @classmethod
+    def get_templates_version(cls):
+        """
+        Returns a counter that changes every time the data of any template changes
+        :return: int
+        """
+
+        return BaseTemplate._templates_version
 
     def _create_template(self):
         """
@@ -430,22 +1125,72 @@ class Template(Serializable, object):
         :return: lucidity.Template
         """
 
-        template = lucidity.Template(self.name, self.pattern)
-        if self.resolver:
-            template.template_resolver = self.resolver
+        return lucidity.Template(self.name, self.pattern, template_resolver=self.resolver or None)
 
-        return template
+    def _update_version(self):
+        super(BaseTemplate, self)._update_version()
+        BaseTemplate._templates_version += 1
 
 
-class TemplateToken(Serializable, object):
+class Template(BaseTemplate):
     """
-    Class that defines a template token in the naming manager
+    Class that defines a template in the naming manager
+    Is stores naming patterns for files
+    """
+
+    pass
+
+
+class TemplateResolver(lucidity.Resolver):
+    """
+    Class that resolves template references for all the templates of a naming library
+    References are resolved against the live templates index, so the same resolver instance can be shared by all
+    templates and does not need to be rebuilt when templates are added, removed or edited
     """
 
+    def __init__(self, templates_index):
+        super(TemplateResolver, self).__init__()
+        self._templates_index = templates_index
+
+    def get(self, template_name, default=None):
+        """
+        Returns lucidity template of the template with the given name
+        :param template_name: str
+        :param default: object, value returned if no template with the given name is found
+        :return: lucidity.Template
+        """
+
+        template = self._templates_index.get(template_name)
+        if template is None:
+            return default
+
+        template.set_resolver(self)
+
+        return template.template
+
+
+class BaseTemplateToken(Serializable, object):
+    """
+    Base class for template tokens. It does not define how template token attributes are stored
+    """
+
+    __slots__ = ()
+
+    FIELDS = ('name', 'description')
+    SERIALIZED_NAME = 'TemplateToken'
+
     def __init__(self, name='New_Template_Token', description=''):
         self.name = name
         self.description = description
 
+
+class TemplateToken(BaseTemplateToken):
+    """
+    Class that defines a template token in the naming manager
+    """
+
+    pass
+
 # ======================= RULES ======================= #
 
 
@@ -465,6 +1210,12 @@ class NameLib(object):
     _tokens = list()
     _rules = list()
 
+    # Classes used to create naming objects
+    RULE_CLASS = Rule
+    TOKEN_CLASS = Token
+    TEMPLATE_CLASS = Template
+    TEMPLATE_TOKEN_CLASS = TemplateToken
+
     _tokens_key = 'tokens'
     _rules_key = 'rules'
     _keys_key = 'key'
@@ -472,10 +1223,35 @@ class NameLib(object):
     _templates_key = 'templates'
     _template_tokens_key = 'template_tokens'
 
-    def __init__(self, parser_format=None, naming_file=None):
+    def __init__(self, parser_format=None, naming_file=None, snapshot_cache=False, lazy_load=False, stream_load=False):
         self._naming_repo_env = 'NAMING_REPO'
         self._parser_format = parser_format or 'yaml'
         self._naming_file = naming_file
+        self._snapshot_cache = snapshot_cache
+        self._lazy_load = lazy_load
+        self._stream_load = stream_load
+        self._lazy_items = dict()
+        self._rules_index = NameIndex(self._rules, loader=lambda name: self._load_lazy_item(self._rules_key, name))
+        self._tokens_index = NameIndex(self._tokens, loader=lambda name: self._load_lazy_item(self._tokens_key, name))
+        self._templates_index = NameIndex(
+            self._templates, loader=lambda name: self._load_lazy_item(self._templates_key, name))
+        self._templates_tokens_index = NameIndex(
+            self._templates_tokens, loader=lambda name: self._load_lazy_item(self._template_tokens_key, name))
+        self._template_resolver = TemplateResolver(self._templates_index)
+        self._solve_plans = dict()
+        self._parse_plans = dict()
+        self._rule_matchers = dict()
+        self._template_index = None
+        self._template_index_key = None
+        self._session_file_states = dict()
+        self._session_file_items = dict()
+        self._session_entries = dict()
+        self._repo_writer = None
+        self._changes = 0
+        self._saved_state = None
+        self._save_delay = 1.0
+        self._save_timer = None
+        self._save_lock = threading.RLock()
         self.init_naming_data()
 
     @property
@@ -494,6 +1270,38 @@ class NameLib(object):
     def parser_format(self, parser_str):
         self._parser_format = parser_str
 
+    @property
+    def snapshot_cache(self):
+        return self._snapshot_cache
+
+    @snapshot_cache.setter
+    def snapshot_cache(self, flag):
+        self._snapshot_cache = bool(flag)
+
+    @property
+    def save_delay(self):
+        return self._save_delay
+
+    @save_delay.setter
+    def save_delay(self, value):
+        self._save_delay = float(value)
+
+    @property
+    def lazy_load(self):
+        return self._lazy_load
+
+    @lazy_load.setter
+    def lazy_load(self, flag):
+        self._lazy_load = bool(flag)
+
+    @property
+    def stream_load(self):
+        return self._stream_load
+
+    @stream_load.setter
+    def stream_load(self, flag):
+        self._stream_load = bool(flag)
+
     @property
     def naming_repo_env(self):
         return self._naming_repo_env
@@ -504,18 +1312,22 @@ class NameLib(object):
 
     @property
     def rules(self):
+        self._load_lazy_items(self._rules_key)
         return self._rules
 
     @property
     def tokens(self):
+        self._load_lazy_items(self._tokens_key)
         return self._tokens
 
     @property
     def templates(self):
+        self._load_lazy_items(self._templates_key)
         return self._templates
 
     @property
     def template_tokens(self):
+        self._load_lazy_items(self._template_tokens_key)
         return self._templates_tokens
 
     def has_valid_naming_file(self):
@@ -541,7 +1353,7 @@ class NameLib(object):
         Sets the current active rule
         """
 
-        if isinstance(name, Rule):
+        if isinstance(name, BaseRule):
             name = name.name
         if not self.has_rule(name):
             return False
@@ -555,21 +1367,18 @@ class NameLib(object):
         :param name: str, name of the rule
         :param flag: bool
         """
-        if not self.has_rule(name):
+        rule = self.get_rule(name)
+        if not rule:
             return
 
-        self._rules[name].set_auto_fix(flag)
+        rule.set_auto_fix(flag)
 
     def has_rule(self, name):
         """
         Get True if a rule its in the curret rules list
         """
 
-        for rule in self._rules:
-            if rule.name == name:
-                return True
-
-        return False
+        return self._rules_index.get(name) is not None
 
     def add_rule(self, name, iterator_type='@', *fields):
         """
@@ -577,9 +1386,11 @@ class NameLib(object):
         """
 
         name = self.get_rule_unique_name(name)
-        rule = Rule(name, iterator_type)
+        rule = self.RULE_CLASS(name, iterator_type)
         # rule.add_fields(fields)
         self._rules.append(rule)
+        self._rules_index.add(rule)
+        self._changes += 1
         if self.active_rule() is None:
             self.set_active_rule(name)
         return rule
@@ -592,6 +1403,8 @@ class NameLib(object):
         if self.has_rule(name):
             rule = self.get_rule(name)
             self._rules.pop(self._rules.index(rule))
+            self._rules_index.invalidate()
+            self._changes += 1
             return True
         return False
 
@@ -601,6 +1414,9 @@ class NameLib(object):
         """
 
         python.clear_list(self._rules)
+        self._rules_index.invalidate()
+        self._changes += 1
+        self._lazy_items.pop(self._rules_key, None)
         self._active_rule = None
         return True
 
@@ -609,11 +1425,7 @@ class NameLib(object):
         Gets a rule from the dictionary of rules by its name
         """
 
-        for rule in self._rules:
-            if rule.name == name:
-                return rule
-
-        return None
+        return self._rules_index.get(name)
 
     def get_rule_unique_name(self, name):
         """
@@ -622,7 +1434,7 @@ class NameLib(object):
         :return: str
         """
 
-        rule_names = [rule.name for rule in self._rules]
+        rule_names = [rule.name for rule in self.rules]
         return name_utils.get_unique_name_from_list(rule_names, name)
 
     def get_rule_by_index(self, index):
@@ -630,7 +1442,7 @@ class NameLib(object):
         Get a rule from the dictionary of rule by its index
         """
 
-        return self._rules[index]
+        return self.rules[index]
 
     def add_token(self, name, **kwargs):
         """
@@ -638,13 +1450,15 @@ class NameLib(object):
         """
 
         name = self.get_rule_unique_name(name)
-        token = Token(name)
+        token = self.TOKEN_CLASS(name)
         for k, v in kwargs.items():
             # If there is a default value we set it
             if k == 'default':
                 token.default = v
                 continue
         self._tokens.append(token)
+        self._tokens_index.add(token)
+        self._changes += 1
         return token
 
     def has_token(self, name):
@@ -652,11 +1466,7 @@ class NameLib(object):
         Get True if a token its in the current tokens list
         """
 
-        for token in self._tokens:
-            if token.name == name:
-                return True
-
-        return False
+        return self._tokens_index.get(name) is not None
 
     def remove_token(self, name):
         """
@@ -667,6 +1477,8 @@ class NameLib(object):
         if self.has_token(name):
             token = self.get_token(name)
             self._tokens.pop(self._tokens.index(token))
+            self._tokens_index.invalidate()
+            self._changes += 1
             return True
         return False
 
@@ -676,6 +1488,9 @@ class NameLib(object):
         """
 
         python.clear_list(self._tokens)
+        self._tokens_index.invalidate()
+        self._changes += 1
+        self._lazy_items.pop(self._tokens_key, None)
         return True
 
     def get_token(self, name):
@@ -683,11 +1498,7 @@ class NameLib(object):
         Get a token from the dictionary of tokens by its name
         """
 
-        for token in self._tokens:
-            if token.name == name:
-                return token
-
-        return None
+        return self._tokens_index.get(name)
 
     def get_token_unique_name(self, name):
         """
@@ -696,7 +1507,7 @@ class NameLib(object):
         :return: str
         """
 
-        token_names = [token.name for token in self._tokens]
+        token_names = [token.name for token in self.tokens]
         return name_utils.get_unique_name_from_list(token_names, name)
 
     def get_token_by_index(self, index):
@@ -704,7 +1515,7 @@ class NameLib(object):
         Get a token from the dictionary of token by its index
         """
 
-        return self._tokens[index]
+        return self.tokens[index]
 
     def add_template(self, name, pattern=''):
         """
@@ -714,8 +1525,11 @@ class NameLib(object):
         """
 
         name = self.get_template_unique_name(name)
-        template = Template(name, pattern)
+        template = self.TEMPLATE_CLASS(name, pattern)
+        template.set_resolver(self._template_resolver)
         self._templates.append(template)
+        self._templates_index.add(template)
+        self._changes += 1
 
         return template
 
@@ -724,11 +1538,7 @@ class NameLib(object):
         Get True if a template its in the current tokens list
         """
 
-        for template in self._templates:
-            if template.name == name:
-                return template
-
-        return None
+        return self._templates_index.get(name)
 
     def remove_template(self, name):
         """
@@ -738,6 +1548,8 @@ class NameLib(object):
         if self.has_template(name):
             template = self.get_template(name)
             self._templates.pop(self._templates.index(template))
+            self._templates_index.invalidate()
+            self._changes += 1
             return True
         return False
 
@@ -747,6 +1559,9 @@ class NameLib(object):
         """
 
         python.clear_list(self._templates)
+        self._templates_index.invalidate()
+        self._changes += 1
+        self._lazy_items.pop(self._templates_key, None)
         return True
 
     def get_template(self, name):
@@ -754,28 +1569,12 @@ class NameLib(object):
         Get a template from the dictionary of templates by its name
         """
 
-        template_found = None
-        for template in self._templates:
-            if template.name == name:
-                template_found = template
-                break
-
+        template_found = self._templates_index.get(name)
         if not template_found:
             return None
 
-        resolver = dict()
-        for template in self._templates:
-            if template.name == name:
-                continue
-            resolver[template.name] = template.template
-
-        for ref in template_found.references():
-            ref_template = self.get_template(ref)
-            if not ref_template:
-                continue
-            resolver[ref] = ref_template.template
-
-        template_found.set_resolver(resolver)
+        # All templates share the same resolver, references are resolved lazily when parsing/formatting
+        template_found.set_resolver(self._template_resolver)
 
         return template_found
 
@@ -786,7 +1585,7 @@ class NameLib(object):
         :return: str
         """
 
-        template_names = [template.name for template in self._templates]
+        template_names = [template.name for template in self.templates]
         return name_utils.get_unique_name_from_list(template_names, name)
 
     def get_template_by_index(self, index):
@@ -794,7 +1593,7 @@ class NameLib(object):
         Get a template from the dictionary of token by its index
         """
 
-        return self._templates[index]
+        return self.templates[index]
 
     def add_template_token(self, name, description=''):
         """
@@ -804,8 +1603,10 @@ class NameLib(object):
         """
 
         name = self.get_template_token_unique_name(name)
-        template = TemplateToken(name, description)
+        template = self.TEMPLATE_TOKEN_CLASS(name, description)
         self._templates_tokens.append(template)
+        self._templates_tokens_index.add(template)
+        self._changes += 1
 
         return template
 
@@ -814,11 +1615,7 @@ class NameLib(object):
         Get True if a template token its in the current tokens list
         """
 
-        for template_token in self._templates_tokens:
-            if template_token.name == name:
-                return True
-
-        return False
+        return self._templates_tokens_index.get(name) is not None
 
     def remove_template_token(self, name):
         """
@@ -828,6 +1625,8 @@ class NameLib(object):
         if self.has_template_token(name):
             template_token = self.get_template_token(name)
             self._templates_tokens.pop(self._templates_tokens.index(template_token))
+            self._templates_tokens_index.invalidate()
+            self._changes += 1
             return True
         return False
 
@@ -837,6 +1636,9 @@ class NameLib(object):
         """
 
         python.clear_list(self._templates_tokens)
+        self._templates_tokens_index.invalidate()
+        self._changes += 1
+        self._lazy_items.pop(self._template_tokens_key, None)
         return True
 
     def get_template_token(self, name):
@@ -846,11 +1648,7 @@ class NameLib(object):
         :return:
         """
 
-        for template_token in self._templates_tokens:
-            if template_token.name == name:
-                return template_token
-
-        return None
+        return self._templates_tokens_index.get(name)
 
     def get_template_token_unique_name(self, name):
         """
@@ -859,7 +1657,7 @@ class NameLib(object):
         :return: str
         """
 
-        template_token_names = [template_token.name for template_token in self._templates_tokens]
+        template_token_names = [template_token.name for template_token in self.template_tokens]
         return name_utils.get_unique_name_from_list(template_token_names, name)
 
     def get_template_token_by_index(self, index):
@@ -867,7 +1665,7 @@ class NameLib(object):
         Get a template token from the dictionary of token by its index
         """
 
-        return self._templates_tokens[index]
+        return self.template_tokens[index]
 
     def solve(self, *args, **kwargs):
         """
@@ -877,38 +1675,128 @@ class NameLib(object):
             - Token Management
         """
 
-        i = 0
-        values = dict()
         rule = self.active_rule()
         if not rule:
             LOGGER.warning('Impossible to solve because no rule is activated!')
             return
 
-        # Loop trough each field of the current active rule
+        solve_plan = self.get_solve_plan(rule)
+        if not solve_plan:
+            return
+
+        return solve_plan.solve(args, kwargs)
+
+    def solve_many(self, records, stream=False):
+        """
+        Solves many names at once with the current active rule
+        Rule, tokens and solve plan are resolved only once and shared by all the records
+        :param records: list or dict, records to solve. It can be:
+            - an iterable where each record is a dict of keyword values, a list/tuple of positional values, a
+              (positional values, keyword values) tuple or a string, that is used as a single positional value
+            - a dict of lists (field name -> values) where all the lists have the same length
+        :param stream: bool, if True a generator is returned instead of a list
+        :return: list(str) or generator
+        """
+
+        if isinstance(records, dict):
+            columns = list(records.values())
+            if len(set(len(column) for column in columns)) > 1:
+                raise ValueError('All columns must have the same number of values to solve names!')
+
+        solve_plan = None
+        rule = self.active_rule()
+        if not rule:
+            LOGGER.warning('Impossible to solve because no rule is activated!')
+        else:
+            solve_plan = self.get_solve_plan(rule)
+
+        names = self._solve_records(solve_plan, records)
+
+        return names if stream else list(names)
+
+    def get_solve_plan(self, rule):
+        """
+        Returns the solve plan used to solve names with the given rule
+        Plans are cached and only compiled again when the rule or its tokens change
+        :param rule: Rule
+        :return: SolvePlan or None
+        """
+
+        return self._get_rule_plan(rule, SolvePlan, self._solve_plans)
+
+    def get_parse_plan(self, rule):
+        """
+        Returns the parse plan used to parse names with the given rule
+        Plans are cached and only compiled again when the rule or its tokens change
+        :param rule: Rule
+        :return: ParsePlan or None
+        """
+
+        return self._get_rule_plan(rule, ParsePlan, self._parse_plans)
+
+    def get_rule_matcher(self, rule):
+        """
+        Returns the matcher used to parse names with the given rule using a single regular expression
+        Matchers are cached and only compiled again when the rule or its tokens change
+        :param rule: Rule
+        :return: RuleMatcher or None
+        """
+
+        return self._get_rule_plan(rule, RuleMatcher, self._rule_matchers)
+
+    def _get_rule_plan(self, rule, plan_class, plans):
+        """
+        Internal function that returns a cached plan for the given rule or compiles a new one
+        :param rule: Rule
+        :param plan_class: type, RulePlan subclass to compile
+        :param plans: dict, cache of plans of the given class
+        :return: RulePlan or None
+        """
+
+        tokens_version = self._tokens_index.version
+        plan = plans.get(rule.name)
+        if plan and plan.is_valid(rule, tokens_version):
+            return plan
+
+        tokens = list()
         for f in rule.fields():
-            # Get tpToken object from the dictionary of tokens
-            if self.has_token(f):
-                token = self.get_token(f)
-                if token.is_required():
-                    # We are in a required token (a token is required if it does not has default value)
-                    if kwargs.get(f) is not None:
-                        # If the field is in the keywords passed, we get its value
-                        values[f] = kwargs[f]
-                        continue
-                    else:
-                        # Else, we get the passed argument (without using keyword)
-                        try:
-                            values[f] = args[i]
-                        except Exception:
-                            values[f] = None
-                        i += 1
-                        continue
-                # If all fails, we try to get the field for the token
-                values[f] = token.solve(rule, kwargs.get(f))
-            else:
+            token = self.get_token(f)
+            if not token:
                 LOGGER.warning('Expression not valid: token {} not found in tokens list'.format(f))
-                return
-        return rule.solve(**values)
+                return None
+            tokens.append(token)
+
+        plan = plan_class(rule, tokens, tokens_version=tokens_version)
+        plans[rule.name] = plan
+
+        return plan
+
+    def _solve_records(self, solve_plan, records):
+        """
+        Internal generator that solves the given records with the given solve plan
+        :param solve_plan: SolvePlan or None
+        :param records: list or dict
+        :return: generator
+        """
+
+        if isinstance(records, dict):
+            fields = list(records.keys())
+            records = (dict(zip(fields, row)) for row in zip(*[records[field] for field in fields]))
+
+        for record in records:
+            if not solve_plan:
+                yield None
+                continue
+            if isinstance(record, dict):
+                args, kwargs = (), record
+            elif isinstance(record, six.string_types):
+                # Strings are a single value, not a sequence of values
+                args, kwargs = (record,), dict()
+            elif len(record) == 2 and isinstance(record[0], (list, tuple)) and isinstance(record[1], dict):
+                args, kwargs = record
+            else:
+                args, kwargs = record, dict()
+            yield solve_plan.solve(args, kwargs)
 
     def parse_field_from_string(self, string_to_parse, field_name):
         active_rule = self.active_rule()
@@ -944,10 +1832,65 @@ class NameLib(object):
             - Implicit Conversion
         """
 
-        # Parse name comparing it with the active rule
+        # Parse name comparing it with the active rule. Parse plan only takes the tokens used by the rule, so lazy
+        # loaded sessions do not create all their tokens
+        rule = self.active_rule()
+        parse_plan = self.get_parse_plan(rule) if rule else None
+        if not parse_plan:
+            return rule.parse(name, tokens=self.tokens)
+
+        return parse_plan.parse(name)
+
+    def match(self, name, get_keys=False):
+        """
+        Parses a solved name with a single regular expression match against the active rule
+        Contrary to parse, values containing underscores are supported and names that do not match the rule return
+        None instead of partial data
+        :param name: str
+        :param get_keys: bool, whether to return token keys instead of token values
+        :return: OrderedDict or None
+        """
+
+        rule = self.active_rule()
+        if not rule:
+            LOGGER.warning('Impossible to parse because no rule is activated!')
+            return None
+
+        rule_matcher = self.get_rule_matcher(rule)
+        if not rule_matcher:
+            return None
+
+        return rule_matcher.match(name, get_keys=get_keys)
+
+    def parse_many(self, names, get_keys=False, columnar=False):
+        """
+        Parses many names at once with the current active rule
+        Token reverse tables are computed only once and shared by all the names
+        :param names: iterable(str)
+        :param get_keys: bool, whether to return token keys instead of token values
+        :param columnar: bool, if True a dict of lists (field -> values) is returned instead of a list of dicts
+        :return: list(OrderedDict) or OrderedDict(str, list)
+        """
+
         rule = self.active_rule()
+        if not rule:
+            LOGGER.warning('Impossible to parse because no rule is activated!')
+            return OrderedDict() if columnar else list()
+
+        parse_plan = self.get_parse_plan(rule)
+        if not parse_plan:
+            raise Exception('Not token found for some of the fields of rule: {}'.format(rule.name))
+
+        fields = parse_plan.fields
+        if not columnar:
+            return [OrderedDict(zip(fields, parse_plan.parse_values(name, get_keys=get_keys))) for name in names]
+
+        columns = [list() for _ in fields]
+        for name in names:
+            for column, value in zip(columns, parse_plan.parse_values(name, get_keys=get_keys)):
+                column.append(value)
 
-        return rule.parse(name, tokens=self._tokens)
+        return OrderedDict(zip(fields, columns))
 
     def init_naming_data(self):
         """
@@ -967,16 +1910,19 @@ class NameLib(object):
                     self._naming_file))
             return None
 
-        if self._parser_format == 'yaml':
-            data = yamlio.read_file(self.naming_file)
+        if self._stream_load and not self._lazy_load:
+            # Huge naming files are not completely loaded just to check whether they contain data
+            data = os.path.getsize(self._naming_file)
         else:
-            data = jsonio.read_file(self._naming_file)
+            data = self.load_naming_data()
         if not data:
             data = self.DEFAULT_DATA
-            if self._parser_format == 'yaml':
-                yamlio.write_to_file(data, self._naming_file)
-            else:
-                jsonio.write_to_file(data, self._naming_file)
+            self._get_serializer().write_file(data, self._naming_file)
+        elif isinstance(data, dict):
+            # Naming data is already read, so the naming file is not parsed again
+            with self._save_lock:
+                self._load_session(naming_data=data)
+                self._saved_state = self._get_data_state()
         else:
             self.load_session()
 
@@ -1024,12 +1970,15 @@ class NameLib(object):
                 'Impossible to read naming file because naming file: "{}" does not exists!'.format(self._naming_file))
             return None
 
+        if not os.path.getsize(self._naming_file):
+            return None
+
         try:
-            if self._parser_format == 'yaml':
-                data = yamlio.read_file(self._naming_file)
-            else:
-                data = jsonio.read_file(self._naming_file)
-            return data
+            reader = self._get_serializer().read_file
+            if self._snapshot_cache:
+                # Parsed data is stored in a binary snapshot, so files are only parsed again when they change
+                return snapshotcache.read_file(self._naming_file, reader, key=self._parser_format)
+            return reader(self._naming_file)
         except Exception as exc:
             LOGGER.error(
                 'Impossible to read naming file "{}": {} | {}'.format(self._naming_file, exc, traceback.format_exc()))
@@ -1047,13 +1996,22 @@ class NameLib(object):
             return None
 
         try:
-            if self._parser_format == 'yaml':
-                yamlio.write_to_file(data, self._naming_file)
-            else:
-                jsonio.write_to_file(data, self._naming_file)
+            self._get_serializer().write_file(data, self._naming_file)
         except Exception as exc:
             LOGGER.error(
                 'Impossible to read naming file "{}": {} | {}'.format(self._naming_file, exc, traceback.format_exc()))
+            return False
+
+        return True
+
+    def _get_serializer(self):
+        """
+        Internal function that returns the serializer used to read and write files with current parser format
+        If no serializer is registered for current parser format, JSON one is used
+        :return: serialization.Serializer
+        """
+
+        return serialization.get_serializer(self._parser_format)
 
     # def save_rule(self, name, filepath):
     #     """
@@ -1075,15 +2033,8 @@ class NameLib(object):
         Loads a serialized rule from a JSON and deserialize it and creates a new one
         """
 
-        if not os.path.isfile(filepath):
-            return False
-        try:
-            with open(filepath) as fp:
-                if self._parser_format == 'yaml':
-                    data = yaml.safe_load(fp)
-                else:
-                    data = json.load(fp)
-        except Exception:
+        data = self._read_data_file(filepath)
+        if data is None:
             return False
 
         return self.load_rule_from_dict(data, skip_check=skip_check)
@@ -1095,8 +2046,10 @@ class NameLib(object):
         :return: bool
         """
 
-        rule = Rule.from_data(rule_dict, skip_check=skip_check)
+        rule = self.RULE_CLASS.from_data(rule_dict, skip_check=skip_check)
         self._rules.append(rule)
+        self._rules_index.add(rule)
+        self._changes += 1
 
         return True
 
@@ -1120,15 +2073,8 @@ class NameLib(object):
         Loads a serialized token from a JSON and deserialize it and creates a new one
         """
 
-        if not os.path.isfile(filepath):
-            return False
-        try:
-            with open(filepath) as fp:
-                if self._parser_format == 'yaml':
-                    data = yaml.safe_load(fp)
-                else:
-                    data = json.load(fp)
-        except Exception:
+        data = self._read_data_file(filepath)
+        if data is None:
             return False
 
         return self.load_token_from_dict(data, skip_check=skip_check)
@@ -1140,11 +2086,26 @@ class NameLib(object):
         :return: bool
         """
 
-        token = Token.from_data(token_dict, skip_check=skip_check)
+        token = self.TOKEN_CLASS.from_data(token_dict, skip_check=skip_check)
         self._tokens.append(token)
+        self._tokens_index.add(token)
+        self._changes += 1
 
         return True
 
+    def load_template(self, filepath, skip_check=False):
+        """
+        Loads a serialized template from a file and deserialize it and creates a new one
+        :param filepath: str
+        :return: bool
+        """
+
+        data = self._read_data_file(filepath)
+        if data is None:
+            return False
+
+        return self.load_template_from_dict(data, skip_check=skip_check)
+
     def load_template_from_dict(self, template_dict, skip_check=False):
         """
         Loads a new template from a given serialized dict
@@ -1152,11 +2113,27 @@ class NameLib(object):
         :return: bool
         """
 
-        template = Template.from_data(template_dict, skip_check=skip_check)
+        template = self.TEMPLATE_CLASS.from_data(template_dict, skip_check=skip_check)
+        template.set_resolver(self._template_resolver)
         self._templates.append(template)
+        self._templates_index.add(template)
+        self._changes += 1
 
         return True
 
+    def load_template_token(self, filepath, skip_check=False):
+        """
+        Loads a serialized template token from a file and deserialize it and creates a new one
+        :param filepath: str
+        :return: bool
+        """
+
+        data = self._read_data_file(filepath)
+        if data is None:
+            return False
+
+        return self.load_template_token_from_dict(data, skip_check=skip_check)
+
     def load_template_token_from_dict(self, template_token_dict, skip_check=False):
         """
         Loads a new template token from a given serialized dict
@@ -1164,8 +2141,10 @@ class NameLib(object):
         :return: bool
         """
 
-        template_token = TemplateToken.from_data(template_token_dict, skip_check=skip_check)
+        template_token = self.TEMPLATE_TOKEN_CLASS.from_data(template_token_dict, skip_check=skip_check)
         self._templates_tokens.append(template_token)
+        self._templates_tokens_index.add(template_token)
+        self._changes += 1
 
         return True
 
@@ -1180,11 +2159,11 @@ class NameLib(object):
         if not self.templates:
             return False
 
-        for template in self.templates:
-            if template.name == template_name:
-                return template.parse(path_to_parse)
+        template = self._templates_index.get(template_name)
+        if not template:
+            return None
 
-        return None
+        return template.parse(path_to_parse)
 
     def check_template_validity(self, template_name, path_to_check):
         """
@@ -1194,11 +2173,11 @@ class NameLib(object):
         :return: bool
         """
 
-        parse = self.parse_template(template_name, path_to_check)
-        if parse is not None and type(parse) is dict:
-            return True
+        template = self._templates_index.get(template_name)
+        if not template:
+            return False
 
-        return False
+        return template.match(path_to_check)
 
     def format_template(self, template_name, template_tokens):
         """
@@ -1208,37 +2187,155 @@ class NameLib(object):
         :return: str
         """
 
-        templates = self.templates
-        if not templates:
+        if not self.templates:
             return False
 
-        for template in templates:
-            if template.name == template_name:
-                return template.format(template_tokens)
+        template = self._templates_index.get(template_name)
+        if not template:
+            return None
+
+        return template.format(template_tokens)
 
-        return None
+    def get_template_index(self):
+        """
+        Returns index used to classify paths against all the templates at once
+        Index is cached and only built again when templates are added, removed or edited. When classifying lots of
+        paths, it is recommended to get the index once and use it directly
+        :return: TemplateIndex
+        """
+
+        self._load_lazy_items(self._templates_key)
+        index_key = (self._templates_index.version, BaseTemplate.get_templates_version())
+        if self._template_index is None or self._template_index_key != index_key:
+            for template in self._templates:
+                template.set_resolver(self._template_resolver)
+            self._template_index = templateindex.TemplateIndex([template.template for template in self._templates])
+            self._template_index_key = index_key
+
+        return self._template_index
+
+    def classify_path(self, path):
+        """
+        Returns the first template that matches given path and the data parsed from it
+        :param path: str
+        :return: tuple(Template, dict) or None
+        """
+
+        result = self.get_template_index().match(path)
+        if result is None:
+            return None
+
+        return self._templates[result[0]], result[1]
+
+    def parse_paths(self, paths, processes=None, chunk_size=1000):
+        """
+        Classifies lots of paths against all the templates using multiple processes
+        :param paths: iterable(str)
+        :param processes: int or None, number of worker processes. If None, the number of CPUs is used. If 1 or 0,
+            paths are parsed in current process
+        :param chunk_size: int, number of paths sent to a worker process at once
+        :return: generator(tuple(str, dict) or None), template name and parsed data of each path (in the same order
+            as given paths) or None if a path does not match any template
+        """
+
+        # Imported here, so worker processes support is only loaded when it is used
+        from tpDcc.libs.nameit.core import bulkparse
+
+        return bulkparse.parse_paths(self.get_template_index(), paths, processes=processes, chunk_size=chunk_size)
+
+    def crawl(self, roots, max_workers=None, include_directories=True, prune=True, follow_symlinks=False):
+        """
+        Walks given roots and yields the paths that match any of the templates
+        :param roots: str or list(str), root directories to walk
+        :param max_workers: int or None, number of threads used to scan directories
+        :param include_directories: bool, whether directories should be classified or only files
+        :param prune: bool, whether to skip directories whose paths cannot be matched by any template
+        :param follow_symlinks: bool, whether symbolic links to directories should be walked
+        :return: generator(tuple(str, str, dict)), path, template name and parsed data of each matched path
+        """
+
+        # Imported here, so optional dependencies (concurrent.futures and scandir backports in Python 2) are only
+        # required when crawling
+        from tpDcc.libs.nameit.core import crawler
+
+        return crawler.crawl(
+            roots, self.get_template_index(), max_workers=max_workers, include_directories=include_directories,
+            prune=prune, follow_symlinks=follow_symlinks)
 
     def get_repo(self):
         env_repo = os.environ.get(self._naming_repo_env)
         local_repo = os.path.join(os.path.expanduser('~'), '.config', 'naming')
         return env_repo, local_repo
 
+    def is_dirty(self):
+        """
+        Returns whether naming data changed since the session was loaded or saved
+        Changes done through naming library functions and changes of the attributes of rules, tokens, templates and
+        template tokens are tracked. If items lists are modified directly, mark_dirty should be called
+        :return: bool
+        """
+
+        return self._saved_state != self._get_data_state()
+
+    def mark_dirty(self):
+        """
+        Forces naming data to be saved next time the session is saved
+        """
+
+        self._changes += 1
+
     def load_session(self, repo=None):
+        """
+        Loads the session from the naming file or, if there is no valid naming file, from the directory repository
+        :param repo: str or None, directory repository used if there is no valid naming file
+        """
 
-        self._active_rule = ''
-        python.clear_list(self._rules)
-        python.clear_list(self._tokens)
-        python.clear_list(self._templates)
-        python.clear_list(self._templates_tokens)
+        with self._save_lock:
+            result = self._load_session(repo=repo)
+            self._saved_state = self._get_data_state()
+
+        return result
+
+    def _load_session(self, repo=None, naming_data=None):
+        """
+        Internal function that loads the session
+        :param repo: str or None, directory repository used if there is no valid naming file
+        :param naming_data: dict or None, already read naming data of the naming file. If None, naming file is read
+        :return: bool or None
+        """
+
+        if self.has_valid_naming_file() and self._stream_load and not self._lazy_load:
+            LOGGER.info('Loading session from Naming File: {}'.format(self._naming_file))
+            return self._stream_session_file()
+
+        self._clear_session()
 
         if self.has_valid_naming_file():
             LOGGER.info('Loading session from Naming File: {}'.format(self._naming_file))
 
-            naming_data = self.load_naming_data()
+            self._update_session_file_state(self._naming_file)
+            if naming_data is None:
+                naming_data = self.load_naming_data()
             if not naming_data:
                 LOGGER.warning('No naming data found!')
                 return
 
+            # Hashes of loaded entries are stored to know which entries change when reloading the session. They are
+            # computed before creating the objects, because loaded objects share their data containers with the
+            # naming data
+            for section in (self._rules_key, self._tokens_key, self._templates_key, self._template_tokens_key):
+                self._session_entries[section] = self._get_session_entries(naming_data.get(section))
+
+            if self._lazy_load:
+                # Objects are only created when they are requested
+                for section in (self._rules_key, self._tokens_key, self._templates_key, self._template_tokens_key):
+                    entries = [(item_data.get('name'), item_data) for item_data in naming_data.get(section) or list()]
+                    pending = dict()
+                    for name, item_data in entries:
+                        pending.setdefault(name, item_data)
+                    self._lazy_items[section] = {'entries': entries, 'pending': pending, 'loaded': dict()}
+                return True
+
             rules = naming_data.get(self._rules_key)
             if rules:
                 for rule_data in rules:
@@ -1260,71 +2357,628 @@ class NameLib(object):
                     self.load_template_token_from_dict(template_token_data, skip_check=True)
 
         else:
-            repo = repo or self.get_repo()
+            repo = self._get_repo_path(repo)
             if not os.path.exists(repo):
                 os.mkdir(repo)
 
             LOGGER.info('Loading session from directory files: {}'.format(repo))
 
-            # Tokens and rules
+            # Tokens, rules, templates and template tokens
+            loaders = {
+                self._rules_key: self.load_rule,
+                self._tokens_key: self.load_token,
+                self._templates_key: self.load_template,
+                self._template_tokens_key: self.load_template_token
+            }
+            repo_sections = self._get_repo_sections()
             for dir_path, dir_names, file_names in os.walk(repo):
                 for file_name in file_names:
+                    section = repo_sections.get(os.path.splitext(file_name)[1])
+                    if not section:
+                        continue
                     file_path = os.path.join(dir_path, file_name)
-                    if file_name.endswith('.token'):
-                        self.load_token(file_path)
-                    elif file_name.endswith('.rule'):
-                        self.load_rule(file_path)
+                    self._update_session_file_state(file_path)
+                    if loaders[section](file_path):
+                        item = self._get_section_items(section)[0][-1]
+                        self._session_file_items[file_path] = (item, item.version)
 
             # Extra configuration
             file_path = os.path.join(repo, 'naming.conf')
             if os.path.exists(file_path):
-                with open(file_path) as fp:
-                    if self._parser_format == 'yaml':
-                        config = yaml.safe_load(fp)
-                    else:
-                        config = json.load(fp)
-                for k, v in config.items():
-                    globals()[k](v)
+                self._update_session_file_state(file_path)
+                self._load_session_config(file_path)
+            return True
+
+    def _clear_session(self):
+        """
+        Internal function that removes all the naming data of the session
+        """
+
+        self._active_rule = ''
+        self._session_file_states.clear()
+        self._session_file_items.clear()
+        self._session_entries.clear()
+        self._lazy_items.clear()
+        python.clear_list(self._rules)
+        python.clear_list(self._tokens)
+        python.clear_list(self._templates)
+        python.clear_list(self._templates_tokens)
+        self._rules_index.invalidate()
+        self._tokens_index.invalidate()
+        self._templates_index.invalidate()
+        self._templates_tokens_index.invalidate()
+
+    def _stream_session_file(self):
+        """
+        Internal function that loads the session from the naming file reading its items one at a time
+        Naming data is never completely loaded in memory, so peak memory usage is bounded when loading huge naming
+        files. Snapshot cache is not used, because it keeps the complete naming data in memory. Current session is
+        only replaced once the complete naming file is read, so it is kept if the naming file is not valid
+        :return: bool or None
+        """
+
+        if not os.path.getsize(self._naming_file):
+            self._clear_session()
+            self._update_session_file_state(self._naming_file)
+            LOGGER.warning('No naming data found!')
+            return
+
+        file_state = self._session_file_states.get(self._naming_file)
+        self._update_session_file_state(self._naming_file)
+        sections = self._read_session_file()
+        if sections is None:
+            self._restore_session_file_state(self._naming_file, file_state)
+            return
+
+        file_state = self._session_file_states[self._naming_file]
+        self._clear_session()
+        self._session_file_states[self._naming_file] = file_state
+        for section, (new_items, entries) in sections.items():
+            self._set_section_items(section, new_items)
+            self._session_entries[section] = entries
+        self._changes += 1
+
+        return True
+
+    def reload_session(self, repo=None):
+        """
+        Reloads the session only reading and deserializing the naming data that changed since it was loaded
+        Objects whose data did not change are kept, so their cached data (compiled templates, token tables, ...) is
+        reused. Files are compared by modification time and size and, if those changed, by content hash
+        Changes that were not saved are discarded: objects modified since the session was loaded or saved are created
+        again from the stored data, objects added are removed and objects removed are created again
+        :param repo: str or None, directory repository used if there is no valid naming file
+        :return: bool, True if some data was reloaded or False otherwise
+        """
+
+        if not self._session_file_states:
+            self.load_session(repo=repo)
+            return True
+
+        with self._save_lock:
+            discard_changes = self.is_dirty()
+            if self.has_valid_naming_file():
+                changed = self._reload_session_file(discard_changes=discard_changes)
+            else:
+                changed = self._reload_session_directory(
+                    self._get_repo_path(repo), discard_changes=discard_changes)
+            if changed is None:
+                # Session could not be reloaded, so it is kept as it was
+                return False
+            self._saved_state = self._get_data_state()
+
+        return changed or discard_changes
+
+    def _reload_session_file(self, discard_changes=False):
+        """
+        Internal function that reloads the entries of the naming file that changed since last load
+        If the naming file cannot be read, current session is kept
+        :param discard_changes: bool, whether there are changes that were not saved. If False and naming file did not
+            change, naming file is not read
+        :return: bool or None, None if the naming file cannot be read
+        """
+
+        file_state = self._session_file_states.get(self._naming_file)
+        if not self._update_session_file_state(self._naming_file) and not discard_changes:
+            return False
+
+        # Compared objects need to exist
+        self._load_lazy_items()
+
+        LOGGER.info('Reloading session from Naming File: {}'.format(self._naming_file))
+
+        sections = self._read_session_file(self._session_entries)
+        if sections is None:
+            # Naming file is read again next time the session is reloaded
+            self._restore_session_file_state(self._naming_file, file_state)
+            return None
+
+        changed = False
+        for section, (new_items, entries) in sections.items():
+            self._session_entries[section] = entries
+            changed = self._set_section_items(section, new_items) or changed
+
+        return changed
+
+    def _read_session_file(self, previous_entries=None):
+        """
+        Internal function that reads the objects of the naming file without modifying current session
+        Objects of the given entries whose data did not change and that were not modified since they were loaded are
+        reused. If the session is streamed, naming file items are read one at a time
+        :param previous_entries: dict(str, dict(str, tuple(str, int))) or None, data hash and object version of the
+            loaded entries of each section
+        :return: dict(str, tuple(list, dict)) or None, objects and entries of each section. None if the naming file
+            cannot be read
+        """
+
+        previous_entries = previous_entries or dict()
+        sections = dict(
+            (section, (list(), dict())) for section in (
+                self._rules_key, self._tokens_key, self._templates_key, self._template_tokens_key))
+        try:
+            if self._stream_load and not self._lazy_load:
+                items_data = streaming.iter_naming_data(
+                    self._naming_file, self._get_serializer().format_name, list(sections))
+            else:
+                naming_data = self.load_naming_data()
+                if not naming_data:
+                    LOGGER.warning('No naming data found!')
+                    return None
+                items_data = (
+                    (section, item_data) for section in sections for item_data in naming_data.get(section) or list())
+
+            for section, item_data in items_data:
+                if section not in sections or not isinstance(item_data, dict):
+                    continue
+                new_items, entries = sections[section]
+                _, index, item_class = self._get_section_items(section)
+                name = item_data.get('name')
+                data_hash = serialization.get_data_hash(item_data)
+                previous_entry = previous_entries.get(section, dict()).get(name)
+                # Only first entry with each name can reuse its object
+                item = None
+                if previous_entry and previous_entry[0] == data_hash and name not in entries:
+                    item = index.get(name)
+                # Objects modified after loading the session are created again
+                if item is None or item.version != previous_entry[1]:
+                    item = self._create_item(item_class, item_data)
+                entries[name] = (data_hash, item.version)
+                new_items.append(item)
+        except Exception as exc:
+            LOGGER.error(
+                'Impossible to read naming file "{}": {} | {}'.format(self._naming_file, exc, traceback.format_exc()))
+            return None
+
+        return sections
+
+    def _set_section_items(self, section, new_items):
+        """
+        Internal function that replaces the objects of the given naming data section
+        :param section: str
+        :param new_items: list
+        :return: bool, True if objects changed or False otherwise
+        """
+
+        items, index, _ = self._get_section_items(section)
+        if len(new_items) == len(items) and all(item is new_item for item, new_item in zip(items, new_items)):
+            return False
+
+        python.clear_list(items)
+        items.extend(new_items)
+        index.invalidate()
+
+        return True
+
+    def _reload_session_directory(self, repo, discard_changes=False):
+        """
+        Internal function that reloads the token, rule, template and template token files of the given directory that
+        changed since last load
+        :param repo: str
+        :param discard_changes: bool, whether there are changes that were not saved. If True, extra configuration is
+            loaded even if it did not change
+        :return: bool or None, None if the directory does not exist
+        """
+
+        if not os.path.isdir(repo):
+            return None
+
+        file_items = dict()
+        repo_sections = self._get_repo_sections()
+        section_items = dict((section, list()) for section in repo_sections.values())
+        for dir_path, dir_names, file_names in os.walk(repo):
+            for file_name in file_names:
+                section = repo_sections.get(os.path.splitext(file_name)[1])
+                if not section:
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                item, version = self._session_file_items.get(file_path, (None, None))
+                # Objects modified after loading the session are created again
+                if self._update_session_file_state(file_path) or item is None or item.version != version:
+                    data = self._read_data_file(file_path)
+                    item = self._get_section_items(section)[2].from_data(data) if data else None
+                    if isinstance(item, BaseTemplate):
+                        item.set_resolver(self._template_resolver)
+                if item is None:
+                    continue
+                file_items[file_path] = (item, item.version)
+                section_items[section].append(item)
+
+        for file_path in set(self._session_file_items) - set(file_items):
+            self._session_file_states.pop(file_path, None)
+        self._session_file_items = file_items
+
+        changed = False
+        for section, new_items in section_items.items():
+            items, index, _ = self._get_section_items(section)
+            # Files are walked in arbitrary order, so current order is kept if the same objects are loaded
+            if set(id(item) for item in items) != set(id(item) for item in new_items):
+                python.clear_list(items)
+                items.extend(new_items)
+                index.invalidate()
+                changed = True
+
+        file_path = os.path.join(repo, 'naming.conf')
+        if os.path.exists(file_path) and (self._update_session_file_state(file_path) or discard_changes):
+            self._load_session_config(file_path)
+            changed = True
+
+        return changed
+
+    def _get_repo_sections(self):
+        """
+        Internal function that returns the naming data section stored in each file extension of directory repositories
+        :return: dict(str, str)
+        """
+
+        return {
+            '.rule': self._rules_key,
+            '.token': self._tokens_key,
+            '.template': self._templates_key,
+            '.template_token': self._template_tokens_key
+        }
+
+    def _get_section_items(self, section):
+        """
+        Internal function that returns the items list, index and class of the given naming data section
+        :param section: str
+        :return: tuple(list, NameIndex, type)
+        """
+
+        return {
+            self._rules_key: (self._rules, self._rules_index, self.RULE_CLASS),
+            self._tokens_key: (self._tokens, self._tokens_index, self.TOKEN_CLASS),
+            self._templates_key: (self._templates, self._templates_index, self.TEMPLATE_CLASS),
+            self._template_tokens_key: (self._templates_tokens, self._templates_tokens_index, self.TEMPLATE_TOKEN_CLASS)
+        }[section]
+
+    def _create_item(self, item_class, item_data):
+        """
+        Internal function that creates an object from the data of a naming data entry
+        :param item_class: type
+        :param item_data: dict
+        :return: object
+        """
+
+        item = item_class.from_data(item_data, skip_check=True)
+        if isinstance(item, BaseTemplate):
+            item.set_resolver(self._template_resolver)
+
+        return item
+
+    def _load_lazy_item(self, section, name):
+        """
+        Internal function that creates the object of a lazy loaded naming data entry with the given name
+        :param section: str
+        :param name: str
+        :return: object or None
+        """
+
+        lazy_items = self._lazy_items.get(section)
+        if not lazy_items:
+            return None
+        item_data = lazy_items['pending'].pop(name, None)
+        if item_data is None:
+            return None
+
+        items, index, item_class = self._get_section_items(section)
+        item = self._create_item(item_class, item_data)
+        lazy_items['loaded'][name] = item
+        items.append(item)
+        index.add(item)
+
+        return item
+
+    def _load_lazy_items(self, section=None):
+        """
+        Internal function that creates the objects of all the lazy loaded naming data entries
+        Objects are sorted in the same order as the naming data entries. Objects added after loading the session are
+        kept at the end and objects removed after loading the session are not created again
+        :param section: str or None, section to load. If None, all sections are loaded
+        """
+
+        if section is None:
+            for section in list(self._lazy_items.keys()):
+                self._load_lazy_items(section)
+            return
+
+        lazy_items = self._lazy_items.pop(section, None)
+        if not lazy_items:
+            return
+
+        items, index, item_class = self._get_section_items(section)
+        loaded = lazy_items['loaded']
+        current_items = set(id(item) for item in items)
+        new_items = list()
+        names = set()
+        for name, item_data in lazy_items['entries']:
+            # Only first entry with each name can be already created
+            if name not in names and name in loaded:
+                if id(loaded[name]) in current_items:
+                    new_items.append(loaded[name])
+            else:
+                new_items.append(self._create_item(item_class, item_data))
+            names.add(name)
+        lazy_ids = set(id(item) for item in new_items)
+        new_items.extend(item for item in items if id(item) not in lazy_ids)
+
+        python.clear_list(items)
+        items.extend(new_items)
+        index.invalidate()
+
+    def _get_session_entries(self, items_data):
+        """
+        Internal function that returns the hashes of the given loaded naming data entries
+        Objects are created from loaded entries, so their version is the initial one
+        :param items_data: list(dict) or None
+        :return: dict(str, tuple(str, int)), data hash and object version of each entry name
+        """
+
+        return dict(
+            (item_data.get('name'), (serialization.get_data_hash(item_data), 0)) for item_data in items_data or list())
+
+    def _restore_session_file_state(self, file_path, file_state):
+        """
+        Internal function that restores a previously stored state of the given session file
+        :param file_path: str
+        :param file_state: tuple or None, stored state. If None, the state of the file is removed
+        """
+
+        if file_state is None:
+            self._session_file_states.pop(file_path, None)
+        else:
+            self._session_file_states[file_path] = file_state
+
+    def _update_session_file_state(self, file_path):
+        """
+        Internal function that stores the current state of the given session file
+        :param file_path: str
+        :return: bool, True if the file changed since its state was stored last time or False otherwise
+        """
+
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            self._session_file_states.pop(file_path, None)
             return True
 
-    def save_session(self, repo=None):
+        previous_state = self._session_file_states.get(file_path)
+        if previous_state and previous_state[:2] == (file_stat.st_mtime, file_stat.st_size):
+            return False
+
+        file_hash = snapshotcache.get_file_hash(file_path)
+        self._session_file_states[file_path] = (file_stat.st_mtime, file_stat.st_size, file_hash)
+
+        return not previous_state or previous_state[2] != file_hash
+
+    def _load_session_config(self, file_path):
+        """
+        Internal function that loads the extra configuration file of a directory repository
+        :param file_path: str
+        """
+
+        config = self._read_data_file(file_path) or dict()
+        for k, v in config.items():
+            if not hasattr(self, k):
+                LOGGER.warning('Invalid naming configuration option: {}'.format(k))
+                continue
+            getattr(self, k)(v)
+
+    def _read_data_file(self, file_path):
+        """
+        Internal function that reads the serialized data of the given file
+        :param file_path: str
+        :return: dict or None
+        """
+
+        if not os.path.isfile(file_path):
+            return None
+        try:
+            return self._get_serializer().read_file(file_path)
+        except Exception:
+            return None
+
+    def _get_repo_path(self, repo=None):
+        """
+        Internal function that returns the directory repository path that should be used
+        :param repo: str or None
+        :return: str
+        """
+
+        if repo:
+            return repo
+
+        env_repo, local_repo = self.get_repo()
+
+        return env_repo or local_repo
+
+    def save_session(self, repo=None, force=False):
+        """
+        Saves the session into the naming file or, if there is no valid naming file, into the directory repository
+        :param repo: str or None, directory repository used if there is no valid naming file
+        :param force: bool, whether to save the session even if naming data did not change since last save
+        :return: bool, True if the session was saved or False otherwise
+        """
+
+        with self._save_lock:
+            state = self._get_data_state()
+            if not force and state == self._saved_state:
+                LOGGER.debug('Session not saved because naming data did not change')
+                return False
+
+            result = self._save_session(repo=repo)
+            if result:
+                self._saved_state = state
+
+        return result
+
+    def schedule_save(self, repo=None, delay=None):
+        """
+        Saves the session in a background thread after the given delay
+        If a save is scheduled again before the delay expires, the previous one is cancelled, so many edits done in
+        quick succession are saved only once. Pending saves are done when the interpreter exits
+        :param repo: str or None, directory repository used if there is no valid naming file
+        :param delay: float or None, seconds to wait before saving. If None, save_delay is used
+        """
+
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(
+                self._save_delay if delay is None else delay, self._run_scheduled_save, args=(repo,))
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            _PENDING_SAVES.add(self)
+
+    def flush_save(self):
+        """
+        Saves the session immediately if there is a scheduled save pending
+        :return: bool, True if the session was saved or False otherwise
+        """
+
+        with self._save_lock:
+            if self._save_timer is None:
+                return False
+            self._save_timer.cancel()
+            repo = self._save_timer.args[0]
+            self._save_timer = None
+            _PENDING_SAVES.discard(self)
+
+            return self.save_session(repo=repo)
+
+    def _run_scheduled_save(self, repo):
+        """
+        Internal function that saves the session when a scheduled save delay expires
+        :param repo: str or None
+        """
+
+        with self._save_lock:
+            if self._save_timer is None or self._save_timer is not threading.current_thread():
+                # Save was cancelled or flushed while waiting for the lock
+                return
+            self._save_timer = None
+            _PENDING_SAVES.discard(self)
+            try:
+                self.save_session(repo=repo)
+            except Exception as exc:
+                LOGGER.error('Impossible to save naming session: {} | {}'.format(exc, traceback.format_exc()))
+
+    def _get_data_state(self):
+        """
+        Internal function that returns a value that changes every time naming data changes
+        Changed objects always get a version greater than any other version, so the greatest version changes every
+        time an object changes. Token values edited in place are detected when token versions are read. Objects added
+        or removed are tracked by the changes counter
+        :return: tuple
+        """
+
+        last_version = 0
+        for items in (self._rules, self._tokens, self._templates, self._templates_tokens):
+            last_version = max(last_version, max([getattr(item, 'version', 0) for item in items] or [0]))
+
+        return self._changes, self._active_rule, last_version
+
+    def _save_session(self, repo=None):
 
         if self.has_valid_naming_file():
             LOGGER.info('Saving session from Naming File: {}'.format(self._naming_file))
 
             naming_data = self.get_naming_data()
-            if naming_data:
-                self.save_naming_data(naming_data)
+            if not naming_data or not self.save_naming_data(naming_data):
+                return False
+
+            # Saved data is already loaded, so reloading the session does not deserialize it again
+            self._update_session_file_state(self._naming_file)
+            for section in (self._rules_key, self._tokens_key, self._templates_key, self._template_tokens_key):
+                items = self._get_section_items(section)[0]
+                self._session_entries[section] = dict(
+                    (item_data.get('name'), (serialization.get_data_hash(item_data), item.version))
+                    for item, item_data in zip(items, naming_data.get(section) or list()))
+            return True
         else:
 
-            repo = repo or self.get_repo()
+            repo = self._get_repo_path(repo)
+            if not os.path.isdir(repo):
+                os.makedirs(repo)
 
             LOGGER.info('Saving session to directory: {}'.format(repo))
 
-            # Tokens and rules
-            for name, token in self._tokens.items():
-                file_path = os.path.join(repo, name + '.token')
-                self.save_token(name, file_path)
+            # All files are serialized first, so only the ones that changed are written
+            files = OrderedDict()
+            file_items = dict()
+            for token in self.tokens:
+                file_path = os.path.join(repo, token.name + '.token')
+                files[file_path] = token.data()
+                file_items[file_path] = token
 
-            for name, rule in self._rules.items():
-                if not isinstance(rule, Rule):
+            for rule in self.rules:
+                if not isinstance(rule, BaseRule):
                     continue
-                file_path = os.path.join(repo, name + '.rule')
-                self.save_rule(name, file_path)
+                file_path = os.path.join(repo, rule.name + '.rule')
+                files[file_path] = rule.data()
+                file_items[file_path] = rule
 
-            for name, template in self._templates.items():
-                if not isinstance(template, Template):
+            for template in self.templates:
+                if not isinstance(template, BaseTemplate):
                     continue
-                file_path = os.path.join(repo, name + '.template')
-                self.save_template(name, file_path)
+                file_path = os.path.join(repo, template.name + '.template')
+                files[file_path] = template.data()
+                file_items[file_path] = template
+
+            for template_token in self.template_tokens:
+                file_path = os.path.join(repo, template_token.name + '.template_token')
+                files[file_path] = template_token.data()
+                file_items[file_path] = template_token
 
             # Extra configuration
             active = self.active_rule()
-            config = {'set_active_rule': active.name() if active else None}
-            file_path = os.path.join(repo, 'naming.conf')
-            with open(file_path, 'w') as fp:
-                if self._parser_format == 'yaml':
-                    yaml.dump(config, fp)
-                else:
-                    json.dump(config, fp)
+            config = {'set_active_rule': active.name if active else None}
+            files[os.path.join(repo, 'naming.conf')] = config
+
+            if self._repo_writer is None:
+                from tpDcc.libs.nameit.core import repowriter
+                self._repo_writer = repowriter.RepoWriter()
+            written_files = self._repo_writer.write(files, self._get_serializer())
+            LOGGER.debug('{} of {} files written'.format(len(written_files), len(files)))
+
+            # Files of objects that were removed or renamed since they were loaded or saved are removed. Only files
+            # tracked by the session are removed, so other files stored in the repository are never touched
+            repo_prefix = os.path.join(os.path.normpath(repo), '')
+            saved_files = set(os.path.normpath(file_path) for file_path in files)
+            removed_files = list()
+            for file_path in self._session_file_items:
+                file_path_norm = os.path.normpath(file_path)
+                if file_path_norm not in saved_files and file_path_norm.startswith(repo_prefix):
+                    removed_files.append(file_path)
+            self._repo_writer.remove(removed_files)
+            for file_path in removed_files:
+                self._session_file_items.pop(file_path, None)
+                self._session_file_states.pop(file_path, None)
+
+            # Saved files are already up to date, so reloading the session does not read them again
+            for file_path in written_files:
+                self._update_session_file_state(file_path)
+            # Objects of files that were not written did not change since they were saved
+            for file_path, item in file_items.items():
+                self._session_file_items[file_path] = (item, item.version)
+
             return True
@@ -0,0 +1,175 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains classes to write naming data into directory repositories
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import stat
+import hashlib
+import logging
+import tempfile
+
+try:
+    from concurrent import futures
+except ImportError:
+    # Python 2 without futures backport, files are written in current thread
+    futures = None
+
+LOGGER = logging.getLogger('tpDcc-libs-nameit')
+
+# Umask can only be read by changing it, so it is read once when the module is imported
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def get_file_mode(file_path):
+    """
+    Returns the permissions a file written into the given path should have
+    Temporary files are only readable by their owner, so this mode is set before renaming them
+    :param file_path: str
+    :return: int, permissions of the existing file or default permissions of new files if it does not exist
+    """
+
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def write_file_atomic(file_path, content):
+    """
+    Writes given content into the given file
+    Content is written in a temporary file of the same directory that is renamed once complete, so other processes
+    never read partially written files
+    :param file_path: str
+    :param content: bytes
+    """
+
+    directory, file_name = os.path.split(file_path)
+    file_handle, temp_path = tempfile.mkstemp(prefix='.{}.'.format(file_name), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(file_handle, 'wb') as fh:
+            fh.write(content)
+        os.chmod(temp_path, get_file_mode(file_path))
+        if hasattr(os, 'replace'):
+            os.replace(temp_path, file_path)
+        else:
+            # Windows does not allow to rename over an existing file in Python 2
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+            os.rename(temp_path, file_path)
+    except Exception:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class RepoWriter(object):
+    """
+    Class that writes serialized files of a directory repository
+    All files are serialized before writing and only files whose content changed are written. Writes can be done in
+    parallel, which speeds up saving in network mounted repositories
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        :param max_workers: int or None, number of threads used to write files. If 1 or 0, files are written in
+            current thread
+        """
+
+        super(RepoWriter, self).__init__()
+
+        self._max_workers = max_workers
+        self._file_states = dict()
+
+    def write(self, files, serializer):
+        """
+        Writes the given files
+        :param files: dict(str, object), data of each file path
+        :param serializer: serialization.Serializer, serializer used to write files
+        :return: list(str), paths of the written files. Files whose content did not change are not written
+        """
+
+        pending = list()
+        for file_path, data in files.items():
+            content = serializer.dumps(data)
+            content_hash = hashlib.md5(content).hexdigest()
+            if self.get_file_hash(file_path) == content_hash:
+                continue
+            pending.append((file_path, content, content_hash))
+        if not pending:
+            return list()
+
+        if futures is None or (self._max_workers is not None and self._max_workers <= 1) or len(pending) == 1:
+            for file_path, content, content_hash in pending:
+                self._write_file(file_path, content, content_hash)
+        else:
+            executor = futures.ThreadPoolExecutor(max_workers=self._max_workers or min(16, len(pending)))
+            try:
+                for future in [executor.submit(self._write_file, *args) for args in pending]:
+                    future.result()
+            finally:
+                executor.shutdown(wait=True)
+
+        return [file_path for file_path, _, _ in pending]
+
+    def remove(self, file_paths):
+        """
+        Removes the given files
+        :param file_paths: list(str)
+        :return: list(str), paths of the removed files. Files that do not exist or cannot be removed are skipped
+        """
+
+        removed_files = list()
+        for file_path in file_paths:
+            self._file_states.pop(file_path, None)
+            if not os.path.isfile(file_path):
+                continue
+            try:
+                os.remove(file_path)
+            except OSError as exc:
+                LOGGER.warning('Impossible to remove file "{}": {}'.format(file_path, exc))
+                continue
+            removed_files.append(file_path)
+
+        return removed_files
+
+    def get_file_hash(self, file_path):
+        """
+        Returns the hash of the contents of the given file
+        Hashes are cached while the modification time and size of the files do not change
+        :param file_path: str
+        :return: str or None, None if the file does not exist
+        """
+
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            self._file_states.pop(file_path, None)
+            return None
+
+        file_state = self._file_states.get(file_path)
+        if file_state and file_state[:2] == (file_stat.st_mtime, file_stat.st_size):
+            return file_state[2]
+
+        with open(file_path, 'rb') as fh:
+            file_hash = hashlib.md5(fh.read()).hexdigest()
+        self._file_states[file_path] = (file_stat.st_mtime, file_stat.st_size, file_hash)
+
+        return file_hash
+
+    def _write_file(self, file_path, content, content_hash):
+        """
+        Internal function that writes given content into the given file and caches its hash
+        :param file_path: str
+        :param content: bytes
+        :param content_hash: str
+        """
+
+        write_file_atomic(file_path, content)
+        file_stat = os.stat(file_path)
+        self._file_states[file_path] = (file_stat.st_mtime, file_stat.st_size, content_hash)
@@ -0,0 +1,267 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to serialize naming data using the fastest backends available
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import io
+import json
+import hashlib
+import logging
+
+import yaml
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+LOGGER = logging.getLogger('tpDcc-libs-nameit')
+
+# LibYAML based loader and dumper are much faster than the pure Python ones but they are only available if PyYAML was
+# built with LibYAML support
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+    YAML_BACKEND = 'libyaml'
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+    YAML_BACKEND = 'python'
+
+# Registered serializers by format name. First serializer of each format is the one used by default
+_SERIALIZERS = dict()
+
+
+class Serializer(object):
+    """
+    Class that reads and writes data of a specific format using a specific backend
+    """
+
+    def __init__(self, format_name, backend, load, dump, binary=False):
+        """
+        :param format_name: str, name of the format (yaml, json, ...)
+        :param backend: str, name of the backend used to load and dump data
+        :param load: callable, function that receives an opened file and returns its data
+        :param dump: callable, function that receives data and an opened file and writes data into it
+        :param binary: bool, whether files are opened in binary mode or not
+        """
+
+        super(Serializer, self).__init__()
+
+        self.format_name = format_name
+        self.backend = backend
+        self._load = load
+        self._dump = dump
+        self._binary = binary
+
+    def __repr__(self):
+        return '{}({}, {})'.format(type(self).__name__, self.format_name, self.backend)
+
+    def load(self, fp):
+        """
+        Loads data from the given opened file
+        :param fp: file
+        :return: object
+        """
+
+        return self._load(fp)
+
+    def dump(self, data, fp):
+        """
+        Writes given data into the given opened file
+        :param data: object
+        :param fp: file
+        """
+
+        self._dump(data, fp)
+
+    def dumps(self, data):
+        """
+        Returns given data serialized as UTF-8 encoded bytes
+        :param data: object
+        :return: bytes
+        """
+
+        stream = io.BytesIO() if self._binary else StringIO()
+        self._dump(data, stream)
+        content = stream.getvalue()
+
+        return content if isinstance(content, bytes) else content.encode('utf-8')
+
+    def read_file(self, file_path):
+        """
+        Reads data from the given file
+        :param file_path: str
+        :return: object
+        """
+
+        with open(file_path, 'rb' if self._binary else 'r') as fp:
+            return self._load(fp)
+
+    def write_file(self, data, file_path):
+        """
+        Writes given data into the given file
+        :param data: object
+        :param file_path: str
+        """
+
+        with open(file_path, 'wb' if self._binary else 'w') as fp:
+            self._dump(data, fp)
+
+
+def register_serializer(serializer, default=True):
+    """
+    Registers a new serializer for its format
+    :param serializer: Serializer
+    :param default: bool, whether the serializer should be used by default for its format
+    """
+
+    serializers = _SERIALIZERS.setdefault(serializer.format_name, list())
+    serializers.insert(0 if default else len(serializers), serializer)
+
+
+def get_formats():
+    """
+    Returns the names of all registered formats
+    :return: list(str)
+    """
+
+    return list(_SERIALIZERS.keys())
+
+
+def get_serializers(format_name):
+    """
+    Returns all serializers registered for the given format, sorted by priority
+    :param format_name: str
+    :return: list(Serializer)
+    """
+
+    return list(_SERIALIZERS.get(format_name, list()))
+
+
+def get_serializer(format_name, backend=None, fallback_format='json'):
+    """
+    Returns the serializer used for the given format
+    :param format_name: str
+    :param backend: str or None, name of the backend to use. If None, the default serializer of the format is returned
+    :param fallback_format: str or None, format used if the given one is not registered
+    :return: Serializer or None
+    """
+
+    serializers = _SERIALIZERS.get(format_name)
+    if not serializers and fallback_format:
+        serializers = _SERIALIZERS.get(fallback_format)
+    if not serializers:
+        return None
+
+    if backend is None:
+        return serializers[0]
+    for serializer in serializers:
+        if serializer.backend == backend:
+            return serializer
+
+    return None
+
+
+def get_yaml_backend():
+    """
+    Returns the name of the backend used to load and dump YAML data
+    :return: str, 'libyaml' or 'python'
+    """
+
+    return YAML_BACKEND
+
+
+def get_json_backend():
+    """
+    Returns the name of the backend used to load and dump JSON data
+    :return: str, 'orjson', 'ujson' or 'json'
+    """
+
+    return get_serializer('json').backend
+
+
+def load_yaml(stream):
+    """
+    Loads YAML data from the given stream
+    :param stream: str or file, YAML string or opened file
+    :return: object
+    """
+
+    return yaml.load(stream, Loader=YamlLoader)
+
+
+def dump_yaml(data, stream=None, **kwargs):
+    """
+    Dumps given data as YAML
+    :param data: object
+    :param stream: file or None, opened file where data is written. If None, YAML string is returned
+    :param kwargs: dict, extra arguments passed to yaml.dump
+    :return: str or None
+    """
+
+    kwargs.setdefault('default_flow_style', False)
+
+    return yaml.dump(data, stream, Dumper=YamlDumper, **kwargs)
+
+
+def get_data_hash(data):
+    """
+    Returns a hash of the given data
+    Hash does not depend on the order of dictionary keys, so data loaded from files with different backends can be
+    compared
+    :param data: object
+    :return: str
+    """
+
+    content = None
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            content = None
+    if content is None:
+        try:
+            content = json.dumps(data, sort_keys=True, separators=(',', ':'), default=repr).encode('utf-8')
+        except TypeError:
+            # Dictionaries with keys of different types cannot be sorted
+            content = repr(data).encode('utf-8')
+
+    return hashlib.md5(content).hexdigest()
+
+
+def _dump_json(data, fp):
+    json.dump(data, fp, indent=2)
+
+
+def _load_orjson(fp):
+    return orjson.loads(fp.read())
+
+
+def _dump_orjson(data, fp):
+    fp.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _dump_ujson(data, fp):
+    ujson.dump(data, fp, indent=2, escape_forward_slashes=False)
+
+
+# Serializers are registered from slowest to fastest, so the fastest available one is used by default
+register_serializer(Serializer('yaml', YAML_BACKEND, load_yaml, dump_yaml))
+register_serializer(Serializer('json', 'json', json.load, _dump_json))
+if ujson is not None:
+    register_serializer(Serializer('json', 'ujson', ujson.load, _dump_ujson))
+if orjson is not None:
+    register_serializer(Serializer('json', 'orjson', _load_orjson, _dump_orjson, binary=True))
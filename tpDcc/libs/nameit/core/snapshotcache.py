@@ -0,0 +1,199 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to cache parsed naming files in binary snapshots stored next to them
+Snapshots only store plain data (dicts, lists, strings, numbers, ...) and they are loaded with an unpickler that
+rejects any class or function reference, so a tampered snapshot file cannot execute code
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import hashlib
+import logging
+import tempfile
+
+import pickle
+try:
+    import cPickle
+except ImportError:
+    cPickle = None
+
+from tpDcc.libs.nameit.core import repowriter
+
+LOGGER = logging.getLogger('tpDcc-libs-nameit')
+
+# Increase this value when the stored data changes, so old snapshots are discarded
+SNAPSHOT_VERSION = 1
+
+# Protocol 2 is used so snapshots can be shared between Python 2 and Python 3 DCCs
+PICKLE_PROTOCOL = 2
+
+
+class DataUnpickler(pickle.Unpickler):
+    """
+    Unpickler that only loads plain data. Any global (class, function, ...) referenced by the pickled data is rejected
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError('Global "{}.{}" is not allowed in snapshot files'.format(module, name))
+
+
+def load_data(fh):
+    """
+    Loads the plain data pickled in the given file object
+    :param fh: file, file object opened in binary mode
+    :return: object
+    """
+
+    if cPickle is not None:
+        # Python 2 cPickle unpicklers cannot be subclassed, but they reject all globals if find_global is None
+        unpickler = cPickle.Unpickler(fh)
+        unpickler.find_global = None
+        return unpickler.load()
+
+    return DataUnpickler(fh).load()
+
+
+def get_snapshot_path(file_path):
+    """
+    Returns the path of the snapshot file of the given file
+    :param file_path: str
+    :return: str
+    """
+
+    directory, file_name = os.path.split(file_path)
+
+    return os.path.join(directory, '.{}.cache'.format(file_name))
+
+
+def get_file_hash(file_path):
+    """
+    Returns the hash of the contents of the given file
+    :param file_path: str
+    :return: str
+    """
+
+    file_hash = hashlib.md5()
+    with open(file_path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(65536), b''):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def read_file(file_path, reader, key=None):
+    """
+    Returns the data of the given file
+    If the file did not change since its snapshot was stored, data is loaded from the snapshot. Otherwise, the file is
+    read with the given reader and a new snapshot is stored
+    :param file_path: str
+    :param reader: callable, function that receives a file path and returns its parsed data
+    :param key: str or None, extra value used to validate snapshots (for example, the format used to parse the file)
+    :return: object
+    """
+
+    file_hash = get_file_hash(file_path)
+    data = read_snapshot(file_path, file_hash, key=key)
+    if data is not None:
+        return data
+
+    data = reader(file_path)
+    if data:
+        write_snapshot(file_path, data, file_hash=file_hash, key=key)
+
+    return data
+
+
+def read_snapshot(file_path, file_hash=None, key=None):
+    """
+    Returns the data stored in the snapshot of the given file
+    :param file_path: str
+    :param file_hash: str or None, hash of the file contents. If not given, it is computed
+    :param key: str or None
+    :return: object or None, None if the snapshot does not exist or it is not valid for current file contents
+    """
+
+    snapshot_path = get_snapshot_path(file_path)
+    if not os.path.isfile(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, 'rb') as fh:
+            snapshot = load_data(fh)
+    except Exception as exc:
+        LOGGER.debug('Impossible to read snapshot file "{}": {}'.format(snapshot_path, exc))
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION or snapshot.get('key') != key:
+        return None
+    if snapshot.get('hash') != (file_hash or get_file_hash(file_path)):
+        return None
+
+    return snapshot.get('data')
+
+
+def write_snapshot(file_path, data, file_hash=None, key=None):
+    """
+    Stores a snapshot of the given data for the given file
+    Snapshot is written in a temporary file that is renamed once complete, so other processes never read partial
+    snapshots. Errors are only logged, because snapshots are only used to speed up file loading
+    :param file_path: str
+    :param data: object
+    :param file_hash: str or None, hash of the file contents. If not given, it is computed
+    :param key: str or None
+    :return: bool
+    """
+
+    snapshot_path = get_snapshot_path(file_path)
+    temp_path = None
+    try:
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'key': key,
+            'hash': file_hash or get_file_hash(file_path),
+            'data': data
+        }
+        file_handle, temp_path = tempfile.mkstemp(
+            prefix=os.path.basename(snapshot_path), dir=os.path.dirname(snapshot_path))
+        with os.fdopen(file_handle, 'wb') as fh:
+            (cPickle or pickle).dump(snapshot, fh, PICKLE_PROTOCOL)
+        os.chmod(temp_path, repowriter.get_file_mode(snapshot_path))
+        if hasattr(os, 'replace'):
+            os.replace(temp_path, snapshot_path)
+        else:
+            # Windows does not allow to rename over an existing file in Python 2
+            if os.path.isfile(snapshot_path):
+                os.remove(snapshot_path)
+            os.rename(temp_path, snapshot_path)
+    except Exception as exc:
+        LOGGER.debug('Impossible to write snapshot file "{}": {}'.format(snapshot_path, exc))
+        if temp_path and os.path.isfile(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return False
+
+    return True
+
+
+def remove_snapshot(file_path):
+    """
+    Removes the snapshot of the given file if it exists
+    :param file_path: str
+    :return: bool
+    """
+
+    snapshot_path = get_snapshot_path(file_path)
+    if not os.path.isfile(snapshot_path):
+        return False
+
+    try:
+        os.remove(snapshot_path)
+    except OSError as exc:
+        LOGGER.debug('Impossible to remove snapshot file "{}": {}'.format(snapshot_path, exc))
+        return False
+
+    return True
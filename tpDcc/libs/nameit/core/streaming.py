@@ -0,0 +1,275 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to read naming files incrementally
+Items of the naming data sections are parsed one at a time, so the complete naming data never needs to be in memory
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import io
+import json
+import logging
+
+import yaml
+from yaml import constructor, resolver
+
+from tpDcc.libs.nameit.core import serialization
+
+LOGGER = logging.getLogger('tpDcc-libs-nameit')
+
+# Number of characters read from JSON files at once
+CHUNK_SIZE = 65536
+
+
+def iter_naming_data(file_path, format_name, sections):
+    """
+    Reads given naming file incrementally
+    Values of the given sections are expected to be lists and their items are returned one by one. The complete value
+    of any other key is returned at once
+    :param file_path: str
+    :param format_name: str, 'yaml' or 'json'. Other formats are read as JSON
+    :param sections: list(str), keys whose items should be returned one by one
+    :return: generator(tuple(str, object)), key and item (or complete value) of the naming data
+    """
+
+    if format_name == 'yaml':
+        return _iter_yaml(file_path, sections)
+
+    return _iter_json(file_path, sections)
+
+
+def _iter_yaml(file_path, sections):
+    """
+    Internal generator that reads a YAML naming file incrementally
+    YAML parser events are composed into nodes one item at a time
+    :param file_path: str
+    :param sections: list(str)
+    :return: generator(tuple(str, object))
+    """
+
+    with open(file_path, 'r') as fp:
+        events = yaml.parse(fp, Loader=serialization.YamlLoader)
+        composer = _YamlItemComposer(events)
+        event = composer.next_event()
+        while not isinstance(event, (yaml.MappingStartEvent, yaml.StreamEndEvent)):
+            event = composer.next_event()
+        if isinstance(event, yaml.StreamEndEvent):
+            return
+
+        while True:
+            event = composer.next_event()
+            if isinstance(event, yaml.MappingEndEvent):
+                return
+            key = composer.construct(composer.compose(event))
+            event = composer.next_event()
+            if key in sections and isinstance(event, yaml.SequenceStartEvent):
+                event = composer.next_event()
+                while not isinstance(event, yaml.SequenceEndEvent):
+                    yield key, composer.construct(composer.compose(event))
+                    event = composer.next_event()
+            else:
+                yield key, composer.construct(composer.compose(event))
+
+
+class _YamlItemComposer(object):
+    """
+    Internal class that composes and constructs YAML nodes from parser events
+    Used instead of yaml.Loader composer because LibYAML based loaders do not allow composing partial documents
+    """
+
+    def __init__(self, events):
+        super(_YamlItemComposer, self).__init__()
+
+        self._events = iter(events)
+        self._resolver = resolver.Resolver()
+        self._constructor = constructor.SafeConstructor()
+        self._anchors = dict()
+
+    def next_event(self):
+        """
+        Returns next parser event
+        :return: yaml.Event
+        """
+
+        return next(self._events)
+
+    def compose(self, event):
+        """
+        Composes the node that starts with the given event, consuming all its events
+        :param event: yaml.Event
+        :return: yaml.Node
+        """
+
+        if isinstance(event, yaml.AliasEvent):
+            if event.anchor not in self._anchors:
+                raise yaml.composer.ComposerError(
+                    None, None, 'found undefined alias {}'.format(event.anchor), event.start_mark)
+            return self._anchors[event.anchor]
+
+        if isinstance(event, yaml.ScalarEvent):
+            tag = event.tag
+            if tag is None or tag == '!':
+                tag = self._resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+            node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+        elif isinstance(event, yaml.SequenceStartEvent):
+            tag = event.tag
+            if tag is None or tag == '!':
+                tag = self._resolver.resolve(yaml.SequenceNode, None, event.implicit)
+            node = yaml.SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+            child_event = self.next_event()
+            while not isinstance(child_event, yaml.SequenceEndEvent):
+                node.value.append(self.compose(child_event))
+                child_event = self.next_event()
+            node.end_mark = child_event.end_mark
+        elif isinstance(event, yaml.MappingStartEvent):
+            tag = event.tag
+            if tag is None or tag == '!':
+                tag = self._resolver.resolve(yaml.MappingNode, None, event.implicit)
+            node = yaml.MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+            child_event = self.next_event()
+            while not isinstance(child_event, yaml.MappingEndEvent):
+                key_node = self.compose(child_event)
+                node.value.append((key_node, self.compose(self.next_event())))
+                child_event = self.next_event()
+            node.end_mark = child_event.end_mark
+        else:
+            raise yaml.composer.ComposerError(
+                None, None, 'unexpected event {}'.format(type(event).__name__), event.start_mark)
+
+        if event.anchor is not None:
+            self._anchors[event.anchor] = node
+
+        return node
+
+    def construct(self, node):
+        """
+        Constructs the Python object of the given node
+        :param node: yaml.Node
+        :return: object
+        """
+
+        return self._constructor.construct_document(node)
+
+
+def _iter_json(file_path, sections):
+    """
+    Internal generator that reads a JSON naming file incrementally
+    File is read in chunks and each value is decoded as soon as it is complete
+    :param file_path: str
+    :param sections: list(str)
+    :return: generator(tuple(str, object))
+    """
+
+    with io.open(file_path, 'r', encoding='utf-8') as fp:
+        reader = _JsonChunkReader(fp)
+        if reader.next_char() != '{':
+            raise ValueError('Naming file "{}" does not contain a JSON object'.format(file_path))
+        if reader.peek_char() == '}':
+            return
+
+        while True:
+            key = reader.decode_value()
+            if reader.next_char() != ':':
+                raise ValueError('Invalid JSON naming file "{}"'.format(file_path))
+            if key in sections and reader.peek_char() == '[':
+                reader.next_char()
+                if reader.peek_char() == ']':
+                    reader.next_char()
+                else:
+                    while True:
+                        yield key, reader.decode_value()
+                        separator = reader.next_char()
+                        if separator == ']':
+                            break
+                        elif separator != ',':
+                            raise ValueError('Invalid JSON naming file "{}"'.format(file_path))
+            else:
+                yield key, reader.decode_value()
+
+            separator = reader.next_char()
+            if separator == '}':
+                return
+            elif separator != ',':
+                raise ValueError('Invalid JSON naming file "{}"'.format(file_path))
+
+
+class _JsonChunkReader(object):
+    """
+    Internal class that decodes JSON values from a file read in chunks
+    Only the characters of the value being decoded are kept in memory
+    """
+
+    def __init__(self, fp):
+        super(_JsonChunkReader, self).__init__()
+
+        self._fp = fp
+        self._decoder = json.JSONDecoder()
+        self._buffer = u''
+        self._index = 0
+        self._eof = False
+
+    def peek_char(self):
+        """
+        Returns next non whitespace character without consuming it
+        :return: str
+        """
+
+        while True:
+            while self._index < len(self._buffer) and self._buffer[self._index].isspace():
+                self._index += 1
+            if self._index < len(self._buffer):
+                return self._buffer[self._index]
+            if not self._read_chunk():
+                raise ValueError('Unexpected end of JSON data')
+
+    def next_char(self):
+        """
+        Returns and consumes next non whitespace character
+        :return: str
+        """
+
+        char = self.peek_char()
+        self._index += 1
+
+        return char
+
+    def decode_value(self):
+        """
+        Decodes and consumes next JSON value
+        :return: object
+        """
+
+        self.peek_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._index)
+            except ValueError:
+                # Value is not complete yet, read more data
+                if not self._read_chunk():
+                    raise
+                continue
+            # Numbers could continue in next chunk
+            if end == len(self._buffer) and not self._eof and self._read_chunk():
+                continue
+            self._index = end
+            return value
+
+    def _read_chunk(self):
+        """
+        Internal function that appends next chunk of the file to the buffer, discarding already consumed data
+        :return: bool, False if the end of the file was reached
+        """
+
+        if self._eof:
+            return False
+
+        chunk = self._fp.read(CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._index:] + chunk
+        self._index = 0
+
+        return True
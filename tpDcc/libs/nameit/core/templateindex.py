@@ -0,0 +1,290 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains classes to classify paths against many templates at once
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import re
+import sys
+import logging
+
+from tpDcc.libs.nameit.externals import lucidity
+
+LOGGER = logging.getLogger('tpDcc-libs-nameit')
+
+
+class TemplateIndex(object):
+    """
+    Class that classifies paths against a list of lucidity templates in a single pass
+    Templates are stored in a trie by the literal prefix of their expanded pattern. Each trie node that ends a prefix
+    stores the templates that can match paths starting with that prefix, and those are combined into a single
+    alternation regular expression that keeps templates order. So, as lucidity.parse, first matching template wins
+    """
+
+    # Old versions of re module do not support more than 100 groups per expression
+    MAX_GROUPS = 99 if sys.version_info[0] == 2 else None
+
+    _GROUP_REGEX = re.compile(r'\(\?P([<=])')
+
+    def __init__(self, templates):
+        """
+        :param templates: list(lucidity.Template), templates in the order they should be tried
+        """
+
+        super(TemplateIndex, self).__init__()
+
+        self._templates = list(templates)
+        self._expressions = dict()
+        self._prefixes = dict()
+        self._trie = dict()
+        self._buckets = list()
+
+        self._build()
+
+    @property
+    def templates(self):
+        """
+        Returns templates of the index
+        :return: list(lucidity.Template)
+        """
+
+        return self._templates
+
+    def match(self, path):
+        """
+        Returns the index of the first template that matches given path and the data parsed from it
+        :param path: str
+        :return: tuple(int, dict) or None
+        """
+
+        node = self._trie
+        bucket = node.get(None)
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            bucket = node.get(None, bucket)
+        if bucket is None:
+            return None
+
+        for regex, indices, names in self._get_bucket_chunks(bucket):
+            if regex is None:
+                for i in indices:
+                    data = self._parse(i, path)
+                    if data is not None:
+                        return i, data
+                continue
+
+            match = regex.match(path)
+            if not match:
+                continue
+
+            i = names[match.lastgroup]
+            groups = dict((original_name, match.group(name)) for name, original_name in self._expressions[i][1])
+            try:
+                return i, self._templates[i].extract_data(groups)
+            except lucidity.ParseError:
+                # Strict duplicate placeholders did not match, try with the remaining templates
+                for j in indices[indices.index(i) + 1:]:
+                    data = self._parse(j, path)
+                    if data is not None:
+                        return j, data
+
+        return None
+
+    def classify(self, path):
+        """
+        Returns the first template that matches given path and the data parsed from it
+        :param path: str
+        :return: tuple(lucidity.Template, dict) or None
+        """
+
+        result = self.match(path)
+        if result is None:
+            return None
+
+        return self._templates[result[0]], result[1]
+
+    def could_match(self, directory):
+        """
+        Returns whether paths inside given directory could be matched by any of the templates
+        Literal prefixes of the templates are checked first and then templates with a compatible prefix are partially
+        matched against the directory, so a True result does not ensure a match
+        :param directory: str
+        :return: bool
+        """
+
+        directory = directory.rstrip('/') + '/'
+        node = self._trie
+        bucket = node.get(None)
+        for char in directory:
+            node = node.get(char)
+            if node is None:
+                break
+            bucket = node.get(None, bucket)
+
+        candidates = set(self._buckets[bucket][0]) if bucket is not None else set()
+        if node is not None:
+            # Templates whose literal prefix continues after the directory
+            candidates.update(i for i, prefix in self._prefixes.items() if prefix.startswith(directory))
+
+        for i in sorted(candidates):
+            try:
+                if self._templates[i].partial_match(directory):
+                    return True
+            except Exception:
+                return True
+
+        return False
+
+    def snapshot(self):
+        """
+        Returns a picklable snapshot of the index templates
+        Template references are already expanded in the snapshot, so it can be used to create the same index in a
+        different process without the resolvers of the original templates
+        :return: list(tuple)
+        """
+
+        snapshot = list()
+        for template in self._templates:
+            try:
+                pattern = template.expanded_pattern()
+            except Exception:
+                # Template was not indexed, it will not match any path
+                pattern = None
+            snapshot.append((
+                template.name, pattern, template.anchor, template.default_placeholder_expression,
+                template.duplicate_placeholder_mode))
+
+        return snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Creates a new index from a snapshot created with TemplateIndex.snapshot
+        :param snapshot: list(tuple)
+        :return: TemplateIndex
+        """
+
+        templates = list()
+        for name, pattern, anchor, default_placeholder_expression, duplicate_placeholder_mode in snapshot:
+            if pattern is None:
+                # Keep an always failing template, so indices of the index match the original ones
+                pattern = '{_:(?!)}'
+            templates.append(lucidity.Template(
+                name, pattern, anchor=anchor, default_placeholder_expression=default_placeholder_expression,
+                duplicate_placeholder_mode=duplicate_placeholder_mode))
+
+        return cls(templates)
+
+    def _build(self):
+        """
+        Internal function that builds the expressions and the prefix trie of the templates
+        """
+
+        prefixes = dict()
+        for i, template in enumerate(self._templates):
+            try:
+                expanded_pattern = template.expanded_pattern()
+                expression = template.regular_expression().pattern
+                group_names = list(template.regular_expression().groupindex.keys())
+            except Exception as exc:
+                LOGGER.warning('Template "{}" cannot be indexed: {}'.format(template.name, exc))
+                continue
+
+            # Group names are prefixed so the expressions of all templates can live in the same expression
+            expression = self._GROUP_REGEX.sub(lambda m: '(?P{}T{}_'.format(m.group(1), i), expression)
+            group_names = [('T{}_{}'.format(i, name), name) for name in group_names]
+
+            anchor = template.anchor
+            if anchor is not None and anchor & template.ANCHOR_START:
+                expression = expression[1:]
+                prefix = expanded_pattern.split('{', 1)[0]
+            else:
+                # Not anchored templates can match anywhere in the path
+                expression = r'[\s\S]*?{}'.format(expression)
+                prefix = ''
+
+            self._expressions[i] = (expression, group_names)
+            self._prefixes[i] = prefix
+            prefixes.setdefault(prefix, list()).append(i)
+
+        for prefix, indices in prefixes.items():
+            node = self._trie
+            for char in prefix:
+                node = node.setdefault(char, dict())
+            node[None] = indices
+
+        # Each bucket contains the templates of its node and the templates of its parent nodes
+        nodes = [(self._trie, list())]
+        while nodes:
+            node, parent_indices = nodes.pop()
+            indices = parent_indices
+            if None in node:
+                indices = sorted(parent_indices + node[None])
+                node[None] = len(self._buckets)
+                self._buckets.append([indices, None])
+            for char, child in node.items():
+                if char is not None:
+                    nodes.append((child, indices))
+
+    def _get_bucket_chunks(self, bucket):
+        """
+        Internal function that returns the compiled expressions of the given bucket
+        Expressions are compiled the first time a bucket is used
+        :param bucket: int
+        :return: list(tuple(re.Pattern or None, list(int), dict(str, int)))
+        """
+
+        indices, chunks = self._buckets[bucket]
+        if chunks is not None:
+            return chunks
+
+        chunks = list()
+        chunk_indices = list()
+        chunk_groups = 0
+        for i in indices:
+            groups = len(self._expressions[i][1]) + 1
+            if chunk_indices and self.MAX_GROUPS and chunk_groups + groups > self.MAX_GROUPS:
+                chunks.append(self._compile_chunk(chunk_indices))
+                chunk_indices = list()
+                chunk_groups = 0
+            chunk_indices.append(i)
+            chunk_groups += groups
+        if chunk_indices:
+            chunks.append(self._compile_chunk(chunk_indices))
+
+        self._buckets[bucket][1] = chunks
+
+        return chunks
+
+    def _compile_chunk(self, indices):
+        """
+        Internal function that compiles the expressions of the given templates into a single expression
+        :param indices: list(int)
+        :return: tuple(re.Pattern or None, list(int), dict(str, int))
+        """
+
+        names = dict(('M{}'.format(i), i) for i in indices)
+        expression = '|'.join('(?P<M{}>{})'.format(i, self._expressions[i][0]) for i in indices)
+        try:
+            regex = re.compile('(?:{})'.format(expression))
+        except re.error as exc:
+            # Templates will be tried one by one
+            LOGGER.debug('Impossible to combine templates expressions: {}'.format(exc))
+            regex = None
+
+        return regex, indices, names
+
+    def _parse(self, i, path):
+        """
+        Internal function that parses given path with the template with the given index
+        :param i: int
+        :param path: str
+        :return: dict or None
+        """
+
+        return self._templates[i].try_parse(path)
@@ -22,11 +22,23 @@ class Template(object):
     _STRIP_EXPRESSION_REGEX = re.compile(r'{(.+?)(:(\\}|.)+?)}')
     _PLAIN_PLACEHOLDER_REGEX = re.compile(r'{(.+?)}')
     _TEMPLATE_REFERENCE_REGEX = re.compile(r'{@(?P<reference>.+?)}')
+    _PATTERN_COMPONENT_REGEX = re.compile(
+        r'(?P<placeholder>{(.+?)(:(?P<expression>(\\}|.)+?))?})|(?P<other>.+?)'
+    )
+
+    # Sample values used to detect placeholder expressions able to match a
+    # path separator.
+    _SEPARATOR_SAMPLES = ('/', 'a/b', '_/_', '0/0', 'A/A', './.', '-/-')
 
     ANCHOR_START, ANCHOR_END, ANCHOR_BOTH = (1, 2, 3)
 
     RELAXED, STRICT = (1, 2)
 
+    # Maximum number of expanded patterns kept in the per-template caches.
+    # Each template usually only sees a handful of expansions (one per
+    # resolver state) so this just guards against unbounded growth.
+    CACHE_SIZE = 32
+
     def __init__(self, name, pattern, anchor=ANCHOR_START,
                  default_placeholder_expression='[\w_.\-]+',
                  duplicate_placeholder_mode=RELAXED,
@@ -55,6 +67,13 @@ class Template(object):
         '''
         super(Template, self).__init__()
         self.duplicate_placeholder_mode = duplicate_placeholder_mode
+
+        self._regex_cache = {}
+        self._format_specification_cache = {}
+        self._partial_cache = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._template_resolver = None
         self.template_resolver = template_resolver
 
         self._default_placeholder_expression = default_placeholder_expression
@@ -64,8 +83,12 @@ class Template(object):
         self._pattern = pattern
         self._anchor = anchor
 
-        # Check that supplied pattern is valid and able to be compiled.
-        self._construct_regular_expression(self.pattern)
+        # Check that supplied pattern is valid and able to be compiled. When
+        # the pattern has no references the compiled expression is the same
+        # one parse will need, so keep it.
+        compiled = self._construct_regular_expression(self.pattern)
+        if not self._TEMPLATE_REFERENCE_REGEX.search(self.pattern):
+            self._regex_cache[self.pattern] = compiled
 
     def __repr__(self):
         '''Return unambiguous representation of template.'''
@@ -83,6 +106,50 @@ class Template(object):
         '''Return template pattern.'''
         return self._pattern
 
+    @property
+    def anchor(self):
+        '''Return anchor used when parsing paths.'''
+        return self._anchor
+
+    @property
+    def default_placeholder_expression(self):
+        '''Return expression used by placeholders without an expression.'''
+        return self._default_placeholder_expression
+
+    @property
+    def template_resolver(self):
+        '''Return template resolver used to expand references.'''
+        return self._template_resolver
+
+    @template_resolver.setter
+    def template_resolver(self, template_resolver):
+        '''Set *template_resolver* and clear caches if it changed.'''
+        if template_resolver is not self._template_resolver:
+            self.clear_cache()
+        self._template_resolver = template_resolver
+
+    @property
+    def cache_hits(self):
+        '''Return number of compiled regex/format specification cache hits.'''
+        return self._cache_hits
+
+    @property
+    def cache_misses(self):
+        '''Return number of compiled regex/format specification cache misses.'''
+        return self._cache_misses
+
+    def clear_cache(self):
+        '''Clear compiled regular expression and format specification caches.
+
+        Caches are keyed on the expanded pattern so changes to referenced
+        templates are picked up automatically. Call this to release memory or
+        after mutating template internals directly.
+
+        '''
+        self._regex_cache.clear()
+        self._format_specification_cache.clear()
+        self._partial_cache.clear()
+
     def expanded_pattern(self):
         '''Return pattern with all referenced templates expanded recursively.
 
@@ -90,6 +157,9 @@ class Template(object):
         that cannot be resolved by currently set template_resolver.
 
         '''
+        if '{@' not in self.pattern:
+            return self.pattern
+
         return self._TEMPLATE_REFERENCE_REGEX.sub(
             self._expand_reference, self.pattern
         )
@@ -121,47 +191,140 @@ class Template(object):
 
         '''
         # Construct regular expression for expanded pattern.
-        regex = self._construct_regular_expression(self.expanded_pattern())
+        regex = self.regular_expression()
 
         # Parse.
-        parsed = {}
-
         match = regex.search(path)
         if match:
-            data = {}
-            for key, value in sorted(match.groupdict().items()):
-                # Strip number that was added to make group name unique.
-                key = key[:-3]
-
-                # If strict mode enabled for duplicate placeholders, ensure that
-                # all duplicate placeholders extract the same value.
-                if self.duplicate_placeholder_mode == self.STRICT:
-                    if key in parsed:
-                        if parsed[key] != value:
-                            raise error.ParseError(
-                                'Different extracted values for placeholder '
-                                '{0!r} detected. Values were {1!r} and {2!r}.'
-                                .format(key, parsed[key], value)
-                            )
-                    else:
-                        parsed[key] = value
-
-                # Expand dot notation keys into nested dictionaries.
-                target = data
-
-                parts = key.split(self._period_code)
-                for part in parts[:-1]:
-                    target = target.setdefault(part, {})
-
-                target[parts[-1]] = value
-
-            return data
+            return self.extract_data(match.groupdict())
 
         else:
             raise error.ParseError(
                 'Path {0!r} did not match template pattern.'.format(path)
             )
 
+    def try_parse(self, path):
+        '''Return dictionary of data extracted from *path* or None.
+
+        Same as :meth:`parse` but return ``None`` instead of raising
+        :py:class:`~lucidity.error.ParseError` if *path* is not parsable by
+        this template, which is cheaper when most paths do not match.
+
+        '''
+        match = self.regular_expression().search(path)
+        if not match:
+            return None
+
+        try:
+            return self.extract_data(match.groupdict())
+        except error.ParseError:
+            return None
+
+    def match(self, path):
+        '''Return whether *path* is parsable by this template.'''
+        if self.duplicate_placeholder_mode == self.STRICT:
+            return self.try_parse(path) is not None
+
+        return self.regular_expression().search(path) is not None
+
+    def partial_match(self, path):
+        '''Return whether paths under directory *path* could match this template.
+
+        *path* is compared separator by separator against the expanded
+        pattern, so crawlers can skip entire subtrees that can not lead to a
+        match. A return value of True does not ensure that any path under
+        *path* will match.
+
+        Return True whenever it can not be determined, which happens for
+        templates not anchored at the start and for templates with placeholder
+        expressions able to match a path separator.
+
+        '''
+        if self._anchor is None or not self._anchor & self.ANCHOR_START:
+            return True
+
+        pattern = self.expanded_pattern()
+        partial = self._partial_cache.get(pattern)
+        if partial is None:
+            if len(self._partial_cache) >= self.CACHE_SIZE:
+                self._partial_cache.clear()
+            partial = (self._construct_pattern_segments(pattern), {})
+            self._partial_cache[pattern] = partial
+
+        segments, regexes = partial
+        if segments is None:
+            return True
+
+        path = path.rstrip('/')
+        path_segments = path.split('/')
+        depth = len(path_segments)
+        if depth < len(segments):
+            # Directory must match the first segments of the pattern.
+            regex = regexes.get(depth)
+            if regex is None:
+                regex = self._construct_regular_expression(
+                    '/'.join(segments[:depth]), full_match=True
+                )
+                regexes[depth] = regex
+
+            return regex.match(path) is not None
+
+        # Any path under directory has more segments than the pattern.
+        if self._anchor & self.ANCHOR_END:
+            return False
+
+        return self.regular_expression().match(path + '/') is not None
+
+    def regular_expression(self):
+        '''Return compiled regular expression for the expanded pattern.
+
+        Raise :exc:`lucidity.error.ResolveError` if pattern contains a reference
+        that cannot be resolved by currently set template_resolver.
+
+        '''
+        return self._get_regular_expression(self.expanded_pattern())
+
+    def extract_data(self, groups):
+        '''Return dictionary of data from regular expression *groups*.
+
+        *groups* should be a mapping of group name to matched value as
+        returned by ``match.groupdict()`` for a match of
+        :meth:`regular_expression`.
+
+        Raise :py:class:`~lucidity.error.ParseError` if strict mode is
+        enabled and duplicate placeholders extracted different values.
+
+        '''
+        parsed = {}
+        data = {}
+        for key, value in sorted(groups.items()):
+            # Strip number that was added to make group name unique.
+            key = key[:-3]
+
+            # If strict mode enabled for duplicate placeholders, ensure that
+            # all duplicate placeholders extract the same value.
+            if self.duplicate_placeholder_mode == self.STRICT:
+                if key in parsed:
+                    if parsed[key] != value:
+                        raise error.ParseError(
+                            'Different extracted values for placeholder '
+                            '{0!r} detected. Values were {1!r} and {2!r}.'
+                            .format(key, parsed[key], value)
+                        )
+                else:
+                    parsed[key] = value
+
+            # Expand dot notation keys into nested dictionaries.
+            target = data
+
+            parts = key.split(self._period_code)
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+
+            target[parts[-1]] = value
+
+        return data
+
     def format(self, data):
         '''Return a path formatted by applying *data* to this template.
 
@@ -170,7 +333,7 @@ class Template(object):
 
         '''
 
-        format_specification = self._construct_format_specification(
+        format_specification = self._get_format_specification(
             self.expanded_pattern()
         )
 
@@ -200,24 +363,92 @@ class Template(object):
 
     def keys(self):
         '''Return unique set of placeholders in pattern.'''
-        format_specification = self._construct_format_specification(
+        format_specification = self._get_format_specification(
             self.expanded_pattern()
         )
         return set(self._PLAIN_PLACEHOLDER_REGEX.findall(format_specification))
 
     def references(self):
         '''Return unique set of referenced templates in pattern.'''
-        format_specification = self._construct_format_specification(
+        format_specification = self._get_format_specification(
             self.pattern
         )
         return set(self._TEMPLATE_REFERENCE_REGEX.findall(format_specification))
 
+    def _get_regular_expression(self, pattern):
+        '''Return cached compiled regular expression for *pattern*.'''
+        regex = self._regex_cache.get(pattern)
+        if regex is not None:
+            self._cache_hits += 1
+            return regex
+
+        self._cache_misses += 1
+        regex = self._construct_regular_expression(pattern)
+        if len(self._regex_cache) >= self.CACHE_SIZE:
+            self._regex_cache.clear()
+        self._regex_cache[pattern] = regex
+
+        return regex
+
+    def _get_format_specification(self, pattern):
+        '''Return cached format specification for *pattern*.'''
+        format_specification = self._format_specification_cache.get(pattern)
+        if format_specification is not None:
+            self._cache_hits += 1
+            return format_specification
+
+        self._cache_misses += 1
+        format_specification = self._construct_format_specification(pattern)
+        if len(self._format_specification_cache) >= self.CACHE_SIZE:
+            self._format_specification_cache.clear()
+        self._format_specification_cache[pattern] = format_specification
+
+        return format_specification
+
+    def _construct_pattern_segments(self, pattern):
+        '''Return *pattern* split by path separators outside placeholders.
+
+        Return None if any placeholder expression could match a path
+        separator, as pattern segments can not be matched independently then.
+
+        '''
+        segments = ['']
+        for match in self._PATTERN_COMPONENT_REGEX.finditer(pattern):
+            if match.group('placeholder') is None:
+                if match.group('other') == '/':
+                    segments.append('')
+                else:
+                    segments[-1] += match.group('other')
+                continue
+
+            expression = match.group('expression')
+            if expression is None:
+                expression = self._default_placeholder_expression
+            expression = expression.replace('\\{', '{').replace('\\}', '}')
+            if '/' in expression and '^/' not in expression:
+                return None
+            try:
+                regex = re.compile('^(?:{0})$'.format(expression))
+            except re.error:
+                return None
+            if any(regex.match(sample) for sample in self._SEPARATOR_SAMPLES):
+                return None
+
+            segments[-1] += match.group('placeholder')
+
+        return segments
+
     def _construct_format_specification(self, pattern):
         '''Return format specification from *pattern*.'''
         return self._STRIP_EXPRESSION_REGEX.sub('{\g<1>}', pattern)
 
-    def _construct_regular_expression(self, pattern):
-        '''Return a regular expression to represent *pattern*.'''
+    def _construct_regular_expression(self, pattern, full_match=False):
+        '''Return a regular expression to represent *pattern*.
+
+        If *full_match* is True the expression is anchored at both start and
+        end regardless of the template anchor.
+
+        '''
         # Escape non-placeholder components.
         expression = re.sub(
             r'(?P<placeholder>{(.+?)(:(\\}|.)+?)?})|(?P<other>.+?)',
@@ -234,11 +465,12 @@ class Template(object):
             expression
         )
 
-        if self._anchor is not None:
-            if bool(self._anchor & self.ANCHOR_START):
+        anchor = self.ANCHOR_BOTH if full_match else self._anchor
+        if anchor is not None:
+            if bool(anchor & self.ANCHOR_START):
                 expression = '^{0}'.format(expression)
 
-            if bool(self._anchor & self.ANCHOR_END):
+            if bool(anchor & self.ANCHOR_END):
                 expression = '{0}$'.format(expression)
 
         # Compile expression.